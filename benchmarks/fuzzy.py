@@ -0,0 +1,92 @@
+"""
+Compare brute-force fuzzy snake name matching against `bot.utils.fuzzy.FuzzyIndex`.
+
+Run from the repository root with `python -m benchmarks.fuzzy`.
+"""
+import json
+import random
+import string
+import time
+import typing as t
+
+from bot.exts.evergreen.snakes._converter import THRESHOLD, score
+from bot.exts.evergreen.snakes._utils import SNAKE_RESOURCES
+from bot.utils.fuzzy import FuzzyIndex
+
+QUERIES = 500
+
+
+def legacy(name: str, names: t.Iterable[str]) -> t.Set[str]:
+    """The old `Snake.convert` matching loop, minus the early return on an exact match."""
+    return {item for item in names if score(name, item.lower()) >= THRESHOLD}
+
+
+def typo(name: str, rng: random.Random) -> str:
+    """Return `name` with a random character replaced, deleted or inserted."""
+    i = rng.randrange(len(name))
+    edit = rng.choice(("replace", "delete", "insert"))
+    if edit == "replace":
+        return name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:]
+    if edit == "delete":
+        return name[:i] + name[i + 1:]
+    return name[:i] + rng.choice(string.ascii_lowercase) + name[i:]
+
+
+def make_queries(names: t.List[str], seed: int = 0) -> t.List[str]:
+    """Build queries the way users type them: misspelt names, partial names and single words."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(QUERIES):
+        name = rng.choice(names).lower()
+        kind = rng.randrange(3)
+        if kind == 0:
+            queries.append(typo(name, rng))
+        elif kind == 1:
+            queries.append(name[:rng.randint(3, max(3, len(name)))])
+        else:
+            queries.append(rng.choice(name.split()))
+    return queries
+
+
+def main() -> None:
+    """
+    Time both implementations on the same queries, and check how many matches the index misses.
+
+    Scoring dominates the time of both; it is much faster with python-Levenshtein installed.
+    """
+    with (SNAKE_RESOURCES / "snake_names.json").open(encoding="utf8") as f:
+        snakes = json.load(f)
+    names = sorted({snake["name"] for snake in snakes} | {snake["scientific"] for snake in snakes})
+
+    start = time.perf_counter()
+    index = FuzzyIndex(names)
+    build = time.perf_counter() - start
+
+    queries = make_queries(names)
+
+    start = time.perf_counter()
+    expected = [legacy(query, names) for query in queries]
+    old = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    found = [
+        {name for _, name in index.search(query, scorer=score, cutoff=THRESHOLD, limit=None)}
+        for query in queries
+    ]
+    new = (time.perf_counter() - start) / len(queries)
+
+    start = time.perf_counter()
+    candidates = sum(len(index.candidates(query)) for query in queries) / len(queries)
+    lookup = (time.perf_counter() - start) / len(queries)
+
+    missed = sum(len(e - f) for e, f in zip(expected, found))
+    total = sum(len(e) for e in expected)
+
+    print(f"{len(names)} names, index built in {build * 1000:.1f}ms")
+    print(f"brute force {old * 1000:6.2f}ms/query, index {new * 1000:6.2f}ms/query, {old / new:5.1f}x faster")
+    print(f"index lookup alone {lookup * 1000:.3f}ms/query, {candidates:.0f} of {len(index)} names scored per query")
+    print(f"{total - missed}/{total} matches found ({missed} missed, mostly weak partial matches on a few letters)")
+
+
+if __name__ == "__main__":
+    main()
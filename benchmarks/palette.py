@@ -0,0 +1,80 @@
+"""
+Compare the old per-pixel easterify colour mapping against `bot.utils.palette.Palette`.
+
+Run from the repository root with `python -m benchmarks.palette`.
+"""
+import random
+import timeit
+import typing as t
+from functools import partial
+
+from PIL import Image
+from PIL.ImageOps import posterize
+
+from bot.exts.easter.avatar_easterifier import COLOURS, PALETTE
+
+RGB = t.Tuple[int, int, int]
+
+SIZE = 256  # Avatar size the bot requests from Discord
+RUNS = 5
+
+
+def legacy_closest(x: RGB) -> RGB:
+    """Copy of the old `AvatarEasterifier.closest`, minus the event loop yields."""
+    r1, g1, b1 = x
+
+    def distance(point: RGB) -> int:
+        r2, g2, b2 = point
+        return (r1 - r2) ** 2 + (g1 - g2) ** 2 + (b1 - b2) ** 2
+
+    closest_colours = sorted(COLOURS, key=lambda point: distance(point))
+    r2, g2, b2 = closest_colours[0]
+    r = (r1 + r2) // 2
+    g = (g1 + g2) // 2
+    b = (b1 + b2) // 2
+
+    return r, g, b
+
+
+def legacy(im: Image.Image) -> Image.Image:
+    """The old `getdata` / `putdata` implementation."""
+    data = list(im.getdata())
+    mapping = {colour: legacy_closest(colour) for colour in set(data)}
+    out = Image.new("RGB", im.size)
+    out.putdata([mapping[x] for x in data])
+    return out
+
+
+def noise(seed: int = 0) -> Image.Image:
+    """Random pixels; every pixel is likely a distinct colour, which is the worst case for the old code."""
+    rng = random.Random(seed)
+    return Image.frombytes("RGB", (SIZE, SIZE), bytes(rng.randrange(256) for _ in range(SIZE * SIZE * 3)))
+
+
+def gradient() -> Image.Image:
+    """A smooth gradient, closer to a typical avatar."""
+    return Image.merge("RGB", [
+        Image.linear_gradient("L").resize((SIZE, SIZE)),
+        Image.linear_gradient("L").rotate(90).resize((SIZE, SIZE)),
+        Image.new("L", (SIZE, SIZE), 128),
+    ])
+
+
+def main() -> None:
+    """Time both implementations on a few images and check that their output matches."""
+    for name, im in (("noise", noise()), ("gradient", gradient())):
+        im = posterize(im, 6)
+
+        old = min(timeit.repeat(partial(legacy, im), number=1, repeat=RUNS))
+        new = min(timeit.repeat(partial(PALETTE.blend, im), number=1, repeat=RUNS))
+
+        mismatches = sum(x != y for x, y in zip(legacy(im).getdata(), PALETTE.blend(im).getdata()))
+
+        print(
+            f"{name:>8}: legacy {old * 1000:8.1f}ms, palette {new * 1000:6.1f}ms, "
+            f"{old / new:6.1f}x faster, {mismatches} differing pixels"
+        )
+
+
+if __name__ == "__main__":
+    main()
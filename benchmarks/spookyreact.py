@@ -0,0 +1,63 @@
+"""
+Compare the old per-trigger `SpookyReact` matching against the single compiled pattern.
+
+Run from the repository root with `python -m benchmarks.spookyreact`.
+"""
+import random
+import re
+import time
+import typing as t
+
+from bot.exts.halloween.spookyreact import SPOOKY_TRIGGERS, find_triggers
+
+MESSAGES = 20_000
+TRIGGER_CHANCE = 0.05  # Fraction of messages containing a trigger
+WORDS = (
+    "the", "a", "python", "function", "list", "error", "help", "please", "import", "class", "why", "does",
+    "this", "not", "work", "thanks", "code", "loop", "return", "string", "dictionary", "async", "await",
+)
+
+
+def legacy(content: str) -> t.List[str]:
+    """The old `SpookyReact.on_message` matching loop, minus the reactions, with the triggers' word boundaries."""
+    return [
+        trigger for trigger in SPOOKY_TRIGGERS.keys()
+        if re.search(rf"\b{SPOOKY_TRIGGERS[trigger][0]}\b", content.lower())
+    ]
+
+
+def make_messages(seed: int = 0) -> t.List[str]:
+    """Build chat-like messages, a few of which contain triggers."""
+    rng = random.Random(seed)
+    triggers = ("spoooky", "skeleton", "doot", "pumpkin", "Halloween", "jack-o-lantern", "danger")
+    messages = []
+    for _ in range(MESSAGES):
+        words = rng.choices(WORDS, k=rng.randint(3, 40))
+        if rng.random() < TRIGGER_CHANCE:
+            words.insert(rng.randrange(len(words)), rng.choice(triggers))
+        messages.append(" ".join(words))
+    return messages
+
+
+def main() -> None:
+    """Time both implementations on the same messages, and check that they find the same triggers."""
+    messages = make_messages()
+
+    start = time.perf_counter()
+    expected = [legacy(message) for message in messages]
+    old = time.perf_counter() - start
+
+    start = time.perf_counter()
+    found = [find_triggers(message) for message in messages]
+    new = time.perf_counter() - start
+
+    mismatches = sum(set(e) != set(f) for e, f in zip(expected, found))
+
+    print(f"{len(messages)} messages, {sum(map(bool, expected))} with triggers")
+    print(f"per trigger {len(messages) / old:9.0f} messages/s, compiled {len(messages) / new:9.0f} messages/s, "
+          f"{old / new:4.1f}x faster")
+    print(f"{mismatches} messages matched differently")
+
+
+if __name__ == "__main__":
+    main()
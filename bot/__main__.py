@@ -5,33 +5,38 @@ from sentry_sdk.integrations.logging import LoggingIntegration
 
 from bot.bot import bot
 from bot.constants import Client, STAFF_ROLES, WHITELISTED_CHANNELS
+from bot.seasons import get_current_season
 from bot.utils.decorators import in_channel_check
-from bot.utils.extensions import walk_extensions
-from bot.utils.extensions import EXTENSIONS
+from bot.utils.extensions import get_active_extensions
+from bot.utils.profiling import StartupProfiler
 
+profiler = StartupProfiler(enabled=Client.profile_startup)
 
 sentry_logging = LoggingIntegration(
     level=logging.DEBUG,
     event_level=logging.WARNING
 )
 
-sentry_sdk.init(
-    dsn=Client.sentry_dsn,
-    integrations=[sentry_logging]
-)
+with profiler.measure("sentry_sdk.init"):
+    sentry_sdk.init(
+        dsn=Client.sentry_dsn,
+        integrations=[sentry_logging]
+    )
 
 log = logging.getLogger(__name__)
 
 bot.add_check(in_channel_check(*WHITELISTED_CHANNELS, bypass_roles=STAFF_ROLES))
 
-# for ext in walk_extensions():
-#    bot.load_extension(ext)
+# Seasonal packages outside of their season are left dormant, the Extensions cog loads them when their month comes
+season = get_current_season()
+log.info(f"Loading extensions for the {season.season_name} season")
+
+with profiler.measure("extension discovery"):
+    extensions = get_active_extensions(season)
+
+for ext in sorted(extensions):
+    profiler.load_extension(bot, ext)
 
-for ext in EXTENSIONS:
-    # print(ext)
-    if ext.startswith('bot.exts.halloween'):
-        bot.load_extension(ext)
-    if ext.startswith('bot.exts.evergreen.error_handler'):
-        bot.load_extension(ext)
+bot.loop.create_task(profiler.report(bot))
 
 bot.run(Client.token)
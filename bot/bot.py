@@ -1,22 +1,44 @@
 import asyncio
 import enum
+import hashlib
 import logging
-import socket
-from typing import Optional, Union
+import time
+from io import BytesIO
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 
 import async_timeout
 import discord
-from aiohttp import AsyncResolver, ClientSession, TCPConnector
+from PIL import Image
+from aiohttp import ClientSession
 from discord import DiscordException, Embed, Guild, User
 from discord.ext import commands
 
 from bot.constants import Channels, Client, MODERATION_ROLES
+from bot.seasons import clock
+from bot.utils import persist
 from bot.utils.decorators import mock_in_debug
+from bot.utils.dispatch import Dispatcher
+from bot.utils.exceptions import ImageProcessingError
+from bot.utils.http import HTTPService
+from bot.utils.image_pool import ImagePool
+from bot.utils.metrics import Metrics
+from bot.utils.scheduler import Cron, Scheduler
+from bot.utils.sessions import SessionRouter
+from bot.utils.watchdog import LoopWatchdog
 
 log = logging.getLogger(__name__)
 
 __all__ = ("AssetType", "SeasonalBot", "bot")
 
+ASSET_CACHE = Path(persist.DIRECTORY, "assets")  # Downloaded media assets, named after their git blob sha
+
+MAX_ASSET_SIZE = 10 * 2**20  # Largest image Discord accepts for any asset, in bytes
+MIN_ASSET_DIMENSION = 128  # Smallest width and height Discord renders assets at without upscaling them
+UPLOAD_TIMEOUT = 5  # Seconds allowed for an asset upload, on top of the time its size is expected to take
+UPLOAD_RATE = 256 * 2**10  # Bytes per second uploads are assumed to go at, at worst
+JPEG_QUALITY = 90  # Quality JPEG assets are re-encoded at, high enough not to show artifacts
+
 
 class AssetType(enum.Enum):
     """
@@ -30,6 +52,53 @@ class AssetType(enum.Enum):
     SERVER_ICON = "icon"
 
 
+# Largest dimensions Discord displays each asset at, larger images are downscaled before they are uploaded
+MAX_ASSET_DIMENSIONS: Dict[AssetType, Tuple[int, int]] = {
+    AssetType.BANNER: (1920, 1080),
+    AssetType.AVATAR: (1024, 1024),
+    AssetType.SERVER_ICON: (1024, 1024),
+}
+
+
+def blob_sha(data: bytes) -> str:
+    """Give the git blob sha of `data`, as found in the branding repository's trees."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def optimize_asset(image_bytes: bytes, max_dimensions: Tuple[int, int]) -> Tuple[bytes, Tuple[int, int]]:
+    """
+    Downscale the image in `image_bytes` to fit in `max_dimensions` and re-encode it, optimized.
+
+    JPEGs stay JPEGs, as photographs are several times larger as PNGs; other images are encoded as PNG.
+    Return the smaller of the optimized and the original bytes, along with the original dimensions of
+    the image. Animated images are given back as they are, as re-encoding them frame by frame would
+    take longer than the upload it is meant to save.
+    """
+    image = Image.open(BytesIO(image_bytes))
+    dimensions = image.size
+    if getattr(image, "is_animated", False):
+        return image_bytes, dimensions
+
+    if image.format == "JPEG":
+        target_format, modes = "JPEG", ("L", "RGB")
+    else:
+        target_format, modes = "PNG", ("1", "L", "LA", "P", "RGB", "RGBA")
+
+    if image.mode not in modes:
+        image = image.convert(modes[-1])
+    if image.width > max_dimensions[0] or image.height > max_dimensions[1]:
+        image.thumbnail(max_dimensions, Image.LANCZOS)
+
+    buffer = BytesIO()
+    image.save(buffer, format=target_format, optimize=True, quality=JPEG_QUALITY)
+    optimized = buffer.getvalue()
+
+    # Discord downscales oversized assets by itself, so a larger image is still fine if it is fewer bytes
+    if len(optimized) >= len(image_bytes):
+        return image_bytes, dimensions
+    return optimized, dimensions
+
+
 class SeasonalBot(commands.Bot):
     """
     Base bot instance.
@@ -41,11 +110,22 @@ class SeasonalBot(commands.Bot):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.http_session = ClientSession(
-            connector=TCPConnector(resolver=AsyncResolver(), family=socket.AF_INET)
-        )
+        self.http_service = HTTPService()
+        self.image_pool = ImagePool()
+        self.metrics = Metrics()
+        self.dispatcher = Dispatcher()
+        self.sessions = SessionRouter()
+        self.scheduler = Scheduler()
+        self.watchdog = LoopWatchdog(self.loop)
         self._guild_available = asyncio.Event()
 
+        self.watchdog.start()
+        self.scheduler.start()
+        self.scheduler.schedule("SeasonalBot.season_clock", self._tick_season_clock, Cron("0 0 1 * *"))
+
+        self.before_invoke(self._start_invocation)
+        self.after_invoke(self._finish_invocation)
+
         self.loop.create_task(self.send_log("SeasonalBot", "Connected!"))
 
     @property
@@ -56,29 +136,136 @@ class SeasonalBot(commands.Bot):
             return None
         return guild.me
 
+    @property
+    def http_session(self) -> ClientSession:
+        """
+        The raw session owned by `http_service`.
+
+        Prefer `http_service` for plain requests, as it provides caching and request coalescing.
+        """
+        return self.http_service.session
+
+    async def close(self) -> None:
+        """Stop the scheduler, save persistent data, and close everything else the bot owns."""
+        self.scheduler.stop()
+        await super().close()
+        await persist.flush_all()
+        self.watchdog.stop()
+        await self.http_service.close()
+        self.image_pool.shutdown()
+
+    async def _tick_season_clock(self) -> None:
+        """Dispatch `season_change` with the previous and the new season, if the month started a new season."""
+        change = clock.tick()
+        if change is not None:
+            self.dispatch("season_change", *change)
+
     def add_cog(self, cog: commands.Cog) -> None:
         """
-        Delegate to super to register `cog`.
+        Delegate to super to register `cog`, and register its dispatched listeners and scheduled jobs.
 
-        This only serves to make the info log, so that extensions don't have to.
+        This also makes the info log, so that extensions don't have to.
         """
         super().add_cog(cog)
+        self.dispatcher.add_cog(cog)
+        self.scheduler.add_cog(cog)
         log.info(f"Cog loaded: {cog.qualified_name}")
 
+    def remove_cog(self, name: str) -> None:
+        """Unregister the listeners and jobs of the cog called `name`, and delegate to super to remove it."""
+        cog = self.get_cog(name)
+        if cog is not None:
+            self.dispatcher.remove_cog(cog)
+            self.scheduler.remove_cog(cog)
+        super().remove_cog(name)
+
+    def dispatch(self, event_name: str, *args, **kwargs) -> None:
+        """Dispatch the event to discord.py's listeners, then to the dispatched listeners and interactive sessions."""
+        super().dispatch(event_name, *args, **kwargs)
+        self.dispatcher.dispatch(event_name, *args)
+        self.sessions.dispatch(event_name, *args)
+
+    async def _start_invocation(self, ctx: commands.Context) -> None:
+        """Start timing a command invocation."""
+        self.metrics.start(ctx)
+
+    async def _finish_invocation(self, ctx: commands.Context) -> None:
+        """Stop timing a command invocation and record it."""
+        self.metrics.finish(ctx)
+
     async def on_command_error(self, context: commands.Context, exception: DiscordException) -> None:
-        """Check command errors for UserInputError and reset the cooldown if thrown."""
+        """Count the error, and check command errors for UserInputError and reset the cooldown if thrown."""
+        self.metrics.record_error(context, exception)
+
         if isinstance(exception, commands.UserInputError):
             context.command.reset_cooldown(context)
         else:
             await super().on_command_error(context, exception)
 
-    async def _fetch_image(self, url: str) -> bytes:
-        """Retrieve and read image from `url`."""
+    async def fetch_asset(self, url: str, sha: Optional[str] = None) -> Tuple[bytes, bool]:
+        """
+        Retrieve and read image from `url`, and tell whether it matches its git blob `sha`.
+
+        If `sha` is given, the image is kept in `ASSET_CACHE` once downloaded, and read from there
+        from then on. As the cache is content-addressed, an image is only ever downloaded once, even
+        if it is moved or shared between seasons. Downloads which don't match their sha, e.g. error
+        pages, aren't cached, and aren't reported as matching.
+        """
+        if sha is not None:
+            path = Path(ASSET_CACHE, sha)
+            if path.exists():
+                log.debug(f"Reading image {sha} from the asset cache")
+                return await self.loop.run_in_executor(None, path.read_bytes), True
+
         log.debug(f"Getting image from: {url}")
-        async with self.http_session.get(url) as resp:
-            return await resp.read()
+        image = await self.http_service.get_bytes(url)
+
+        if sha is None:
+            return image, False
+
+        actual_sha = blob_sha(image)
+        if actual_sha != sha:
+            log.warning(f"Not caching the image from {url}, its sha {actual_sha} doesn't match {sha}")
+            return image, False
 
-    async def _apply_asset(self, target: Union[Guild, User], asset: AssetType, url: str) -> bool:
+        await persist.write_bytes(path, image)
+        return image, True
+
+    async def prepare_asset(self, asset: AssetType, url: str, sha: Optional[str] = None) -> bytes:
+        """
+        Give the image at `url`, optimized for upload as `asset`.
+
+        The image is downscaled to `MAX_ASSET_DIMENSIONS` and re-encoded in the image pool. If the
+        download matches its git blob `sha`, the result is kept in `ASSET_CACHE` under that sha, so
+        each image is only optimized once. If the image can't be optimized, it is given as it was downloaded.
+        """
+        if sha is not None:
+            path = Path(ASSET_CACHE, f"{sha}.{asset.value}")
+            if path.exists():
+                log.debug(f"Reading optimized {asset.value} {sha} from the asset cache")
+                return await self.loop.run_in_executor(None, path.read_bytes)
+
+        image, verified = await self.fetch_asset(url, sha)
+
+        try:
+            optimized, (width, height) = await self.image_pool.submit(
+                optimize_asset, image, MAX_ASSET_DIMENSIONS[asset]
+            )
+        except (ImageProcessingError, OSError, ValueError):
+            log.warning(f"Failed to optimize the {asset.value} at {url}, it will be uploaded as is", exc_info=True)
+            return image
+
+        if width < MIN_ASSET_DIMENSION or height < MIN_ASSET_DIMENSION:
+            log.warning(f"The {asset.value} at {url} is only {width}x{height}, it will look blurry")
+
+        log.info(f"Optimized the {asset.value} at {url} from {len(image)} to {len(optimized)} bytes")
+        if verified:
+            await persist.write_bytes(path, optimized)
+        return optimized
+
+    async def _apply_asset(
+        self, target: Union[Guild, User], asset: AssetType, url: str, sha: Optional[str] = None
+    ) -> bool:
         """
         Internal method for applying media assets to the guild or the bot.
 
@@ -89,13 +276,20 @@ class SeasonalBot(commands.Bot):
         """
         log.info(f"Attempting to set {asset.name}: {url}")
 
-        kwargs = {asset.value: await self._fetch_image(url)}
+        image = await self.prepare_asset(asset, url, sha)
+        if len(image) > MAX_ASSET_SIZE:
+            log.info(f"Asset is {len(image)} bytes, over Discord's limit of {MAX_ASSET_SIZE} bytes")
+            return False
+
+        # Larger images are given longer to upload, rather than being reported as failed
+        timeout = UPLOAD_TIMEOUT + len(image) / UPLOAD_RATE
+        start = time.perf_counter()
         try:
-            async with async_timeout.timeout(5):
-                await target.edit(**kwargs)
+            async with async_timeout.timeout(timeout):
+                await target.edit(**{asset.value: image})
 
         except asyncio.TimeoutError:
-            log.info("Asset upload timed out")
+            log.info(f"Asset upload of {len(image)} bytes timed out after {timeout:.1f}s")
             return False
 
         except discord.HTTPException as discord_error:
@@ -103,33 +297,33 @@ class SeasonalBot(commands.Bot):
             return False
 
         else:
-            log.info("Asset successfully applied")
+            log.info(f"Asset successfully applied, uploaded {len(image)} bytes in {time.perf_counter() - start:.2f}s")
             return True
 
     @mock_in_debug(return_value=True)
-    async def set_banner(self, url: str) -> bool:
-        """Set the guild's banner to image at `url`."""
+    async def set_banner(self, url: str, sha: Optional[str] = None) -> bool:
+        """Set the guild's banner to image at `url`, with git blob `sha` if known."""
         guild = self.get_guild(Client.guild)
         if guild is None:
             log.info("Failed to get guild instance, aborting asset upload")
             return False
 
-        return await self._apply_asset(guild, AssetType.BANNER, url)
+        return await self._apply_asset(guild, AssetType.BANNER, url, sha)
 
     @mock_in_debug(return_value=True)
-    async def set_icon(self, url: str) -> bool:
-        """Sets the guild's icon to image at `url`."""
+    async def set_icon(self, url: str, sha: Optional[str] = None) -> bool:
+        """Sets the guild's icon to image at `url`, with git blob `sha` if known."""
         guild = self.get_guild(Client.guild)
         if guild is None:
             log.info("Failed to get guild instance, aborting asset upload")
             return False
 
-        return await self._apply_asset(guild, AssetType.SERVER_ICON, url)
+        return await self._apply_asset(guild, AssetType.SERVER_ICON, url, sha)
 
     @mock_in_debug(return_value=True)
-    async def set_avatar(self, url: str) -> bool:
-        """Set the bot's avatar to image at `url`."""
-        return await self._apply_asset(self.user, AssetType.AVATAR, url)
+    async def set_avatar(self, url: str, sha: Optional[str] = None) -> bool:
+        """Set the bot's avatar to image at `url`, with git blob `sha` if known."""
+        return await self._apply_asset(self.user, AssetType.AVATAR, url, sha)
 
     @mock_in_debug(return_value=True)
     async def set_nickname(self, new_name: str) -> bool:
@@ -139,6 +333,10 @@ class SeasonalBot(commands.Bot):
             log.info("Failed to get bot member instance, aborting asset upload")
             return False
 
+        if member.nick == new_name:
+            log.info(f"Nickname is already {new_name}")
+            return True
+
         log.info(f"Attempting to set nickname to {new_name}")
         try:
             await member.edit(nick=new_name)
@@ -15,12 +15,15 @@ __all__ = (
     "Icons",
     "Lovefest",
     "Month",
+    "RateLimit",
     "Roles",
     "Tokens",
     "Wolfram",
     "MODERATION_ROLES",
     "STAFF_ROLES",
     "WHITELISTED_CHANNELS",
+    "RATE_LIMITS",
+    "DEFAULT_RATE_LIMIT",
     "ERROR_REPLIES",
     "NEGATIVE_REPLIES",
     "POSITIVE_REPLIES",
@@ -84,6 +87,11 @@ class Client(NamedTuple):
     token = environ.get("SEASONALBOT_TOKEN")
     sentry_dsn = environ.get("SEASONALBOT_SENTRY_DSN")
     debug = environ.get("SEASONALBOT_DEBUG", "").lower() == "true"
+    profile_startup = environ.get("SEASONALBOT_PROFILE_STARTUP", "").lower() == "true"
+    # Serve Prometheus metrics over HTTP on this port; disabled if unset
+    metrics_port = int(environ["SEASONALBOT_METRICS_PORT"]) if "SEASONALBOT_METRICS_PORT" in environ else None
+    # The metrics are unauthenticated, so they are only served locally unless told otherwise
+    metrics_host = environ.get("SEASONALBOT_METRICS_HOST", "127.0.0.1")
     github_bot_repo = "https://github.com/4parthy/seasonalbot"
     # Override seasonal locks: 1 (January) to 12 (December)
     month_override = int(environ["SEASONALBOT_MONTH_OVERRIDE"]) if "SEASONALBOT_MONTH_OVERRIDE" in environ else None
@@ -203,6 +211,26 @@ class Wolfram(NamedTuple):
     key = environ.get("WOLFRAM_API_KEY")
 
 
+class RateLimit(NamedTuple):
+    requests: int  # Requests which can be sent at once, refilled over every `per` seconds
+    per: float
+
+
+# Outbound requests allowed to each host, see `bot.utils.ratelimit`
+RATE_LIMITS = {
+    "adventofcode.com": RateLimit(10, 60),
+    "api-v3.igdb.com": RateLimit(4, 1),
+    "api.giphy.com": RateLimit(42, 60 * 60),
+    "api.github.com": RateLimit(5000, 60 * 60) if Tokens.github else RateLimit(60, 60 * 60),
+    "api.nasa.gov": RateLimit(1000, 60 * 60) if Tokens.nasa else RateLimit(30, 60 * 60),
+    "api.themoviedb.org": RateLimit(40, 10),
+    "api.wolframalpha.com": RateLimit(5, 1),
+    "en.wikipedia.org": RateLimit(10, 1),
+    "www.hebcal.com": RateLimit(5, 1),
+    "www.reddit.com": RateLimit(30, 60),
+}
+DEFAULT_RATE_LIMIT = RateLimit(10, 1)  # For hosts not in `RATE_LIMITS`
+
 # Default role combinations
 MODERATION_ROLES = Roles.moderator, Roles.admin, Roles.owner
 STAFF_ROLES = Roles.helpers, Roles.moderator, Roles.admin, Roles.owner
@@ -16,6 +16,8 @@ from pytz import timezone
 from bot.constants import AdventOfCode as AocConfig, Channels, Colours, Emojis, Month, Tokens, WHITELISTED_CHANNELS
 from bot.utils import unlocked_role
 from bot.utils.decorators import in_month, override_in_channel
+from bot.utils.leaderboard import Leaderboard
+from bot.utils.scheduler import Cron, scheduled
 
 log = logging.getLogger(__name__)
 
@@ -51,81 +53,69 @@ def time_left_to_aoc_midnight() -> Tuple[datetime, timedelta]:
 
 async def countdown_status(bot: commands.Bot) -> None:
     """Set the playing status of the bot to the minutes & hours left until the next day's challenge."""
-    while is_in_advent():
-        _, time_left = time_left_to_aoc_midnight()
-
-        aligned_seconds = int(math.ceil(time_left.seconds / COUNTDOWN_STEP)) * COUNTDOWN_STEP
-        hours, minutes = aligned_seconds // 3600, aligned_seconds // 60 % 60
-
-        if aligned_seconds == 0:
-            playing = "right now!"
-        elif aligned_seconds == COUNTDOWN_STEP:
-            playing = f"in less than {minutes} minutes"
-        elif hours == 0:
-            playing = f"in {minutes} minutes"
-        elif hours == 23:
-            playing = f"since {60 - minutes} minutes ago"
-        else:
-            playing = f"in {hours} hours and {minutes} minutes"
+    if not is_in_advent():
+        return
+
+    _, time_left = time_left_to_aoc_midnight()
 
-        # Status will look like "Playing in 5 hours and 30 minutes"
-        await bot.change_presence(activity=discord.Game(playing))
+    aligned_seconds = int(math.ceil(time_left.seconds / COUNTDOWN_STEP)) * COUNTDOWN_STEP
+    hours, minutes = aligned_seconds // 3600, aligned_seconds // 60 % 60
 
-        # Sleep until next aligned time or a full step if already aligned
-        delay = time_left.seconds % COUNTDOWN_STEP or COUNTDOWN_STEP
-        await asyncio.sleep(delay)
+    if aligned_seconds == 0:
+        playing = "right now!"
+    elif aligned_seconds == COUNTDOWN_STEP:
+        playing = f"in less than {minutes} minutes"
+    elif hours == 0:
+        playing = f"in {minutes} minutes"
+    elif hours == 23:
+        playing = f"since {60 - minutes} minutes ago"
+    else:
+        playing = f"in {hours} hours and {minutes} minutes"
+
+    # Status will look like "Playing in 5 hours and 30 minutes"
+    await bot.change_presence(activity=discord.Game(playing))
 
 
 async def day_countdown(bot: commands.Bot) -> None:
     """
-    Calculate the number of seconds left until the next day of Advent.
+    Ping the Advent of Code role, notifying them that today's challenge is ready.
 
-    Once we have calculated this we should then sleep that number and when the time is reached, ping
-    the Advent of Code role notifying them that the new challenge is ready.
+    This is scheduled at midnight in UTC-5 (the Advent of Code maintainer timezone), when the
+    puzzles are released.
     """
-    while is_in_advent():
-        tomorrow, time_left = time_left_to_aoc_midnight()
-
-        # Correct `time_left.seconds` for the sleep we have after unlocking the role (-5) and adding
-        # a second (+1) as the bot is consistently ~0.5 seconds early in announcing the puzzles.
-        await asyncio.sleep(time_left.seconds - 4)
-
-        channel = bot.get_channel(Channels.advent_of_code)
-
-        if not channel:
-            log.error("Could not find the AoC channel to send notification in")
-            break
-
-        aoc_role = channel.guild.get_role(AocConfig.role_id)
-        if not aoc_role:
-            log.error("Could not find the AoC role to announce the daily puzzle")
-            break
-
-        async with unlocked_role(aoc_role, delay=5):
-            puzzle_url = f"https://adventofcode.com/{AocConfig.year}/day/{tomorrow.day}"
-
-            # Check if the puzzle is already available to prevent our members from spamming
-            # the puzzle page before it's available by making a small HEAD request.
-            for retry in range(1, 5):
-                log.debug(f"Checking if the puzzle is already available (attempt {retry}/4)")
-                async with bot.http_session.head(puzzle_url, raise_for_status=False) as resp:
-                    if resp.status == 200:
-                        log.debug("Puzzle is available; let's send an announcement message.")
-                        break
-                log.debug(f"The puzzle is not yet available (status={resp.status})")
-                await asyncio.sleep(10)
-            else:
-                log.error("The puzzle does does not appear to be available at this time, canceling announcement")
-                break
-
-            await channel.send(
-                f"{aoc_role.mention} Good morning! Day {tomorrow.day} is ready to be attempted. "
-                f"View it online now at {puzzle_url}. Good luck!"
-            )
+    today = datetime.now(EST)
+    channel = bot.get_channel(Channels.advent_of_code)
+
+    if not channel:
+        log.error("Could not find the AoC channel to send notification in")
+        return
+
+    aoc_role = channel.guild.get_role(AocConfig.role_id)
+    if not aoc_role:
+        log.error("Could not find the AoC role to announce the daily puzzle")
+        return
+
+    async with unlocked_role(aoc_role, delay=5):
+        puzzle_url = f"https://adventofcode.com/{AocConfig.year}/day/{today.day}"
+
+        # Check if the puzzle is already available to prevent our members from spamming
+        # the puzzle page before it's available by making a small HEAD request.
+        for retry in range(1, 5):
+            log.debug(f"Checking if the puzzle is already available (attempt {retry}/4)")
+            async with bot.http_session.head(puzzle_url, raise_for_status=False) as resp:
+                if resp.status == 200:
+                    log.debug("Puzzle is available; let's send an announcement message.")
+                    break
+            log.debug(f"The puzzle is not yet available (status={resp.status})")
+            await asyncio.sleep(10)
+        else:
+            log.error("The puzzle does does not appear to be available at this time, canceling announcement")
+            return
 
-        # Wait a couple minutes so that if our sleep didn't sleep enough
-        # time we don't end up announcing twice.
-        await asyncio.sleep(120)
+        await channel.send(
+            f"{aoc_role.mention} Good morning! Day {today.day} is ready to be attempted. "
+            f"View it online now at {puzzle_url}. Good luck!"
+        )
 
 
 class AdventOfCode(commands.Cog):
@@ -144,14 +134,17 @@ class AdventOfCode(commands.Cog):
         self.cached_global_leaderboard = None
         self.cached_private_leaderboard = None
 
-        self.countdown_task = None
-        self.status_task = None
+    # Every 5 minutes (COUNTDOWN_STEP) in December; UTC and UTC-5 agree on 5 minute boundaries
+    @scheduled(Cron("*/5 * * 12 *"), run_now=True)
+    async def status_job(self) -> None:
+        """Keep the countdown to the next challenge in the bot's status."""
+        await countdown_status(self.bot)
 
-        countdown_coro = day_countdown(self.bot)
-        self.countdown_task = self.bot.loop.create_task(countdown_coro)
-
-        status_coro = countdown_status(self.bot)
-        self.status_task = self.bot.loop.create_task(status_coro)
+    # Midnight in UTC-5, from the 1st to the 25th of December
+    @scheduled(Cron("0 5 1-25 12 *"))
+    async def countdown_job(self) -> None:
+        """Announce each day's challenge."""
+        await day_countdown(self.bot)
 
     @in_month(Month.DECEMBER)
     @commands.group(name="adventofcode", aliases=("aoc",))
@@ -448,12 +441,6 @@ class AdventOfCode(commands.Cog):
         else:
             self.cached_private_leaderboard = await AocPrivateLeaderboard.from_url()
 
-    def cog_unload(self) -> None:
-        """Cancel season-related tasks on cog unload."""
-        log.debug("Unloading the cog and canceling the background task.")
-        self.countdown_task.cancel()
-        self.status_task.cancel()
-
 
 class AocMember:
     """Object representing the Advent of Code user."""
@@ -542,6 +529,8 @@ class AocPrivateLeaderboard:
 
     def __init__(self, members: list, owner_id: int, event_year: int):
         self.members = members
+        self.ranking = Leaderboard({member.aoc_id: member.local_score for member in members})
+        self._members_by_id = {member.aoc_id: member for member in members}
         self._owner_id = owner_id
         self._event_year = event_year
         self.last_updated = datetime.utcnow()
@@ -554,7 +543,7 @@ class AocPrivateLeaderboard:
 
         If n is not specified, default to the top 10
         """
-        return self.members[:n]
+        return [self._members_by_id[aoc_id] for aoc_id, _ in self.ranking.top(n)]
 
     def calculate_daily_completion(self) -> List[tuple]:
         """
@@ -604,7 +593,7 @@ class AocPrivateLeaderboard:
     def from_json(cls, injson: dict) -> "AocPrivateLeaderboard":
         """Generate an AocPrivateLeaderboard object from AoC's private leaderboard API JSON."""
         return cls(
-            members=cls._sorted_members(injson["members"]), owner_id=injson["owner_id"], event_year=injson["event"]
+            members=cls._members(injson["members"]), owner_id=injson["owner_id"], event_year=injson["event"]
         )
 
     @classmethod
@@ -614,16 +603,13 @@ class AocPrivateLeaderboard:
         return cls.from_json(api_json)
 
     @staticmethod
-    def _sorted_members(injson: dict) -> list:
+    def _members(injson: dict) -> list:
         """
-        Generate a sorted list of AocMember objects from AoC's private leaderboard API JSON.
+        Generate a list of AocMember objects from AoC's private leaderboard API JSON.
 
-        Output list is sorted based on the AocMember.local_score
+        The members are ranked by their AocMember.local_score in the leaderboard's ranking
         """
-        members = [AocMember.member_from_json(injson[member]) for member in injson]
-        members.sort(key=lambda x: x.local_score, reverse=True)
-
-        return members
+        return [AocMember.member_from_json(injson[member]) for member in injson]
 
     @staticmethod
     def build_leaderboard_embed(members_to_print: List[AocMember]) -> str:
@@ -1,14 +1,16 @@
-import asyncio
 import logging
 from io import BytesIO
 from pathlib import Path
-from typing import Tuple, Union
+from typing import Optional, Union
 
 import discord
 from PIL import Image
 from PIL.ImageOps import posterize
 from discord.ext import commands
 
+from bot.utils.assets import image_cache
+from bot.utils.palette import Palette
+
 log = logging.getLogger(__name__)
 
 COLOURS = [
@@ -17,34 +19,49 @@ COLOURS = [
     (135, 206, 235), (0, 204, 204), (64, 224, 208)
 ]  # Pastel colours - Easter-like
 
+PALETTE = Palette(COLOURS)
 
-class AvatarEasterifier(commands.Cog):
-    """Put an Easter spin on your avatar or image!"""
+BUNNY = Path("bot/resources/easter/chocolate_bunny.png")
 
-    def __init__(self, bot: commands.Bot):
-        self.bot = bot
 
-    @staticmethod
-    def closest(x: Tuple[int, int, int]) -> Tuple[int, int, int]:
-        """
-        Finds the closest easter colour to a given pixel.
+def easterify(image_bytes: bytes, egg_bytes: Optional[bytes] = None) -> bytes:
+    """
+    Recolour the avatar in `image_bytes` with pastel colours, returning PNG bytes.
 
-        Returns a merge between the original colour and the closest colour
-        """
-        r1, g1, b1 = x
+    If `egg_bytes` are given, that egg is placed in the right centre of the avatar,
+    otherwise a chocolate bunny is.
+    """
+    old = Image.open(BytesIO(image_bytes))
+    old = old.convert("RGBA")
+
+    # Grabs alpha channel since posterize can't be used with an RGBA image.
+    alpha = old.getchannel("A")
+    old = old.convert("RGB")
+    old = posterize(old, 6)
+
+    # Averages every pixel with its closest easter colour
+    im = PALETTE.blend(old).convert("RGBA")
+    im.putalpha(alpha)
 
-        def distance(point: Tuple[int, int, int]) -> Tuple[int, int, int]:
-            """Finds the difference between a pastel colour and the original pixel colour."""
-            r2, g2, b2 = point
-            return ((r1 - r2)**2 + (g1 - g2)**2 + (b1 - b2)**2)
+    if egg_bytes is not None:
+        egg = Image.open(BytesIO(egg_bytes)).convert("RGBA")  # Indexed images can only be resized coarsely
+        ratio = 64 / egg.height
+        egg = egg.resize((round(egg.width * ratio), round(egg.height * ratio)))
+        im.alpha_composite(egg, (im.width - egg.width, (im.height - egg.height)//2))  # Right centre.
+    else:
+        bunny = image_cache.get(BUNNY)
+        im.alpha_composite(bunny, (im.width - bunny.width, (im.height - bunny.height)//2))  # Right centre.
 
-        closest_colours = sorted(COLOURS, key=lambda point: distance(point))
-        r2, g2, b2 = closest_colours[0]
-        r = (r1 + r2) // 2
-        g = (g1 + g2) // 2
-        b = (b1 + b2) // 2
+    bufferedio = BytesIO()
+    im.save(bufferedio, format="PNG")
+    return bufferedio.getvalue()
+
+
+class AvatarEasterifier(commands.Cog):
+    """Put an Easter spin on your avatar or image!"""
 
-        return (r, g, b)
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
 
     @commands.command(pass_context=True, aliases=["easterify"])
     async def avatareasterify(self, ctx: commands.Context, *colours: Union[discord.Colour, str]) -> None:
@@ -71,46 +88,17 @@ class AvatarEasterifier(commands.Cog):
             # Grabs image of avatar
             image_bytes = await ctx.author.avatar_url_as(size=256).read()
 
-            old = Image.open(BytesIO(image_bytes))
-            old = old.convert("RGBA")
-
-            # Grabs alpha channel since posterize can't be used with an RGBA image.
-            alpha = old.getchannel("A").getdata()
-            old = old.convert("RGB")
-            old = posterize(old, 6)
-
-            data = old.getdata()
-            setted_data = set(data)
-            new_d = {}
-
-            for x in setted_data:
-                new_d[x] = self.closest(x)
-                await asyncio.sleep(0)  # Ensures discord doesn't break in the background.
-            new_data = [(*new_d[x], alpha[i]) if x in new_d else x for i, x in enumerate(data)]
-
-            im = Image.new("RGBA", old.size)
-            im.putdata(new_data)
-
+            egg = None
             if colours:
                 send_message = ctx.send
                 ctx.send = send  # Assigns ctx.send to a fake send
                 egg = await ctx.invoke(self.bot.get_command("eggdecorate"), *colours)
+                ctx.send = send_message  # Reassigns ctx.send
                 if isinstance(egg, str):  # When an error message occurs in eggdecorate.
                     return await send_message(egg)
 
-                ratio = 64 / egg.height
-                egg = egg.resize((round(egg.width * ratio), round(egg.height * ratio)))
-                egg = egg.convert("RGBA")
-                im.alpha_composite(egg, (im.width - egg.width, (im.height - egg.height)//2))  # Right centre.
-                ctx.send = send_message  # Reassigns ctx.send
-            else:
-                bunny = Image.open(Path("bot/resources/easter/chocolate_bunny.png"))
-                im.alpha_composite(bunny, (im.width - bunny.width, (im.height - bunny.height)//2))  # Right centre.
-
-            bufferedio = BytesIO()
-            im.save(bufferedio, format="PNG")
-
-            bufferedio.seek(0)
+            im = await self.bot.image_pool.submit(easterify, image_bytes, egg)
+            bufferedio = BytesIO(im)
 
             file = discord.File(bufferedio, filename="easterified_avatar.png")  # Creates file to be used in embed
             embed = discord.Embed(
@@ -125,4 +113,5 @@ class AvatarEasterifier(commands.Cog):
 
 def setup(bot: commands.Bot) -> None:
     """Avatar Easterifier Cog load."""
+    image_cache.preload(BUNNY)
     bot.add_cog(AvatarEasterifier(bot))
@@ -1,16 +1,15 @@
-import json
 import logging
 import random
 import re
-from pathlib import Path
 from typing import List, Union
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
-with Path("bot/resources/easter/bunny_names.json").open("r", encoding="utf8") as f:
-    BUNNY_NAMES = json.load(f)
+BUNNY_NAMES = resource("bot/resources/easter/bunny_names.json", shape={"names": [str]})
 
 
 class BunnyNameGenerator(commands.Cog):
@@ -57,7 +56,7 @@ class BunnyNameGenerator(commands.Cog):
     @commands.command()
     async def bunnyname(self, ctx: commands.Context) -> None:
         """Picks a random bunny name from a JSON file."""
-        await ctx.send(random.choice(BUNNY_NAMES["names"]))
+        await ctx.send(BUNNY_NAMES.choice("names"))
 
     @commands.command()
     async def bunnifyme(self, ctx: commands.Context) -> None:
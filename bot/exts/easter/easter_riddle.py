@@ -1,18 +1,18 @@
 import asyncio
 import logging
-import random
-from json import load
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with Path("bot/resources/easter/easter_riddle.json").open("r", encoding="utf8") as f:
-    RIDDLE_QUESTIONS = load(f)
+RIDDLE_QUESTIONS = resource(
+    "bot/resources/easter/easter_riddle.json",
+    shape=[{"question": str, "riddles": [str], "correct_answer": str}]
+)
 
 TIMELIMIT = 10
 
@@ -38,7 +38,7 @@ class EasterRiddle(commands.Cog):
 
         self.current_channel = ctx.message.channel
 
-        random_question = random.choice(RIDDLE_QUESTIONS)
+        random_question = RIDDLE_QUESTIONS.choice()
         question = random_question["question"]
         hints = random_question["riddles"]
         self.correct = random_question["correct_answer"]
@@ -1,22 +1,21 @@
-import json
 import logging
 import random
 from contextlib import suppress
 from io import BytesIO
 from pathlib import Path
-from typing import Union
+from typing import List, NamedTuple, OrderedDict, Sequence, Tuple, Union
 
 import discord
 from PIL import Image
 from discord.ext import commands
 
-log = logging.getLogger(__name__)
+from bot.utils.palette import Palette
+from bot.utils.resources import resource
 
-with open(Path("bot/resources/evergreen/html_colours.json"), encoding="utf8") as f:
-    HTML_COLOURS = json.load(f)
+log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/evergreen/xkcd_colours.json"), encoding="utf8") as f:
-    XKCD_COLOURS = json.load(f)
+HTML_COLOURS = resource("bot/resources/evergreen/html_colours.json", shape={str: str})
+XKCD_COLOURS = resource("bot/resources/evergreen/xkcd_colours.json", shape={str: str})
 
 COLOURS = [
     (255, 0, 0, 255), (255, 128, 0, 255), (255, 255, 0, 255), (0, 255, 0, 255),
@@ -27,26 +26,93 @@ IRREPLACEABLE = [
     (0, 0, 0, 0), (0, 0, 0, 255)
 ]  # Colours that are meant to stay the same - Transparent and Black
 
+DESIGNS = Path("bot/resources/easter/easter_eggs")
+DESIGN_COUNT = 6
+CACHE_SIZE = 128  # Decorated eggs kept around for repeated colour combinations
+
+# Palette of the indexed designs: black, followed by the replaceable colours, then the transparent slot
+INDEXED_COLOURS = [(0, 0, 0)] + [colour[:3] for colour in COLOURS]
+TRANSPARENT = len(INDEXED_COLOURS)
+
+RGB = Tuple[int, int, int]
+
+
+class EggDesign(NamedTuple):
+    """An egg design stored as a palette-indexed image, ready to be recoloured."""
+
+    image: Image.Image  # "P" mode, indices point into INDEXED_COLOURS
+    slots: Tuple[int, ...]  # Palette indices of the replaceable colours used, in the order of COLOURS
+
+    @classmethod
+    def load(cls, path: Path) -> "EggDesign":
+        """Load a design, which may only consist of `COLOURS` and `IRREPLACEABLE` colours."""
+        with Image.open(path) as im:
+            im = im.convert("RGBA")
+
+        # Unused palette entries are padded with black, so fold any such index back onto black's
+        indexed = Palette(INDEXED_COLOURS).index(im)
+        indexed = indexed.point([i if i < TRANSPARENT else 0 for i in range(256)])
+        indexed.paste(TRANSPARENT, mask=im.getchannel("A").point(lambda alpha: 255 if alpha == 0 else 0))
+
+        used = {index for _, index in indexed.getcolors()}
+        slots = tuple(index for index in range(1, TRANSPARENT) if index in used)
+        return cls(indexed, slots)
+
+    def decorate(self, colours: Sequence[RGB]) -> bytes:
+        """
+        Recolour the design with `colours`, returning PNG bytes.
+
+        The n-th replaceable colour used by the design is replaced with the n-th colour. Only the
+        palette is rewritten; pixel data is left untouched.
+        """
+        palette = [channel for colour in INDEXED_COLOURS for channel in colour] + [0, 0, 0]  # Transparent slot
+        for slot, colour in zip(self.slots, colours):
+            palette[slot * 3:slot * 3 + 3] = colour
+
+        im = self.image.copy()
+        im.putpalette(palette)
+
+        bufferedio = BytesIO()
+        im.save(bufferedio, format="PNG", transparency=TRANSPARENT)
+        return bufferedio.getvalue()
+
 
 class EggDecorating(commands.Cog):
     """Decorate some easter eggs!"""
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
+        self.designs = {num: EggDesign.load(DESIGNS / f"design{num}.png") for num in range(1, DESIGN_COUNT + 1)}
+        self.eggs: OrderedDict[Tuple[int, Tuple[RGB, ...]], bytes] = OrderedDict()
+
+    def decorate(self, num: int, colours: List[RGB]) -> bytes:
+        """Return design `num` decorated with `colours` as PNG bytes, reusing recently decorated eggs."""
+        design = self.designs[num]
+        key = num, tuple(colours[:len(design.slots)])
+
+        if key in self.eggs:
+            self.eggs.move_to_end(key)
+            return self.eggs[key]
+
+        egg = self.eggs[key] = design.decorate(colours)
+        if len(self.eggs) > CACHE_SIZE:
+            self.eggs.popitem(last=False)
+
+        return egg
 
     @staticmethod
     def replace_invalid(colour: str) -> Union[int, None]:
         """Attempts to match with HTML or XKCD colour names, returning the int value."""
         with suppress(KeyError):
-            return int(HTML_COLOURS[colour], 16)
+            return int(HTML_COLOURS.data[colour], 16)
         with suppress(KeyError):
-            return int(XKCD_COLOURS[colour], 16)
+            return int(XKCD_COLOURS.data[colour], 16)
         return None
 
     @commands.command(aliases=["decorateegg"])
     async def eggdecorate(
         self, ctx: commands.Context, *colours: Union[discord.Colour, str]
-    ) -> Union[Image.Image, discord.Message]:
+    ) -> Union[bytes, discord.Message]:
         """
         Picks a random egg design and decorates it using the given colours.
 
@@ -78,28 +144,10 @@ class EggDecorating(commands.Cog):
             if colours_n < 8:
                 q, r = divmod(8, colours_n)
                 colours = colours * q + colours[:r]
-            num = random.randint(1, 6)
-            im = Image.open(Path(f"bot/resources/easter/easter_eggs/design{num}.png"))
-            data = list(im.getdata())
-
-            replaceable = {x for x in data if x not in IRREPLACEABLE}
-            replaceable = sorted(replaceable, key=COLOURS.index)
-
-            replacing_colours = {colour: colours[i] for i, colour in enumerate(replaceable)}
-            new_data = []
-            for x in data:
-                if x in replacing_colours:
-                    new_data.append((*replacing_colours[x].to_rgb(), 255))
-                    # Also ensures that the alpha channel has a value
-                else:
-                    new_data.append(x)
-            new_im = Image.new(im.mode, im.size)
-            new_im.putdata(new_data)
-
-            bufferedio = BytesIO()
-            new_im.save(bufferedio, format="PNG")
+            num = random.randint(1, DESIGN_COUNT)
 
-            bufferedio.seek(0)
+            egg = self.decorate(num, [colour.to_rgb() for colour in colours])
+            bufferedio = BytesIO(egg)
 
             file = discord.File(bufferedio, filename="egg.png")  # Creates file to be used in embed
             embed = discord.Embed(
@@ -110,7 +158,7 @@ class EggDecorating(commands.Cog):
             embed.set_footer(text=f"Made by {ctx.author.display_name}", icon_url=ctx.author.avatar_url)
 
         await ctx.send(file=file, embed=embed)
-        return new_im
+        return egg
 
 
 def setup(bot: commands.bot) -> None:
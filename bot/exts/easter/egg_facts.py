@@ -1,17 +1,17 @@
 import logging
-import random
-from json import load
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
 from bot.bot import SeasonalBot
 from bot.constants import Channels, Colours, Month
-from bot.utils.decorators import seasonal_task
+from bot.utils.resources import resource
+from bot.utils.scheduler import Cron, scheduled
 
 log = logging.getLogger(__name__)
 
+FACTS = resource("bot/resources/easter/easter_egg_facts.json", shape=[str])
+
 
 class EasterFacts(commands.Cog):
     """
@@ -22,18 +22,8 @@ class EasterFacts(commands.Cog):
 
     def __init__(self, bot: SeasonalBot):
         self.bot = bot
-        self.facts = self.load_json()
-
-        self.daily_fact_task = self.bot.loop.create_task(self.send_egg_fact_daily())
-
-    @staticmethod
-    def load_json() -> dict:
-        """Load a list of easter egg facts from the resource JSON file."""
-        p = Path("bot/resources/easter/easter_egg_facts.json")
-        with p.open(encoding="utf8") as f:
-            return load(f)
 
-    @seasonal_task(Month.APRIL)
+    @scheduled(Cron("0 0 * * *", months=(Month.APRIL,)), catch_up=True)
     async def send_egg_fact_daily(self) -> None:
         """A background task that sends an easter egg fact in the event channel everyday."""
         await self.bot.wait_until_guild_available()
@@ -52,7 +42,7 @@ class EasterFacts(commands.Cog):
         return discord.Embed(
             colour=Colours.soft_red,
             title="Easter Egg Fact",
-            description=random.choice(self.facts)
+            description=FACTS.choice()
         )
 
 
@@ -1,19 +1,20 @@
 import asyncio
 import logging
-import random
-from json import load
-from pathlib import Path
 from typing import Union
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.dispatch import listen
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/easter/egghead_questions.json"), "r", encoding="utf8") as f:
-    EGGHEAD_QUESTIONS = load(f)
+EGGHEAD_QUESTIONS = resource(
+    "bot/resources/easter/egghead_questions.json",
+    shape=[{"question": str, "answers": [str], "correct_answer": int}]
+)
 
 
 EMOJIS = [
@@ -42,7 +43,7 @@ class EggheadQuiz(commands.Cog):
 
         Also informs of the percentages and votes of each option
         """
-        random_question = random.choice(EGGHEAD_QUESTIONS)
+        random_question = EGGHEAD_QUESTIONS.choice()
         question, answers = random_question["question"], random_question["answers"]
         answers = [(EMOJIS[i], a) for i, a in enumerate(answers)]
         correct = EMOJIS[random_question["correct_answer"]]
@@ -101,11 +102,9 @@ class EggheadQuiz(commands.Cog):
         users = [u.id for reaction in [await r.users().flatten() for r in message.reactions] for u in reaction]
         return users.count(user.id) > 1  # Old reaction plus new reaction
 
-    @commands.Cog.listener()
+    @listen("reaction_add")
     async def on_reaction_add(self, reaction: discord.Reaction, user: Union[discord.Member, discord.User]) -> None:
         """Listener to listen specifically for reactions of quiz messages."""
-        if user.bot:
-            return
         if reaction.message.id not in self.quiz_messages:
             return
         if str(reaction.emoji) not in self.quiz_messages[reaction.message.id]:
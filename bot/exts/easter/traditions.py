@@ -1,14 +1,17 @@
-import json
 import logging
-import random
-from pathlib import Path
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/easter/traditions.json"), "r", encoding="utf8") as f:
-    traditions = json.load(f)
+# Pairs of country and tradition, so that both can be picked at once
+TRADITIONS = resource(
+    "bot/resources/easter/traditions.json",
+    shape={str: str},
+    transform=lambda data: list(data.items())
+)
 
 
 class Traditions(commands.Cog):
@@ -20,9 +23,9 @@ class Traditions(commands.Cog):
     @commands.command(aliases=('eastercustoms',))
     async def easter_tradition(self, ctx: commands.Context) -> None:
         """Responds with a random tradition or custom."""
-        random_country = random.choice(list(traditions))
+        random_country, tradition = TRADITIONS.choice()
 
-        await ctx.send(f"{random_country}:\n{traditions[random_country]}")
+        await ctx.send(f"{random_country}:\n{tradition}")
 
 
 def setup(bot: commands.Bot) -> None:
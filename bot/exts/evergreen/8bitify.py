@@ -5,6 +5,19 @@ from PIL import Image
 from discord.ext import commands
 
 
+def eightbitify(image_bytes: bytes) -> bytes:
+    """Pixelate the image in `image_bytes` and reduce its palette, returning PNG bytes."""
+    avatar = Image.open(BytesIO(image_bytes))
+    avatar = avatar.convert("RGBA").resize((1024, 1024))
+
+    eightbit = EightBitify.pixelate(avatar)
+    eightbit = EightBitify.quantize(eightbit)
+
+    bufferedio = BytesIO()
+    eightbit.save(bufferedio, format="PNG")
+    return bufferedio.getvalue()
+
+
 class EightBitify(commands.Cog):
     """Make your avatar 8bit!"""
 
@@ -26,17 +39,9 @@ class EightBitify(commands.Cog):
         """Pixelates your avatar and changes the palette to an 8bit one."""
         async with ctx.typing():
             image_bytes = await ctx.author.avatar_url.read()
-            avatar = Image.open(BytesIO(image_bytes))
-            avatar = avatar.convert("RGBA").resize((1024, 1024))
-
-            eightbit = self.pixelate(avatar)
-            eightbit = self.quantize(eightbit)
-
-            bufferedio = BytesIO()
-            eightbit.save(bufferedio, format="PNG")
-            bufferedio.seek(0)
+            eightbit = await self.bot.image_pool.submit(eightbitify, image_bytes)
 
-            file = discord.File(bufferedio, filename="8bitavatar.png")
+            file = discord.File(BytesIO(eightbit), filename="8bitavatar.png")
 
             embed = discord.Embed(
                 title="Your 8-bit avatar",
@@ -242,7 +242,7 @@ class Game:
         await self.next.user.send("Their turn", delete_after=3.0)
         while True:
             try:
-                await self.bot.wait_for("message", check=self.predicate, timeout=60.0)
+                await self.bot.sessions.wait_for("message", turn_message.channel.id, check=self.predicate, timeout=60.0)
             except asyncio.TimeoutError:
                 await self.turn.user.send("You took too long. Game over!")
                 await self.next.user.send(f"{self.turn.user} took too long. Game over!")
@@ -393,8 +393,9 @@ class Battleship(commands.Cog):
         await announcement.add_reaction(CROSS_EMOJI)
 
         try:
-            reaction, user = await self.bot.wait_for(
+            reaction, user = await self.bot.sessions.wait_for(
                 "reaction_add",
+                announcement.id,
                 check=partial(self.predicate, ctx, announcement),
                 timeout=60.0
             )
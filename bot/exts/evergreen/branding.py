@@ -1,24 +1,25 @@
 import asyncio
 import itertools
-import json
 import logging
 import random
 import typing as t
-from datetime import datetime, time, timedelta
 from pathlib import Path
+from urllib.parse import quote
 
+import aiohttp
 import arrow
 import discord
 from discord.embeds import EmptyEmbed
 from discord.ext import commands
 
-from bot.bot import SeasonalBot
+from bot.bot import AssetType, SeasonalBot
 from bot.constants import Branding, Colours, Emojis, MODERATION_ROLES, Tokens
 from bot.seasons import SeasonBase, get_all_seasons, get_current_season, get_season
 from bot.utils import human_months
 from bot.utils.decorators import with_role
 from bot.utils.exceptions import BrandingError
-from bot.utils.persist import make_persistent
+from bot.utils.persist import PersistentStore, get_store
+from bot.utils.scheduler import Cron, Job
 
 log = logging.getLogger(__name__)
 
@@ -28,9 +29,11 @@ FILE_BANNER = "banner.png"
 FILE_AVATAR = "avatar.png"
 SERVER_ICONS = "server_icons"
 
-BRANDING_URL = "https://api.github.com/repos/python-discord/branding/contents"
+BRANCH = "master"  # Target branch
+TREE_URL = f"https://api.github.com/repos/python-discord/branding/git/trees/{BRANCH}"
+RAW_URL = f"https://raw.githubusercontent.com/python-discord/branding/{BRANCH}"
 
-PARAMS = {"ref": "master"}  # Target branch
+PARAMS = {"recursive": "1"}  # List the whole repository in a single tree
 HEADERS = {"Accept": "application/vnd.github.v3+json"}  # Ensure we use API v3
 
 # A GitHub token is not necessary for the cog to operate,
@@ -38,6 +41,13 @@ HEADERS = {"Accept": "application/vnd.github.v3+json"}  # Ensure we use API v3
 if Tokens.github:
     HEADERS["Authorization"] = f"token {Tokens.github}"
 
+SYMLINK_MODE = "120000"  # Git file mode of symlinks, which are blobs in trees
+
+DAEMON_JOB = "BrandingManager.daemon"
+DAEMON_SCHEDULE = Cron("0 0 * * *")  # Every day at midnight UTC
+
+Upload = t.Callable[[str, str], t.Awaitable[bool]]
+
 
 class GitHubFile(t.NamedTuple):
     """
@@ -57,20 +67,6 @@ def pretty_files(files: t.Iterable[GitHubFile]) -> str:
     return "\n".join(file.path for file in files)
 
 
-def time_until_midnight() -> timedelta:
-    """
-    Determine amount of time until the next-up UTC midnight.
-
-    The exact `midnight` moment is actually delayed to 5 seconds after, in order
-    to avoid potential problems due to imprecise sleep.
-    """
-    now = datetime.utcnow()
-    tomorrow = now + timedelta(days=1)
-    midnight = datetime.combine(tomorrow, time(second=5))
-
-    return midnight - now
-
-
 class BrandingManager(commands.Cog):
     """
     Manages the guild's branding.
@@ -80,11 +76,12 @@ class BrandingManager(commands.Cog):
     via GitHub's API, resolving download urls for them, and delegating
     to the `bot` instance to upload them to the guild.
 
-    BrandingManager is designed to be entirely autonomous. Its `daemon` background task awakens
-    once a day (see `time_until_midnight`) to detect new seasons, or to cycle icons within a single
-    season. The daemon can be turned on and off via the `daemon` cmd group. The value set via
-    its `start` and `stop` commands is persisted across sessions. If turned on, the daemon will
-    automatically start on the next bot start-up. Otherwise, it will wait to be started manually.
+    BrandingManager is designed to be entirely autonomous. Its `daemon` scheduled job runs
+    once a day (see `DAEMON_SCHEDULE`) to detect branding changes, or to cycle icons within a single
+    season, and right away whenever a new season starts. The daemon can be turned on and off via
+    the `daemon` cmd group. The value set via its `start` and `stop` commands is persisted across
+    sessions. If turned on, the daemon will automatically start on the next bot start-up.
+    Otherwise, it will wait to be started manually.
 
     All supported operations, e.g. setting seasons, applying the branding, or cycling icons, can
     also be invoked manually, via the following API:
@@ -133,9 +130,12 @@ class BrandingManager(commands.Cog):
 
     days_since_cycle: t.Iterator
 
-    config_file: Path
+    config: PersistentStore
+
+    daemon: t.Optional[Job]
 
-    daemon: t.Optional[asyncio.Task]
+    index: t.Dict[str, t.Dict[str, GitHubFile]]
+    tree_sha: t.Optional[str]
 
     def __init__(self, bot: SeasonalBot) -> None:
         """
@@ -156,31 +156,25 @@ class BrandingManager(commands.Cog):
 
         self.days_since_cycle = itertools.cycle([None])
 
-        self.config_file = make_persistent(Path("bot", "resources", "evergreen", "branding.json"))
-        should_run = self._read_config()["daemon_active"]
+        self.index = {}
+        self.tree_sha = None
+
+        self.config = get_store(Path("bot", "resources", "evergreen", "branding.json"))
+        should_run = self.config["daemon_active"]
 
         if should_run:
-            self.daemon = self.bot.loop.create_task(self._daemon_func())
+            self._start_daemon()
         else:
             self.daemon = None
 
     @property
     def _daemon_running(self) -> bool:
         """True if the daemon is currently active, False otherwise."""
-        return self.daemon is not None and not self.daemon.done()
-
-    def _read_config(self) -> t.Dict[str, bool]:
-        """Read and return persistent config file."""
-        with self.config_file.open("r", encoding="utf8") as persistent_file:
-            return json.load(persistent_file)
+        return self.daemon is not None and self.bot.scheduler.jobs.get(DAEMON_JOB) is self.daemon
 
-    def _write_config(self, key: str, value: bool) -> None:
-        """Write a `key`, `value` pair to persistent config file."""
-        current_config = self._read_config()
-        current_config[key] = value
-
-        with self.config_file.open("w", encoding="utf8") as persistent_file:
-            json.dump(current_config, persistent_file)
+    def _start_daemon(self) -> None:
+        """Schedule the daemon, running it right away."""
+        self.daemon = self.bot.scheduler.schedule(DAEMON_JOB, self._daemon_func, DAEMON_SCHEDULE, run_now=True)
 
     async def _daemon_func(self) -> None:
         """
@@ -191,27 +185,37 @@ class BrandingManager(commands.Cog):
             - Poll GitHub API to see if the available branding for `current_season` has changed
             - Update assets if changes are detected (banner, guild icon, bot avatar, bot nickname)
             - Check whether it's time to cycle guild icons
+            - Download the next guild icon ahead of time, so that cycling to it is cheap
 
-        The internal loop runs once when activated, then periodically at the time
-        given by `time_until_midnight`.
+        The daemon runs once when activated, then on `DAEMON_SCHEDULE`.
 
-        All method calls in the internal loop are considered safe, i.e. no errors propagate
-        to the daemon's loop. The daemon itself does not perform any error handling on its own.
+        All method calls in the daemon are considered safe, i.e. no errors propagate
+        to the scheduler. The daemon itself does not perform any error handling on its own.
         """
         await self.bot.wait_until_guild_available()
 
-        while True:
-            self.current_season = get_current_season()
-            branding_changed = await self.refresh()
+        self.current_season = get_current_season()
+        branding_changed = await self.refresh()
 
-            if branding_changed:
-                await self.apply()
+        if branding_changed:
+            await self.apply()
 
-            elif next(self.days_since_cycle) == Branding.cycle_frequency:
-                await self.cycle()
+        elif next(self.days_since_cycle) == Branding.cycle_frequency:
+            await self.cycle()
 
-            until_midnight = time_until_midnight()
-            await asyncio.sleep(until_midnight.total_seconds())
+        await self._prefetch_next_icon()
+
+    @commands.Cog.listener()
+    async def on_season_change(self, previous: t.Type[SeasonBase], season: t.Type[SeasonBase]) -> None:
+        """
+        Run the daemon right away when a new season starts, so the new branding is applied without delay.
+
+        Nothing is done if the daemon is stopped, or if it is already running, as it reads the season
+        when it starts.
+        """
+        if self._daemon_running and not self.daemon.running:
+            log.info(f"Season changed to {season.season_name}, running the daemon")
+            self._start_daemon()
 
     async def _info_embed(self) -> discord.Embed:
         """Make an informative embed representing current season."""
@@ -245,6 +249,42 @@ class BrandingManager(commands.Cog):
         """Set `remaining_icons` to a shuffled copy of `available_icons`."""
         self.remaining_icons = random.sample(self.available_icons, k=len(self.available_icons))
 
+    async def _prefetch_next_icon(self) -> None:
+        """
+        Download and optimize the next-up server icon into the bot's asset cache.
+
+        Errors are only logged, as the icon is then simply downloaded when it gets applied.
+        """
+        if not self.available_icons:
+            return
+
+        if not self.remaining_icons:
+            await self._reset_remaining_icons()
+
+        next_up = self.remaining_icons[0]
+        try:
+            await self.bot.prepare_asset(AssetType.SERVER_ICON, next_up.download_url, next_up.sha)
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            log.warning(f"Failed to prefetch the next server icon {next_up.path}", exc_info=True)
+
+    async def _upload(self, asset: AssetType, file: GitHubFile, upload: Upload, force: bool = False) -> bool:
+        """
+        Upload `file` as `asset` with `upload`, unless it is already the applied `asset`.
+
+        The sha of each successfully uploaded asset is persisted, so that unchanged assets aren't
+        uploaded again, even across restarts. If `force` is True, `file` is uploaded regardless.
+        """
+        if not force and self.config.get("applied", {}).get(asset.value) == file.sha:
+            log.info(f"Skipping the {asset.value} upload, {file.path} is already applied")
+            return True
+
+        success = await upload(file.download_url, file.sha)
+        if success:
+            # Read again, as uploads of the other assets run concurrently and may have stored theirs meanwhile
+            self.config["applied"] = {**self.config.get("applied", {}), asset.value: file.sha}
+
+        return success
+
     async def _reset_days_since_cycle(self) -> None:
         """
         Reset the `days_since_cycle` iterator based on configured frequency.
@@ -262,36 +302,57 @@ class BrandingManager(commands.Cog):
 
         self.days_since_cycle = itertools.cycle(sequence)
 
-    async def _get_files(self, path: str, include_dirs: bool = False) -> t.Dict[str, GitHubFile]:
+    async def _index_tree(self) -> None:
+        """
+        Index the files of the branding repository by directory, from a single recursive trees request.
+
+        The request is revalidated against the disk cache, so it costs nothing against the rate limit
+        when the repository hasn't changed, in which case the index is kept as is. If the request
+        fails, the previous index is kept as well.
         """
-        Get files at `path` in the branding repository.
+        resp = await self.bot.http_service.get(TREE_URL, headers=HEADERS, params=PARAMS, revalidate=True)
 
-        If `include_dirs` is False (default), only returns files at `path`.
-        Otherwise, will return both files and directories. Never returns symlinks.
+        if resp.status != STATUS_OK:
+            log.error(f"GitHub API returned non-200 response: {resp.status} from {resp.url}")
+            return
+        tree = resp.json()
+
+        if tree["sha"] == self.tree_sha:
+            return
+
+        if tree["truncated"]:
+            log.warning("The branding repository is too large to be listed at once, some assets may be missing")
+
+        index = {}
+        for entry in tree["tree"]:
+            # Directories are implied by the paths of their files, and symlinks are never followed
+            if entry["type"] != "blob" or entry["mode"] == SYMLINK_MODE:
+                continue
+
+            directory, _, name = entry["path"].rpartition("/")
+            file = GitHubFile(f"{RAW_URL}/{quote(entry['path'])}", entry["path"], entry["sha"])
+            index.setdefault(directory, {})[name] = file
+
+        self.index, self.tree_sha = index, tree["sha"]
+        log.debug(f"Indexed {len(index)} directories of the branding repository at {self.tree_sha}")
+
+    def _get_files(self, path: str) -> t.Dict[str, GitHubFile]:
+        """
+        Get files at `path` in the branding repository, from the index.
 
         Return dict mapping from filename to corresponding `GitHubFile` instance.
-        This may return an empty dict if the response status is non-200,
-        or if the target directory is empty.
+        This may return an empty dict if the directory doesn't exist, or if the
+        repository hasn't been indexed.
         """
-        url = f"{BRANDING_URL}/{path}"
-        async with self.bot.http_session.get(url, headers=HEADERS, params=PARAMS) as resp:
-            # Short-circuit if we get non-200 response
-            if resp.status != STATUS_OK:
-                log.error(f"GitHub API returned non-200 response: {resp}")
-                return {}
-            directory = await resp.json()  # Directory at `path`
-
-        allowed_types = {"file", "dir"} if include_dirs else {"file"}
-        return {
-            file["name"]: GitHubFile(file["download_url"], file["path"], file["sha"])
-            for file in directory
-            if file["type"] in allowed_types
-        }
-
-    async def refresh(self) -> bool:
+        return self.index.get(path, {})
+
+    async def refresh(self, reindex: bool = True) -> bool:
         """
         Synchronize available assets with branding repository.
 
+        The repository is indexed again first, unless `reindex` is False and it was already
+        indexed, in which case the assets are resolved without any network call.
+
         If the current season is not the evergreen, and lacks at least one asset,
         we use the evergreen seasonal dir as fallback for missing assets.
 
@@ -303,33 +364,26 @@ class BrandingManager(commands.Cog):
         in the branding repository.
         """
         old_branding = (self.banner, self.avatar, self.available_icons)
-        seasonal_dir = await self._get_files(self.current_season.branding_path, include_dirs=True)
-
-        # Only make a call to the fallback directory if there is something to be gained
-        branding_incomplete = any(
-            asset not in seasonal_dir
-            for asset in (FILE_BANNER, FILE_AVATAR, SERVER_ICONS)
-        )
-        if branding_incomplete and self.current_season is not SeasonBase:
-            fallback_dir = await self._get_files(SeasonBase.branding_path, include_dirs=True)
+
+        if reindex or self.tree_sha is None:
+            await self._index_tree()
+
+        seasonal_path = self.current_season.branding_path
+        seasonal_dir = self._get_files(seasonal_path)
+        seasonal_icons = self._get_files(f"{seasonal_path}/{SERVER_ICONS}")
+
+        if self.current_season is not SeasonBase:
+            fallback_dir = self._get_files(SeasonBase.branding_path)
+            fallback_icons = self._get_files(f"{SeasonBase.branding_path}/{SERVER_ICONS}")
         else:
-            fallback_dir = {}
+            fallback_dir = fallback_icons = {}
 
         # Resolve assets in this directory, None is a safe value
         self.banner = seasonal_dir.get(FILE_BANNER) or fallback_dir.get(FILE_BANNER)
         self.avatar = seasonal_dir.get(FILE_AVATAR) or fallback_dir.get(FILE_AVATAR)
 
-        # Now resolve server icons by making a call to the proper sub-directory
-        if SERVER_ICONS in seasonal_dir:
-            icons_dir = await self._get_files(f"{self.current_season.branding_path}/{SERVER_ICONS}")
-            self.available_icons = list(icons_dir.values())
-
-        elif SERVER_ICONS in fallback_dir:
-            icons_dir = await self._get_files(f"{SeasonBase.branding_path}/{SERVER_ICONS}")
-            self.available_icons = list(icons_dir.values())
-
-        else:
-            self.available_icons = []  # This should never be the case, but an empty list is a safe value
+        # Icons are taken from a single directory, an empty list is a safe value if neither has any
+        self.available_icons = list((seasonal_icons or fallback_icons).values())
 
         # GitHubFile instances carry a `sha` attr so this will pick up if a file changes
         branding_changed = old_branding != (self.banner, self.avatar, self.available_icons)
@@ -341,10 +395,12 @@ class BrandingManager(commands.Cog):
 
         return branding_changed
 
-    async def cycle(self) -> bool:
+    async def cycle(self, force: bool = False) -> bool:
         """
         Apply the next-up server icon.
 
+        The upload is skipped if the icon is already applied, unless `force` is True.
+
         Returns True if an icon is available and successfully gets applied, False otherwise.
         """
         if not self.available_icons:
@@ -356,16 +412,17 @@ class BrandingManager(commands.Cog):
             await self._reset_remaining_icons()
 
         next_up = self.remaining_icons.pop(0)
-        success = await self.bot.set_icon(next_up.download_url)
+        success = await self._upload(AssetType.SERVER_ICON, next_up, self.bot.set_icon, force)
 
         return success
 
-    async def apply(self) -> t.List[str]:
+    async def apply(self, force: bool = False) -> t.List[str]:
         """
         Apply current branding to the guild and bot.
 
-        This delegates to the bot instance to do all the work. We only provide download urls
-        for available assets. Assets unavailable in the branding repo will be ignored.
+        This delegates to the bot instance to do all the work, uploading all assets concurrently.
+        We only provide download urls for available assets. Assets unavailable in the branding
+        repo will be ignored. Assets which are already applied are skipped, unless `force` is True.
 
         Returns a list of names of all failed assets. An asset is considered failed
         if it isn't found in the branding repo, or if something goes wrong while the
@@ -374,17 +431,20 @@ class BrandingManager(commands.Cog):
         An empty list denotes that all assets have been applied successfully.
         """
         report = {asset: False for asset in ("banner", "avatar", "nickname", "icon")}
+        uploads = {}
 
         if self.banner is not None:
-            report["banner"] = await self.bot.set_banner(self.banner.download_url)
+            uploads["banner"] = self._upload(AssetType.BANNER, self.banner, self.bot.set_banner, force)
 
         if self.avatar is not None:
-            report["avatar"] = await self.bot.set_avatar(self.avatar.download_url)
+            uploads["avatar"] = self._upload(AssetType.AVATAR, self.avatar, self.bot.set_avatar, force)
 
         if self.current_season.bot_name:
-            report["nickname"] = await self.bot.set_nickname(self.current_season.bot_name)
+            uploads["nickname"] = self.bot.set_nickname(self.current_season.bot_name)
+
+        uploads["icon"] = self.cycle(force)
 
-        report["icon"] = await self.cycle()
+        report.update(zip(uploads, await asyncio.gather(*uploads.values())))
 
         failed_assets = [asset for asset, succeeded in report.items() if not succeeded]
         return failed_assets
@@ -445,7 +505,11 @@ class BrandingManager(commands.Cog):
             raise BrandingError(f"Season {self.current_season.season_name} already active")
 
         self.current_season = new_season
-        await self.branding_refresh(ctx)
+
+        # Previews are resolved from the index, without asking GitHub again
+        async with ctx.typing():
+            await self.refresh(reindex=False)
+            await self.branding_info(ctx)
 
     @branding_cmds.command(name="info", aliases=["status"])
     async def branding_info(self, ctx: commands.Context) -> None:
@@ -469,11 +533,11 @@ class BrandingManager(commands.Cog):
         """
         Apply current season's branding to the guild.
 
-        Use `info` to check which assets will be applied. Shows which assets have
-        failed to be applied, if any.
+        Use `info` to check which assets will be applied. Assets are uploaded even if they
+        are already applied. Shows which assets have failed to be applied, if any.
         """
         async with ctx.typing():
-            failed_assets = await self.apply()
+            failed_assets = await self.apply(force=True)
             if failed_assets:
                 raise BrandingError(f"Failed to apply following assets: {', '.join(failed_assets)}")
 
@@ -505,7 +569,7 @@ class BrandingManager(commands.Cog):
     async def daemon_status(self, ctx: commands.Context) -> None:
         """Check whether daemon is currently active."""
         if self._daemon_running:
-            remaining_time = (arrow.utcnow() + time_until_midnight()).humanize()
+            remaining_time = arrow.get(self.daemon.next_run).humanize()
             response = discord.Embed(description=f"Daemon running {Emojis.ok_hand}", colour=Colours.soft_green)
             response.set_footer(text=f"Next refresh {remaining_time}")
         else:
@@ -519,8 +583,8 @@ class BrandingManager(commands.Cog):
         if self._daemon_running:
             raise BrandingError("Daemon already running!")
 
-        self.daemon = self.bot.loop.create_task(self._daemon_func())
-        self._write_config("daemon_active", True)
+        self._start_daemon()
+        self.config["daemon_active"] = True
 
         response = discord.Embed(description=f"Daemon started {Emojis.ok_hand}", colour=Colours.soft_green)
         await ctx.send(embed=response)
@@ -531,8 +595,9 @@ class BrandingManager(commands.Cog):
         if not self._daemon_running:
             raise BrandingError("Daemon not running!")
 
-        self.daemon.cancel()
-        self._write_config("daemon_active", False)
+        self.bot.scheduler.cancel(DAEMON_JOB)
+        self.daemon = None
+        self.config["daemon_active"] = False
 
         response = discord.Embed(description=f"Daemon stopped {Emojis.ok_hand}", colour=Colours.soft_green)
         await ctx.send(embed=response)
@@ -1,34 +1,32 @@
-from pathlib import Path
-
-import yaml
 from discord import Color, Embed
 from discord.ext import commands
 
 from bot.constants import WHITELISTED_CHANNELS
 from bot.utils.decorators import override_in_channel
 from bot.utils.randomization import RandomCycle
+from bot.utils.resources import resource
 
 SUGGESTION_FORM = 'https://forms.gle/zw6kkJqv8U43Nfjg9'
 
-with Path("bot/resources/evergreen/starter.yaml").open("r", encoding="utf8") as f:
-    STARTERS = yaml.load(f, Loader=yaml.FullLoader)
 
-with Path("bot/resources/evergreen/py_topics.yaml").open("r", encoding="utf8") as f:
-    # First ID is #python-general and the rest are top to bottom categories of Topical Chat/Help.
-    PY_TOPICS = yaml.load(f, Loader=yaml.FullLoader)
+def make_cycles(py_topics: dict) -> dict:
+    """Shuffle the topics of each channel to reduce same-topic repetitions."""
+    cycles = {}
+    for channel, topics in py_topics.items():
+        # Removing `None` from lists of topics, if not a list, it is changed to an empty one.
+        topics = [i for i in topics if i] if isinstance(topics, list) else []
+        cycles[channel] = RandomCycle(topics or ['No topics found for this channel.'])
+    return cycles
+
 
-    # Removing `None` from lists of topics, if not a list, it is changed to an empty one.
-    PY_TOPICS = {k: [i for i in v if i] if isinstance(v, list) else [] for k, v in PY_TOPICS.items()}
+STARTERS = resource("bot/resources/evergreen/starter.yaml", shape=[str], transform=RandomCycle)
 
-    # All the allowed channels that the ".topic" command is allowed to be executed in.
-    ALL_ALLOWED_CHANNELS = list(PY_TOPICS.keys()) + list(WHITELISTED_CHANNELS)
+# First ID is #python-general and the rest are top to bottom categories of Topical Chat/Help.
+PY_TOPICS = resource("bot/resources/evergreen/py_topics.yaml", shape={int: object}, transform=make_cycles)
 
-# Putting all topics into one dictionary and shuffling lists to reduce same-topic repetitions.
-ALL_TOPICS = {'default': STARTERS, **PY_TOPICS}
-TOPICS = {
-    channel: RandomCycle(topics or ['No topics found for this channel.'])
-    for channel, topics in ALL_TOPICS.items()
-}
+# All the allowed channels that the ".topic" command is allowed to be executed in.
+# The decorator needs these when the module is imported, so this file is loaded eagerly.
+ALL_ALLOWED_CHANNELS = list(PY_TOPICS.data) + list(WHITELISTED_CHANNELS)
 
 
 class ConvoStarters(commands.Cog):
@@ -52,11 +50,11 @@ class ConvoStarters(commands.Cog):
 
         try:
             # Fetching topics.
-            channel_topics = TOPICS[ctx.channel.id]
+            channel_topics = PY_TOPICS.data[ctx.channel.id]
 
         # If the channel isn't Python-related.
         except KeyError:
-            embed.title = f'**{next(TOPICS["default"])}**'
+            embed.title = f'**{next(STARTERS.data)}**'
 
         # If the channel ID doesn't have any topics.
         else:
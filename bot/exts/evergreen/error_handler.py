@@ -9,7 +9,7 @@ from sentry_sdk import push_scope
 
 from bot.constants import Colours, ERROR_REPLIES, NEGATIVE_REPLIES
 from bot.utils.decorators import InChannelCheckFailure, InMonthCheckFailure
-from bot.utils.exceptions import BrandingError, UserNotPlayingError
+from bot.utils.exceptions import BrandingError, ImageProcessingError, RateLimitedError, UserNotPlayingError
 
 log = logging.getLogger(__name__)
 
@@ -107,6 +107,10 @@ class CommandErrorHandler(commands.Cog):
             await ctx.send("Game not found.")
             return
 
+        if isinstance(error, (ImageProcessingError, RateLimitedError)):
+            await ctx.send(embed=self.error_embed(str(error), NEGATIVE_REPLIES))
+            return
+
         with push_scope() as scope:
             scope.user = {
                 "id": ctx.author.id,
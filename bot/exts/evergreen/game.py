@@ -8,13 +8,14 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from aiohttp import ClientSession
 from discord import Embed
-from discord.ext import tasks
 from discord.ext.commands import Cog, Context, group
 
 from bot.bot import SeasonalBot
 from bot.constants import STAFF_ROLES, Tokens
 from bot.utils.decorators import with_role
+from bot.utils.fuzzy import FuzzyIndex
 from bot.utils.pagination import ImagePaginator, LinePaginator
+from bot.utils.scheduler import Every, scheduled
 
 # Base URL of IGDB API
 BASE_URL = "https://api-v3.igdb.com"
@@ -127,6 +128,11 @@ class AgeRatings(IntEnum):
     AO = 12
 
 
+def genre_ratio(query: str, genre: str) -> float:
+    """Return the similarity of `query` and `genre`, rounded to two decimals."""
+    return round(difflib.SequenceMatcher(None, query, genre).ratio(), 2)
+
+
 class Games(Cog):
     """Games Cog contains commands that collect data from IGDB."""
 
@@ -135,10 +141,9 @@ class Games(Cog):
         self.http_session: ClientSession = bot.http_session
 
         self.genres: Dict[str, int] = {}
+        self.genre_index = FuzzyIndex(())
 
-        self.refresh_genres_task.start()
-
-    @tasks.loop(hours=24.0)
+    @scheduled(Every(days=1), run_now=True)
     async def refresh_genres_task(self) -> None:
         """Refresh genres in every hour."""
         try:
@@ -148,11 +153,6 @@ class Games(Cog):
             return
         logger.info("Successfully refreshed genres.")
 
-    def cog_unload(self) -> None:
-        """Cancel genres refreshing start when unloading Cog."""
-        self.refresh_genres_task.cancel()
-        logger.info("Successfully stopped Genres Refreshing task.")
-
     async def _get_genres(self) -> None:
         """Create genres variable for games command."""
         body = "fields name; limit 100;"
@@ -169,6 +169,11 @@ class Games(Cog):
             else:
                 self.genres[genre_name] = genre
 
+        # Genres also match on each of their words
+        self.genre_index = FuzzyIndex(
+            self.genres, aliases={genre: REGEX_NON_ALPHABET.split(genre) for genre in self.genres}
+        )
+
     @group(name="games", aliases=["game"], invoke_without_command=True)
     async def games(self, ctx: Context, amount: Optional[int] = 5, *, genre: Optional[str] = None) -> None:
         """
@@ -406,13 +411,7 @@ class Games(Cog):
 
     async def get_best_results(self, query: str) -> List[Tuple[float, str]]:
         """Get best match result of genre when original genre is invalid."""
-        results = []
-        for genre in self.genres:
-            ratios = [difflib.SequenceMatcher(None, query, genre).ratio()]
-            for word in REGEX_NON_ALPHABET.split(genre):
-                ratios.append(difflib.SequenceMatcher(None, query, word).ratio())
-            results.append((round(max(ratios), 2), genre))
-        return sorted((item for item in results if item[0] >= 0.60), reverse=True)[:4]
+        return self.genre_index.search(query, scorer=genre_ratio, cutoff=0.60, limit=4)
 
 
 def setup(bot: SeasonalBot) -> None:
@@ -4,16 +4,18 @@ import itertools
 import logging
 from collections import namedtuple
 from contextlib import suppress
-from typing import Union
+from typing import FrozenSet, Optional, Tuple, Union
 
 from discord import Colour, Embed, HTTPException, Message, Reaction, User
 from discord.ext import commands
 from discord.ext.commands import CheckFailure, Cog as DiscordCog, Command, Context
-from fuzzywuzzy import fuzz, process
+from fuzzywuzzy import fuzz
+from fuzzywuzzy.utils import full_process
 
 from bot import constants
 from bot.bot import SeasonalBot
 from bot.constants import Emojis
+from bot.utils.fuzzy import FuzzyIndex
 from bot.utils.pagination import (
     FIRST_EMOJI, LAST_EMOJI,
     LEFT_EMOJI, LinePaginator, RIGHT_EMOJI,
@@ -71,6 +73,9 @@ class HelpSession:
     the regular description (class docstring) of the first cog found in the category.
     """
 
+    # Command and cog names, and the index built from them to suggest close matches for unknown queries
+    _index: Optional[Tuple[FrozenSet[str], FuzzyIndex]] = None
+
     def __init__(
         self,
         ctx: Context,
@@ -151,11 +156,15 @@ class HelpSession:
         Will pass on possible close matches along with the `HelpQueryNotFound` exception.
         """
         # Combine command and cog names
-        choices = list(self._bot.all_commands) + list(self._bot.cogs)
+        choices = frozenset(self._bot.all_commands) | frozenset(self._bot.cogs)
+
+        # Only rebuild the index when extensions were loaded or unloaded since it was built
+        if HelpSession._index is None or HelpSession._index[0] != choices:
+            HelpSession._index = (choices, FuzzyIndex(choices, processor=full_process))
 
-        result = process.extractBests(query, choices, scorer=fuzz.ratio, score_cutoff=90)
+        result = HelpSession._index[1].search(query, scorer=fuzz.ratio, cutoff=90)
 
-        raise HelpQueryNotFound(f'Query "{query}" not found.', dict(result))
+        raise HelpQueryNotFound(f'Query "{query}" not found.', {choice: score for score, choice in result})
 
     async def timeout(self, seconds: int = 30) -> None:
         """Waits for a set number of seconds, then stops the help session."""
@@ -174,10 +183,6 @@ class HelpSession:
 
     async def on_reaction_add(self, reaction: Reaction, user: User) -> None:
         """Event handler for when reactions are added on the help message."""
-        # ensure it was the relevant session message
-        if reaction.message.id != self.message.id:
-            return
-
         # ensure it was the session author who reacted
         if user.id != self.author.id:
             return
@@ -201,17 +206,17 @@ class HelpSession:
 
     async def on_message_delete(self, message: Message) -> None:
         """Closes the help session when the help message is deleted."""
-        if message.id == self.message.id:
-            await self.stop()
+        await self.stop()
 
     async def prepare(self) -> None:
-        """Sets up the help session pages, events, message and reactions."""
+        """Sets up the help session pages, message, events and reactions."""
         await self.build_pages()
+        await self.update_page()
 
-        self._bot.add_listener(self.on_reaction_add)
-        self._bot.add_listener(self.on_message_delete)
+        # Only events on the help message are routed to the session
+        self._bot.sessions.subscribe("reaction_add", self.message.id, self.on_reaction_add)
+        self._bot.sessions.subscribe("message_delete", self.message.id, self.on_message_delete)
 
-        await self.update_page()
         self.add_reactions()
 
     def add_reactions(self) -> None:
@@ -446,8 +451,9 @@ class HelpSession:
 
     async def stop(self) -> None:
         """Stops the help session, removes event listeners and attempts to delete the help message."""
-        self._bot.remove_listener(self.on_reaction_add)
-        self._bot.remove_listener(self.on_message_delete)
+        if self.message is not None:
+            self._bot.sessions.unsubscribe("reaction_add", self.message.id, self.on_reaction_add)
+            self._bot.sessions.unsubscribe("message_delete", self.message.id, self.on_message_delete)
 
         # ignore if permission issue, or the message doesn't exist
         with suppress(HTTPException, AttributeError):
@@ -59,8 +59,8 @@ class Issues(commands.Cog):
             merge_url = f"https://api.github.com/repos/{user}/{repository}/pulls/{number}/merge"
 
             log.trace(f"Querying GH issues API: {url}")
-            async with self.bot.http_session.get(url, headers=REQUEST_HEADERS) as r:
-                json_data = await r.json()
+            r = await self.bot.http_service.get(url, headers=REQUEST_HEADERS, revalidate=True)
+            json_data = r.json()
 
             if r.status in BAD_RESPONSE:
                 log.warning(f"Received response {r.status} from: {url}")
@@ -81,14 +81,14 @@ class Issues(commands.Cog):
             # to get the desired information for the PR.
             else:
                 log.trace(f"PR provided, querying GH pulls API for additional information: {merge_url}")
-                async with self.bot.http_session.get(merge_url) as m:
-                    if json_data.get("state") == "open":
-                        icon_url = Emojis.pull_request
-                    # When the status is 204 this means that the state of the PR is merged
-                    elif m.status == 204:
-                        icon_url = Emojis.merge
-                    else:
-                        icon_url = Emojis.pull_request_closed
+                m = await self.bot.http_service.get(merge_url, headers=REQUEST_HEADERS)
+                if json_data.get("state") == "open":
+                    icon_url = Emojis.pull_request
+                # When the status is 204 this means that the state of the PR is merged
+                elif m.status == 204:
+                    icon_url = Emojis.merge
+                else:
+                    icon_url = Emojis.pull_request_closed
 
             issue_url = json_data.get("html_url")
             links.append([icon_url, f"[{repository}] #{number} {json_data.get('title')}", issue_url])
@@ -1,26 +1,25 @@
-import json
 import logging
-import random
-from pathlib import Path
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
+ANSWERS = resource("bot/resources/evergreen/magic8ball.json", shape=[str])
+
 
 class Magic8ball(commands.Cog):
     """A Magic 8ball command to respond to a user's question."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        with open(Path("bot/resources/evergreen/magic8ball.json"), "r", encoding="utf8") as file:
-            self.answers = json.load(file)
 
     @commands.command(name="8ball")
     async def output_answer(self, ctx: commands.Context, *, question: str) -> None:
         """Return a Magic 8ball answer from answers list."""
         if len(question.split()) >= 3:
-            answer = random.choice(self.answers)
+            answer = ANSWERS.choice()
             await ctx.send(answer)
         else:
             await ctx.send("Usage: .8ball <question> (minimum length of 3 eg: `will I win?`)")
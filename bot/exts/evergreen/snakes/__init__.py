@@ -3,10 +3,13 @@ import logging
 from discord.ext import commands
 
 from bot.exts.evergreen.snakes._snakes_cog import Snakes
+from bot.exts.evergreen.snakes._utils import BOARD_IMAGE
+from bot.utils.assets import image_cache
 
 log = logging.getLogger(__name__)
 
 
 def setup(bot: commands.Bot) -> None:
     """Snakes Cog load."""
+    image_cache.preload(BOARD_IMAGE)
     bot.add_cog(Snakes(bot))
@@ -1,7 +1,6 @@
 import json
 import logging
 import random
-from typing import Iterable, List
 
 import discord
 from discord.ext.commands import Context, Converter
@@ -9,15 +8,25 @@ from fuzzywuzzy import fuzz
 
 from bot.exts.evergreen.snakes._utils import SNAKE_RESOURCES
 from bot.utils import disambiguate
+from bot.utils.fuzzy import FuzzyIndex
 
 log = logging.getLogger(__name__)
 
+THRESHOLD = 80  # Minimum score of a snake name to be offered as a choice
+
+
+def score(query: str, name: str) -> int:
+    """Score `name` as the better of its similarity to `query` and its best matching substring's."""
+    return max(fuzz.ratio(query, name), fuzz.partial_ratio(query, name))
+
 
 class Snake(Converter):
     """Snake converter for the Snakes Cog."""
 
     snakes = None
     special_cases = None
+    names = None
+    index = None
 
     async def convert(self, ctx: Context, name: str) -> str:
         """Convert the input snake name to the closest matching Snake object."""
@@ -27,45 +36,36 @@ class Snake(Converter):
         if name == 'python':
             return 'Python (programming language)'
 
-        def get_potential(iterable: Iterable, *, threshold: int = 80) -> List[str]:
-            nonlocal name
-            potential = []
-
-            for item in iterable:
-                original, item = item, item.lower()
-
-                if name == item:
-                    return [original]
-
-                a, b = fuzz.ratio(name, item), fuzz.partial_ratio(name, item)
-                if a >= threshold or b >= threshold:
-                    potential.append(original)
-
-            return potential
-
         # Handle special cases
         if name.lower() in self.special_cases:
             return self.special_cases.get(name.lower(), name.lower())
 
-        names = {snake['name']: snake['scientific'] for snake in self.snakes}
-        all_names = names.keys() | names.values()
-        timeout = len(all_names) * (3 / 4)
+        exact = self.index.get(name)
+        if exact is not None:
+            potential = [exact]
+        else:
+            potential = [match for _, match in self.index.search(name, scorer=score, cutoff=THRESHOLD, limit=None)]
+
+        timeout = len(self.index) * (3 / 4)
 
         embed = discord.Embed(
             title='Found multiple choices. Please choose the correct one.', colour=0x59982F)
         embed.set_author(name=ctx.author.display_name, icon_url=ctx.author.avatar_url)
 
-        name = await disambiguate(ctx, get_potential(all_names), timeout=timeout, embed=embed)
-        return names.get(name, name)
+        name = await disambiguate(ctx, potential, timeout=timeout, embed=embed)
+        return self.names.get(name, name)
 
     @classmethod
     async def build_list(cls) -> None:
-        """Build list of snakes from the static snake resources."""
+        """Build list of snakes from the static snake resources, and the index to search their names."""
         # Get all the snakes
         if cls.snakes is None:
             with (SNAKE_RESOURCES / "snake_names.json").open(encoding="utf8") as snakefile:
                 cls.snakes = json.load(snakefile)
 
+            cls.names = {snake['name']: snake['scientific'] for snake in cls.snakes}
+            cls.index = FuzzyIndex(cls.names.keys() | cls.names.values())
+
         # Get the special cases
         if cls.special_cases is None:
             with (SNAKE_RESOURCES / "special_snakes.json").open(encoding="utf8") as snakefile:
@@ -7,11 +7,9 @@ import re
 import string
 import textwrap
 import urllib
-from functools import partial
 from io import BytesIO
 from typing import Any, Dict, List
 
-import aiohttp
 import async_timeout
 from PIL import Image, ImageDraw, ImageFont
 from discord import Colour, Embed, File, Member, Message, Reaction
@@ -90,6 +88,7 @@ MSG_MAX = 100
 
 # get_snek constants
 URL = "https://en.wikipedia.org/w/api.php?"
+WIKI_CACHE_TTL = 60 * 60  # Snake articles rarely change, reuse responses for an hour
 
 # snake guess responses
 INCORRECT_GUESS = (
@@ -169,13 +168,13 @@ class Snakes(Cog):
         return int(hex_rgb, 16)
 
     @staticmethod
-    def _generate_card(buffer: BytesIO, content: dict) -> BytesIO:
+    def _generate_card(image_bytes: bytes, content: dict) -> bytes:
         """
-        Generate a card from snake information.
+        Generate a card from snake information, returning PNG bytes.
 
-        Written by juan and Someone during the first code jam.
+        Runs in the image worker pool. Written by juan and Someone during the first code jam.
         """
-        snake = Image.open(buffer)
+        snake = Image.open(BytesIO(image_bytes))
 
         # Get the size of the snake icon, configure the height of the image box (yes, it changes)
         icon_width = 347  # Hardcoded, not much i can do about that
@@ -242,12 +241,11 @@ class Snakes(Cog):
             draw.text([margin + 4, offset], line, font=CARD['font'])
             offset += CARD['font'].getsize(line)[1]
 
-        # Get the image contents as a BufferIO object
+        # Get the image contents as PNG bytes
         buffer = BytesIO()
         full_image.save(buffer, 'PNG')
-        buffer.seek(0)
 
-        return buffer
+        return buffer.getvalue()
 
     @staticmethod
     def _snakify(message: str) -> str:
@@ -272,14 +270,13 @@ class Snakes(Cog):
 
         return message
 
-    async def _fetch(self, session: aiohttp.ClientSession, url: str, params: dict = None) -> dict:
+    async def _fetch(self, url: str, params: dict = None) -> dict:
         """Asynchronous web request helper method."""
         if params is None:
             params = {}
 
         async with async_timeout.timeout(10):
-            async with session.get(url, params=params) as response:
-                return await response.json()
+            return await self.bot.http_service.get_json(url, params=params, ttl=WIKI_CACHE_TTL)
 
     def _get_random_long_message(self, messages: List[str], retries: int = 10) -> str:
         """
@@ -306,96 +303,95 @@ class Snakes(Cog):
         """
         snake_info = {}
 
-        async with aiohttp.ClientSession() as session:
-            params = {
-                'format': 'json',
-                'action': 'query',
-                'list': 'search',
-                'srsearch': name,
-                'utf8': '',
-                'srlimit': '1',
-            }
-
-            json = await self._fetch(session, URL, params=params)
-
-            # Wikipedia does have a error page
-            try:
-                pageid = json["query"]["search"][0]["pageid"]
-            except KeyError:
-                # Wikipedia error page ID(?)
-                pageid = 41118
-            except IndexError:
-                return None
-
-            params = {
-                'format': 'json',
-                'action': 'query',
-                'prop': 'extracts|images|info',
-                'exlimit': 'max',
-                'explaintext': '',
-                'inprop': 'url',
-                'pageids': pageid
-            }
+        params = {
+            'format': 'json',
+            'action': 'query',
+            'list': 'search',
+            'srsearch': name,
+            'utf8': '',
+            'srlimit': '1',
+        }
 
-            json = await self._fetch(session, URL, params=params)
+        json = await self._fetch(URL, params=params)
 
-            # Constructing dict - handle exceptions later
-            try:
-                snake_info["title"] = json["query"]["pages"][f"{pageid}"]["title"]
-                snake_info["extract"] = json["query"]["pages"][f"{pageid}"]["extract"]
-                snake_info["images"] = json["query"]["pages"][f"{pageid}"]["images"]
-                snake_info["fullurl"] = json["query"]["pages"][f"{pageid}"]["fullurl"]
-                snake_info["pageid"] = json["query"]["pages"][f"{pageid}"]["pageid"]
-            except KeyError:
-                snake_info["error"] = True
-
-            if snake_info["images"]:
-                i_url = 'https://commons.wikimedia.org/wiki/Special:FilePath/'
-                image_list = []
-                map_list = []
-                thumb_list = []
-
-                # Wikipedia has arbitrary images that are not snakes
-                banned = [
-                    'Commons-logo.svg',
-                    'Red%20Pencil%20Icon.png',
-                    'distribution',
-                    'The%20Death%20of%20Cleopatra%20arthur.jpg',
-                    'Head%20of%20holotype',
-                    'locator',
-                    'Woma.png',
-                    '-map.',
-                    '.svg',
-                    'ange.',
-                    'Adder%20(PSF).png'
-                ]
-
-                for image in snake_info["images"]:
-                    # Images come in the format of `File:filename.extension`
-                    file, sep, filename = image["title"].partition(':')
-                    filename = filename.replace(" ", "%20")  # Wikipedia returns good data!
-
-                    if not filename.startswith('Map'):
-                        if any(ban in filename for ban in banned):
-                            pass
-                        else:
-                            image_list.append(f"{i_url}{filename}")
-                            thumb_list.append(f"{i_url}{filename}?width=100")
+        # Wikipedia does have a error page
+        try:
+            pageid = json["query"]["search"][0]["pageid"]
+        except KeyError:
+            # Wikipedia error page ID(?)
+            pageid = 41118
+        except IndexError:
+            return None
+
+        params = {
+            'format': 'json',
+            'action': 'query',
+            'prop': 'extracts|images|info',
+            'exlimit': 'max',
+            'explaintext': '',
+            'inprop': 'url',
+            'pageids': pageid
+        }
+
+        json = await self._fetch(URL, params=params)
+
+        # Constructing dict - handle exceptions later
+        try:
+            snake_info["title"] = json["query"]["pages"][f"{pageid}"]["title"]
+            snake_info["extract"] = json["query"]["pages"][f"{pageid}"]["extract"]
+            snake_info["images"] = json["query"]["pages"][f"{pageid}"]["images"]
+            snake_info["fullurl"] = json["query"]["pages"][f"{pageid}"]["fullurl"]
+            snake_info["pageid"] = json["query"]["pages"][f"{pageid}"]["pageid"]
+        except KeyError:
+            snake_info["error"] = True
+
+        if snake_info["images"]:
+            i_url = 'https://commons.wikimedia.org/wiki/Special:FilePath/'
+            image_list = []
+            map_list = []
+            thumb_list = []
+
+            # Wikipedia has arbitrary images that are not snakes
+            banned = [
+                'Commons-logo.svg',
+                'Red%20Pencil%20Icon.png',
+                'distribution',
+                'The%20Death%20of%20Cleopatra%20arthur.jpg',
+                'Head%20of%20holotype',
+                'locator',
+                'Woma.png',
+                '-map.',
+                '.svg',
+                'ange.',
+                'Adder%20(PSF).png'
+            ]
+
+            for image in snake_info["images"]:
+                # Images come in the format of `File:filename.extension`
+                file, sep, filename = image["title"].partition(':')
+                filename = filename.replace(" ", "%20")  # Wikipedia returns good data!
+
+                if not filename.startswith('Map'):
+                    if any(ban in filename for ban in banned):
+                        pass
                     else:
-                        map_list.append(f"{i_url}{filename}")
+                        image_list.append(f"{i_url}{filename}")
+                        thumb_list.append(f"{i_url}{filename}?width=100")
+                else:
+                    map_list.append(f"{i_url}{filename}")
 
-            snake_info["image_list"] = image_list
-            snake_info["map_list"] = map_list
-            snake_info["thumb_list"] = thumb_list
-            snake_info["name"] = name
+        snake_info["image_list"] = image_list
+        snake_info["map_list"] = map_list
+        snake_info["thumb_list"] = thumb_list
+        snake_info["name"] = name
 
-            match = self.wiki_brief.match(snake_info['extract'])
-            info = match.group(1) if match else None
+        match = self.wiki_brief.match(snake_info['extract'])
+        info = match.group(1) if match else None
 
-            if info:
-                info = info.replace("\n", "\n\n")  # Give us some proper paragraphs.
+        if info:
+            info = info.replace("\n", "\n\n")  # Give us some proper paragraphs.
 
-            snake_info["info"] = info
+        snake_info["info"] = info
 
         return snake_info
 
@@ -408,8 +404,7 @@ class Snakes(Cog):
         def predicate(reaction: Reaction, user: Member) -> bool:
             """Test if the the answer is valid and can be evaluated."""
             return (
-                reaction.message.id == message.id                  # The reaction is attached to the question we asked.
-                and user == ctx.author                             # It's the user who triggered the quiz.
+                user == ctx.author                                 # It's the user who triggered the quiz.
                 and str(reaction.emoji) in ANSWERS_EMOJI.values()  # The reaction is one of the options.
             )
 
@@ -418,7 +413,7 @@ class Snakes(Cog):
 
         # Validate the answer
         try:
-            reaction, user = await ctx.bot.wait_for("reaction_add", timeout=45.0, check=predicate)
+            reaction, user = await ctx.bot.sessions.wait_for("reaction_add", message.id, timeout=45.0, check=predicate)
         except asyncio.TimeoutError:
             await ctx.channel.send(f"You took too long. The correct answer was **{options[answer]}**.")
             await message.clear_reactions()
@@ -462,8 +457,6 @@ class Snakes(Cog):
             """Make sure that this reaction is what we want to operate on."""
             return (
                 all((
-                    # Reaction is on this message
-                    reaction_.message.id == board_id.id,
                     # Reaction is one of the pagination emotes
                     reaction_.emoji in ANTIDOTE_EMOJI,
                     # Reaction was not made by the Bot
@@ -509,8 +502,8 @@ class Snakes(Cog):
         # Begin main game loop
         while not win and antidote_tries < 10:
             try:
-                reaction, user = await ctx.bot.wait_for(
-                    "reaction_add", timeout=300, check=predicate)
+                reaction, user = await ctx.bot.sessions.wait_for(
+                    "reaction_add", board_id.id, timeout=300, check=predicate)
             except asyncio.TimeoutError:
                 log.debug("Antidote timed out waiting for a reaction")
                 break  # We're done, no reactions for the last 5 minutes
@@ -988,15 +981,11 @@ class Snakes(Cog):
         # Make the card
         async with ctx.typing():
 
-            stream = BytesIO()
             async with async_timeout.timeout(10):
-                async with self.bot.http_session.get(content['image_list'][0]) as response:
-                    stream.write(await response.read())
-
-            stream.seek(0)
+                image_bytes = await self.bot.http_service.get_bytes(content['image_list'][0])
 
-            func = partial(self._generate_card, stream, content)
-            final_buffer = await self.bot.loop.run_in_executor(None, func)
+            card = await self.bot.image_pool.submit(self._generate_card, image_bytes, content)
+            final_buffer = BytesIO(card)
 
         # Send it!
         await ctx.send(
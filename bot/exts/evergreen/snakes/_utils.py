@@ -14,8 +14,10 @@ from discord import File, Member, Reaction
 from discord.ext.commands import Cog, Context
 
 from bot.constants import Roles
+from bot.utils.assets import image_cache
 
 SNAKE_RESOURCES = Path("bot/resources/snakes").absolute()
+BOARD_IMAGE = SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg"
 
 h1 = r'''```
         ----
@@ -350,6 +352,22 @@ def frame_to_png_bytes(image: Image) -> io.BytesIO:
     return stream
 
 
+def resize_player_icon(avatar_bytes: bytes) -> bytes:
+    """Shrink an avatar down to the size of a board player icon, returning PNG bytes."""
+    im = Image.open(io.BytesIO(avatar_bytes)).resize((BOARD_PLAYER_SIZE, BOARD_PLAYER_SIZE))
+    return frame_to_png_bytes(im).getvalue()
+
+
+def render_board(placements: List[Tuple[bytes, Tuple[int, int]]]) -> bytes:
+    """Paste each player icon onto the board at its offset, returning PNG bytes."""
+    board_img = image_cache.get(BOARD_IMAGE)
+
+    for icon_bytes, offset in placements:
+        board_img.paste(Image.open(io.BytesIO(icon_bytes)), box=offset)
+
+    return frame_to_png_bytes(board_img).getvalue()
+
+
 log = logging.getLogger(__name__)
 START_EMOJI = "\u2611"     # :ballot_box_with_check: - Start the game
 CANCEL_EMOJI = "\u274C"    # :x: - Cancel or leave the game
@@ -394,7 +412,6 @@ class SnakeAndLaddersGame:
             """Make sure that this reaction is what we want to operate on."""
             return (
                 all((
-                    reaction_.message.id == startup.id,       # Reaction is on startup message
                     reaction_.emoji in STARTUP_SCREEN_EMOJI,  # Reaction is one of the startup emotes
                     user_.id != self.ctx.bot.user.id,         # Reaction was not made by the bot
                 ))
@@ -427,8 +444,9 @@ class SnakeAndLaddersGame:
 
         while not self.started:
             try:
-                reaction, user = await self.ctx.bot.wait_for(
+                reaction, user = await self.ctx.bot.sessions.wait_for(
                     "reaction_add",
+                    startup.id,
                     timeout=300,
                     check=startup_event_check
                 )
@@ -461,8 +479,7 @@ class SnakeAndLaddersGame:
         self.player_tiles[user.id] = 1
 
         avatar_bytes = await user.avatar_url_as(format='jpeg', size=PLAYER_ICON_IMAGE_SIZE).read()
-        im = Image.open(io.BytesIO(avatar_bytes)).resize((BOARD_PLAYER_SIZE, BOARD_PLAYER_SIZE))
-        self.avatar_images[user.id] = im
+        self.avatar_images[user.id] = await self.ctx.bot.image_pool.submit(resize_player_icon, avatar_bytes)
 
     async def player_join(self, user: Member) -> None:
         """
@@ -550,7 +567,6 @@ class SnakeAndLaddersGame:
             """Make sure that this reaction is what we want to operate on."""
             return (
                 all((
-                    reaction_.message.id == self.positions.id,  # Reaction is on positions message
                     reaction_.emoji in GAME_SCREEN_EMOJI,       # Reaction is one of the game emotes
                     user_.id != self.ctx.bot.user.id,           # Reaction was not made by the bot
                 ))
@@ -559,7 +575,7 @@ class SnakeAndLaddersGame:
         self.state = 'roll'
         for user in self.players:
             self.round_has_rolled[user.id] = False
-        board_img = Image.open(str(SNAKE_RESOURCES / "snakes_and_ladders" / "board.jpg"))
+        placements = []
         player_row_size = math.ceil(MAX_PLAYERS / 2)
 
         for i, player in enumerate(self.players):
@@ -571,10 +587,10 @@ class SnakeAndLaddersGame:
                     (10 * BOARD_TILE_SIZE) - (9 - tile_coordinates[1]) * BOARD_TILE_SIZE - BOARD_PLAYER_SIZE)
             x_offset += BOARD_PLAYER_SIZE * (i % player_row_size)
             y_offset -= BOARD_PLAYER_SIZE * math.floor(i / player_row_size)
-            board_img.paste(self.avatar_images[player.id],
-                            box=(x_offset, y_offset))
+            placements.append((self.avatar_images[player.id], (x_offset, y_offset)))
 
-        board_file = File(frame_to_png_bytes(board_img), filename='Board.jpg')
+        board_img = await self.ctx.bot.image_pool.submit(render_board, placements)
+        board_file = File(io.BytesIO(board_img), filename='Board.jpg')
         player_list = '\n'.join((user.mention + ": Tile " + str(self.player_tiles[user.id])) for user in self.players)
 
         # Store and send new messages
@@ -607,8 +623,9 @@ class SnakeAndLaddersGame:
         is_surrendered = False
         while True:
             try:
-                reaction, user = await self.ctx.bot.wait_for(
+                reaction, user = await self.ctx.bot.sessions.wait_for(
                     "reaction_add",
+                    self.positions.id,
                     timeout=300,
                     check=game_event_check
                 )
@@ -5,11 +5,11 @@ from typing import Any, Dict, Optional, Union
 from urllib.parse import urlencode
 
 from discord import Embed
-from discord.ext import tasks
 from discord.ext.commands import BadArgument, Cog, Context, Converter, group
 
 from bot.bot import SeasonalBot
 from bot.constants import Tokens
+from bot.utils.scheduler import Every, scheduled
 
 logger = logging.getLogger(__name__)
 
@@ -42,13 +42,8 @@ class Space(Cog):
         self.http_session = bot.http_session
 
         self.rovers = {}
-        self.get_rovers.start()
 
-    def cog_unload(self) -> None:
-        """Cancel `get_rovers` task when Cog will unload."""
-        self.get_rovers.cancel()
-
-    @tasks.loop(hours=24)
+    @scheduled(Every(days=1), run_now=True)
     async def get_rovers(self) -> None:
         """Get listing of rovers from NASA API and info about their start and end dates."""
         data = await self.fetch_from_nasa("mars-photos/api/v1/rovers")
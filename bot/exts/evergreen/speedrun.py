@@ -1,13 +1,12 @@
-import json
 import logging
-from pathlib import Path
-from random import choice
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
-with Path('bot/resources/evergreen/speedrun_links.json').open(encoding="utf8") as file:
-    LINKS = json.load(file)
+
+LINKS = resource("bot/resources/evergreen/speedrun_links.json", shape=[str])
 
 
 class Speedrun(commands.Cog):
@@ -19,7 +18,7 @@ class Speedrun(commands.Cog):
     @commands.command(name="speedrun")
     async def get_speedrun(self, ctx: commands.Context) -> None:
         """Sends a link to a video of a random speedrun."""
-        await ctx.send(choice(LINKS))
+        await ctx.send(LINKS.choice())
 
 
 def setup(bot: commands.Bot) -> None:
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import logging
 import random
@@ -9,10 +10,15 @@ from discord.ext import commands
 from fuzzywuzzy import fuzz
 
 from bot.constants import Roles
+from bot.utils.leaderboard import Leaderboard
+from bot.utils.pagination import LazyLines, LinePaginator
+from bot.utils.persist import DIRECTORY
 
 
 logger = logging.getLogger(__name__)
 
+SCORES_FILE = Path(DIRECTORY, "evergreen", "trivia_scores.json")
+
 
 WRONG_ANS_RESPONSE = [
     "No one answered correctly!",
@@ -20,6 +26,11 @@ WRONG_ANS_RESPONSE = [
 ]
 
 
+def format_score(rank: int, user_id: int, points: float) -> str:
+    """Format a line of a score board."""
+    return f"{rank}. <@{user_id}> : {points:.0f}"
+
+
 class TriviaQuiz(commands.Cog):
     """A cog for all quiz commands."""
 
@@ -29,7 +40,7 @@ class TriviaQuiz(commands.Cog):
         self.game_status = {}  # A variable to store the game status: either running or not running.
         self.game_owners = {}  # A variable to store the person's ID who started the quiz game in a channel.
         self.question_limit = 4
-        self.player_scores = {}  # A variable to store all player's scores for a bot session.
+        self.player_scores = Leaderboard.load(SCORES_FILE)  # All player's scores, saved after every game.
         self.game_player_scores = {}  # A variable to store temporary game player's scores.
         self.categories = {
             "general": "Test your general knowledge"
@@ -57,7 +68,7 @@ class TriviaQuiz(commands.Cog):
             self.game_status[ctx.channel.id] = False
 
         if ctx.channel.id not in self.game_player_scores:
-            self.game_player_scores[ctx.channel.id] = {}
+            self.game_player_scores[ctx.channel.id] = Leaderboard()
 
         # Stop game if running.
         if self.game_status[ctx.channel.id] is True:
@@ -98,7 +109,8 @@ class TriviaQuiz(commands.Cog):
 
                 self.game_status[ctx.channel.id] = False
                 del self.game_owners[ctx.channel.id]
-                self.game_player_scores[ctx.channel.id] = {}
+                self.game_player_scores[ctx.channel.id] = Leaderboard()
+                await self.player_scores.save(SCORES_FILE)
 
                 break
 
@@ -122,10 +134,10 @@ class TriviaQuiz(commands.Cog):
             # A function to check whether user input is the correct answer(close to the right answer)
             def check(m: discord.Message) -> bool:
                 ratio = fuzz.ratio(answer.lower(), m.content.lower())
-                return ratio > 85 and m.channel == ctx.channel
+                return ratio > 85
 
             try:
-                msg = await self.bot.wait_for('message', check=check, timeout=10)
+                msg = await self.bot.sessions.wait_for('message', ctx.channel.id, check=check, timeout=10)
             except asyncio.TimeoutError:
                 # In case of TimeoutError and the game has been stopped, then do nothing.
                 if self.game_status[ctx.channel.id] is False:
@@ -162,16 +174,10 @@ class TriviaQuiz(commands.Cog):
 
                 # Reduce points by 25 for every hint/time alert that has been sent.
                 points = 100 - 25*hint_no
-                if msg.author in self.game_player_scores[ctx.channel.id]:
-                    self.game_player_scores[ctx.channel.id][msg.author] += points
-                else:
-                    self.game_player_scores[ctx.channel.id][msg.author] = points
+                self.game_player_scores[ctx.channel.id].add(msg.author.id, points)
 
                 # Also updating the overall scoreboard.
-                if msg.author in self.player_scores:
-                    self.player_scores[msg.author] += points
-                else:
-                    self.player_scores[msg.author] = points
+                self.player_scores.add(msg.author.id, points)
 
                 hint_no = 0
 
@@ -211,7 +217,8 @@ class TriviaQuiz(commands.Cog):
 
                 self.game_status[ctx.channel.id] = False
                 del self.game_owners[ctx.channel.id]
-                self.game_player_scores[ctx.channel.id] = {}
+                self.game_player_scores[ctx.channel.id] = Leaderboard()
+                await self.player_scores.save(SCORES_FILE)
             else:
                 await ctx.send(f"{ctx.author.mention}, you are not authorised to stop this game :ghost:!")
         else:
@@ -219,11 +226,17 @@ class TriviaQuiz(commands.Cog):
 
     @quiz_game.command(name="leaderboard")
     async def leaderboard(self, ctx: commands.Context) -> None:
-        """View everyone's score for this bot session."""
-        await self.send_score(ctx.channel, self.player_scores)
+        """View everyone's score."""
+        if not self.player_scores:
+            await ctx.send("No one has made it onto the leaderboard yet.")
+            return
+
+        embed = discord.Embed(colour=discord.Colour.blue(), title="Score Board")
+        lines = LazyLines(len(self.player_scores), functools.partial(self.player_scores.lines, format_score))
+        await LinePaginator.paginate(lines, ctx, embed, max_lines=15, max_size=2000, empty=False)
 
     @staticmethod
-    async def send_score(channel: discord.TextChannel, player_data: dict) -> None:
+    async def send_score(channel: discord.TextChannel, player_data: Leaderboard) -> None:
         """A function which sends the score."""
         if len(player_data) == 0:
             await channel.send("No one has made it onto the leaderboard yet.")
@@ -231,38 +244,20 @@ class TriviaQuiz(commands.Cog):
 
         embed = discord.Embed(colour=discord.Colour.blue())
         embed.title = "Score Board"
-        embed.description = ""
-
-        sorted_dict = sorted(player_data.items(), key=lambda a: a[1], reverse=True)
-        for item in sorted_dict:
-            embed.description += f"{item[0]} : {item[1]}\n"
+        embed.description = "\n".join(player_data.lines(format_score))
 
         await channel.send(embed=embed)
 
     @staticmethod
-    async def declare_winner(channel: discord.TextChannel, player_data: dict) -> None:
+    async def declare_winner(channel: discord.TextChannel, player_data: Leaderboard) -> None:
         """Announce the winner of the quiz in the game channel."""
         if player_data:
-            highest_points = max(list(player_data.values()))
-            no_of_winners = list(player_data.values()).count(highest_points)
+            winners = player_data.leaders()
+            highest_points = player_data[winners[0]]
 
             # Check if more than 1 player has highest points.
-            if no_of_winners > 1:
-                word = "You guys"
-                winners = []
-                points_copy = list(player_data.values()).copy()
-
-                for _ in range(no_of_winners):
-                    index = points_copy.index(highest_points)
-                    winners.append(list(player_data.keys())[index])
-                    points_copy[index] = 0
-
-                winners_mention = " ".join(winner.mention for winner in winners)
-            else:
-                word = "You"
-                author_index = list(player_data.values()).index(highest_points)
-                winner = list(player_data.keys())[author_index]
-                winners_mention = winner.mention
+            word = "You guys" if len(winners) > 1 else "You"
+            winners_mention = " ".join(f"<@{winner}>" for winner in winners)
 
             await channel.send(
                 f"Congratulations {winners_mention} :tada: "
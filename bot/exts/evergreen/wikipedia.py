@@ -54,7 +54,7 @@ class WikipediaSearch(commands.Cog):
         titles = await self.search_wikipedia(search)
 
         def check(message: Message) -> bool:
-            return message.author.id == ctx.author.id and message.channel == ctx.channel
+            return message.author.id == ctx.author.id
 
         if not titles:
             await ctx.send("Sorry, we could not find a wikipedia article using that search term")
@@ -78,7 +78,7 @@ class WikipediaSearch(commands.Cog):
             else:
                 error_msg = 'Please try again by using `.wiki` command'
             try:
-                message = await ctx.bot.wait_for('message', timeout=60.0, check=check)
+                message = await ctx.bot.sessions.wait_for('message', ctx.channel.id, timeout=60.0, check=check)
                 response_from_user = await self.bot.get_context(message)
 
                 if response_from_user.command:
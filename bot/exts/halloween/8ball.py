@@ -1,15 +1,14 @@
 import asyncio
-import json
 import logging
 import random
-from pathlib import Path
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/halloween/responses.json"), "r", encoding="utf8") as f:
-    responses = json.load(f)
+RESPONSES = resource("bot/resources/halloween/responses.json", shape={"responses": [[str]]})
 
 
 class SpookyEightBall(commands.Cog):
@@ -21,7 +20,7 @@ class SpookyEightBall(commands.Cog):
     @commands.command(aliases=('spooky8ball',))
     async def spookyeightball(self, ctx: commands.Context, *, question: str) -> None:
         """Responds with a random response to a question."""
-        choice = random.choice(responses['responses'])
+        choice = RESPONSES.choice("responses")
         msg = await ctx.send(choice[0])
         if len(choice) > 1:
             await asyncio.sleep(random.randint(2, 5))
@@ -1,19 +1,39 @@
-import functools
+import asyncio
 import json
 import logging
-import os
 import random
-from typing import List, Union
+import sqlite3
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Union
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Channels, Month
+from bot.utils.database import Database
 from bot.utils.decorators import in_month
+from bot.utils.dispatch import listen
+from bot.utils.leaderboard import Leaderboard
 
 log = logging.getLogger(__name__)
 
-json_location = os.path.join("bot", "resources", "halloween", "candy_collection.json")
+DATABASE = Path("halloween", "candy_collection.sqlite3")
+
+# Where the game was stored before it moved to the database, imported once into a new database
+LEGACY_JSON = Path("bot", "resources", "halloween", "candy_collection.json")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reactions (
+    message_id INTEGER NOT NULL,
+    reaction TEXT NOT NULL,
+    user_id INTEGER,  -- The user who claimed the reaction, if anyone did yet
+    PRIMARY KEY (message_id, reaction)
+);
+CREATE TABLE IF NOT EXISTS records (
+    user_id INTEGER PRIMARY KEY,
+    candy INTEGER NOT NULL DEFAULT 0
+);
+"""
 
 # chance is 1 in x range, so 1 in 20 range would give 5% chance (for add candy)
 ADD_CANDY_REACTION_CHANCE = 10  # 10%
@@ -22,53 +42,110 @@ ADD_SKULL_REACTION_CHANCE = 15  # 5%
 ADD_SKULL_EXISTING_REACTION_CHANCE = 20  # 5%
 
 
+class Claim(NamedTuple):
+    """The outcome of claiming a candy or skull reaction."""
+
+    candy: Optional[int]  # The user's candy afterwards, None if they have no record
+    lost: Optional[int]  # For skulls, the candy lost; 0 if they lost all of it
+
+
+def import_legacy_json(db: sqlite3.Connection) -> None:
+    """Import the records and reactions of the old JSON file, if the database is still empty."""
+    if db.execute("SELECT 1 FROM records LIMIT 1").fetchone() is not None:
+        return
+
+    with LEGACY_JSON.open(encoding="utf8") as f:
+        legacy = json.load(f)
+
+    with db:
+        db.executemany(
+            "INSERT OR IGNORE INTO records (user_id, candy) VALUES (?, ?)",
+            ((record["userid"], record["record"]) for record in legacy["records"])
+        )
+        db.executemany(
+            "INSERT OR IGNORE INTO reactions (message_id, reaction, user_id) VALUES (?, ?, ?)",
+            ((react["msg_id"], react["reaction"], react.get("user_reacted")) for react in legacy["msg_reacted"])
+        )
+
+    if legacy["records"]:
+        log.info(f"Imported {len(legacy['records'])} candy records from {LEGACY_JSON}")
+
+
+def claim(db: sqlite3.Connection, message_id: int, reaction: str, user_id: int) -> Optional[Claim]:
+    """
+    Let `user_id` claim the candy or skull reaction on `message_id`, in a single transaction.
+
+    Return None if the reaction can't be claimed, i.e. it doesn't exist or somebody claimed it already.
+    A skull takes 1 to 3 candies away, or all of them if the user had 3 or less.
+    """
+    with db:
+        claimed = db.execute(
+            "UPDATE reactions SET user_id = ? WHERE message_id = ? AND reaction = ? AND user_id IS NULL",
+            (user_id, message_id, reaction)
+        ).rowcount
+        if not claimed:
+            return None
+
+        if reaction == '\N{CANDY}':
+            db.execute(
+                "INSERT INTO records (user_id, candy) VALUES (?, 1) "
+                "ON CONFLICT (user_id) DO UPDATE SET candy = candy + 1",
+                (user_id,)
+            )
+            candy, = db.execute("SELECT candy FROM records WHERE user_id = ?", (user_id,)).fetchone()
+            return Claim(candy, None)
+
+        row = db.execute("SELECT candy FROM records WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            return Claim(None, None)
+
+        lost = 0 if row[0] <= 3 else random.randint(1, 3)
+        candy = row[0] - lost if lost else 0
+        db.execute("UPDATE records SET candy = ? WHERE user_id = ?", (candy, user_id))
+        return Claim(candy, lost)
+
+
 class CandyCollection(commands.Cog):
     """Candy collection game Cog."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        with open(json_location, encoding="utf8") as candy:
-            self.candy_json = json.load(candy)
-            self.msg_reacted = self.candy_json['msg_reacted']
-        self.get_candyinfo = dict()
-        for userinfo in self.candy_json['records']:
-            userid = userinfo['userid']
-            self.get_candyinfo[userid] = userinfo
+        self.db = Database(DATABASE, SCHEMA)
+        self.leaderboard = Leaderboard()  # Mirrors the records, kept ranked as candy is won and lost
+        self.loaded = asyncio.Event()  # Set once the leaderboard is built; claims wait for it so none are lost
+        self.bot.loop.create_task(self.load())
+
+    async def load(self) -> None:
+        """Import the old JSON file if necessary, and rank the records."""
+        await self.db.run(import_legacy_json)
+        self.leaderboard = Leaderboard(dict(await self.db.fetchall("SELECT user_id, candy FROM records")))
+        self.loaded.set()
+
+    def cog_unload(self) -> None:
+        """Close the database."""
+        self.bot.loop.create_task(self.db.close())
+
+    async def add_reaction(self, message: discord.Message, reaction: str) -> None:
+        """Add a candy or skull `reaction` to `message`, and store it so that it can be claimed."""
+        await self.db.execute(
+            "INSERT OR IGNORE INTO reactions (message_id, reaction) VALUES (?, ?)", (message.id, reaction)
+        )
+        await message.add_reaction(reaction)
 
-    @in_month(Month.OCTOBER)
-    @commands.Cog.listener()
+    @listen("message", channels=(Channels.seasonalbot_commands,), months=(Month.OCTOBER,))
     async def on_message(self, message: discord.Message) -> None:
         """Randomly adds candy or skull reaction to non-bot messages in the Event channel."""
-        # make sure its a human message
-        if message.author.bot:
-            return
-        # ensure it's hacktober channel
-        if message.channel.id != Channels.seasonalbot_commands:
-            return
-
         # do random check for skull first as it has the lower chance
         if random.randint(1, ADD_SKULL_REACTION_CHANCE) == 1:
-            d = {"reaction": '\N{SKULL}', "msg_id": message.id, "won": False}
-            self.msg_reacted.append(d)
-            return await message.add_reaction('\N{SKULL}')
+            return await self.add_reaction(message, '\N{SKULL}')
         # check for the candy chance next
         if random.randint(1, ADD_CANDY_REACTION_CHANCE) == 1:
-            d = {"reaction": '\N{CANDY}', "msg_id": message.id, "won": False}
-            self.msg_reacted.append(d)
-            return await message.add_reaction('\N{CANDY}')
+            return await self.add_reaction(message, '\N{CANDY}')
 
-    @in_month(Month.OCTOBER)
-    @commands.Cog.listener()
+    @listen("reaction_add", channels=(Channels.seasonalbot_commands,), months=(Month.OCTOBER,))
     async def on_reaction_add(self, reaction: discord.Reaction, user: discord.Member) -> None:
         """Add/remove candies from a person if the reaction satisfies criteria."""
         message = reaction.message
-        # check to ensure the reactor is human
-        if user.bot:
-            return
-
-        # check to ensure it is in correct channel
-        if message.channel.id != Channels.seasonalbot_commands:
-            return
 
         # if its not a candy or skull, and it is one of 10 most recent messages,
         # proceed to add a skull/candy with higher chance
@@ -77,33 +154,17 @@ class CandyCollection(commands.Cog):
                 await self.reacted_msg_chance(message)
             return
 
-        for react in self.msg_reacted:
-            # check to see if the message id of a message we added a
-            # reaction to is in json file, and if nobody has won/claimed it yet
-            if react['msg_id'] == message.id and react['won'] is False:
-                react['user_reacted'] = user.id
-                react['won'] = True
-                try:
-                    # if they have record/candies in json already it will do this
-                    user_records = self.get_candyinfo[user.id]
-                    if str(reaction.emoji) == '\N{CANDY}':
-                        user_records['record'] += 1
-                    if str(reaction.emoji) == '\N{SKULL}':
-                        if user_records['record'] <= 3:
-                            user_records['record'] = 0
-                            lost = 'all of your'
-                        else:
-                            lost = random.randint(1, 3)
-                            user_records['record'] -= lost
-                        await self.send_spook_msg(message.author, message.channel, lost)
-
-                except KeyError:
-                    # otherwise it will raise KeyError so we need to add them to file
-                    if str(reaction.emoji) == '\N{CANDY}':
-                        print('ok')
-                        d = {"userid": user.id, "record": 1}
-                        self.candy_json['records'].append(d)
-                await self.remove_reactions(reaction)
+        # claim the reaction if we added it to this message and nobody has claimed it yet
+        await self.loaded.wait()
+        result = await self.db.run(claim, message.id, str(reaction.emoji), user.id)
+        if result is None:
+            return
+
+        if result.candy is not None:
+            self.leaderboard.set(user.id, result.candy)
+        if result.lost is not None:
+            await self.send_spook_msg(message.author, message.channel, result.lost or 'all of your')
+        await self.remove_reactions(reaction)
 
     async def reacted_msg_chance(self, message: discord.Message) -> None:
         """
@@ -113,14 +174,10 @@ class CandyCollection(commands.Cog):
         existing reaction.
         """
         if random.randint(1, ADD_SKULL_EXISTING_REACTION_CHANCE) == 1:
-            d = {"reaction": '\N{SKULL}', "msg_id": message.id, "won": False}
-            self.msg_reacted.append(d)
-            return await message.add_reaction('\N{SKULL}')
+            return await self.add_reaction(message, '\N{SKULL}')
 
         if random.randint(1, ADD_CANDY_EXISTING_REACTION_CHANCE) == 1:
-            d = {"reaction": '\N{CANDY}', "msg_id": message.id, "won": False}
-            self.msg_reacted.append(d)
-            return await message.add_reaction('\N{CANDY}')
+            return await self.add_reaction(message, '\N{CANDY}')
 
     async def ten_recent_msg(self) -> List[int]:
         """Get the last 10 messages sent in the channel."""
@@ -176,19 +233,10 @@ class CandyCollection(commands.Cog):
                           f"I took {candies} candies and quickly took flight.")
         await channel.send(embed=e)
 
-    def save_to_json(self) -> None:
-        """Save JSON to a local file."""
-        with open(json_location, 'w', encoding="utf8") as outfile:
-            json.dump(self.candy_json, outfile)
-
     @in_month(Month.OCTOBER)
     @commands.command()
     async def candy(self, ctx: commands.Context) -> None:
-        """Get the candy leaderboard and save to JSON."""
-        # Use run_in_executor to prevent blocking
-        thing = functools.partial(self.save_to_json)
-        await self.bot.loop.run_in_executor(None, thing)
-
+        """Get the candy leaderboard."""
         emoji = (
             '\N{FIRST PLACE MEDAL}',
             '\N{SECOND PLACE MEDAL}',
@@ -197,14 +245,14 @@ class CandyCollection(commands.Cog):
             '\N{SPORTS MEDAL}'
         )
 
-        top_sorted = sorted(self.candy_json['records'], key=lambda k: k.get('record', 0), reverse=True)
-        top_five = top_sorted[:5]
+        await self.loaded.wait()
+        top_five = self.leaderboard.top(5)
 
         usersid = []
         records = []
-        for record in top_five:
-            usersid.append(record['userid'])
-            records.append(record['record'])
+        for userid, record in top_five:
+            usersid.append(userid)
+            records.append(record)
 
         value = '\n'.join(f'{emoji[index]} <@{usersid[index]}>: {records[index]}'
                           for index in range(0, len(usersid))) or 'No Candies'
@@ -3,7 +3,6 @@ import logging
 import random
 from typing import Dict, Optional
 
-import aiohttp
 import discord
 from discord.ext import commands
 
@@ -53,40 +52,39 @@ class HacktoberIssues(commands.Cog):
             log.debug("using cache")
             return self.cache_normal
 
-        async with aiohttp.ClientSession() as session:
-            if option == "beginner":
-                url = URL + '+label:"good first issue"'
-                if self.cache_beginner is not None:
-                    page = random.randint(1, min(1000, self.cache_beginner["total_count"]) // 100)
-                    url += f"&page={page}"
-            else:
-                url = URL
-                if self.cache_normal is not None:
-                    page = random.randint(1, min(1000, self.cache_normal["total_count"]) // 100)
-                    url += f"&page={page}"
-
-            log.debug(f"making api request to url: {url}")
-            async with session.get(url, headers=HEADERS) as response:
-                if response.status != 200:
-                    log.error(f"expected 200 status (got {response.status}) from the GitHub api.")
-                    await ctx.send(f"ERROR: expected 200 status (got {response.status}) from the GitHub api.")
-                    await ctx.send(await response.text())
-                    return None
-                data = await response.json()
-
-                if len(data["items"]) == 0:
-                    log.error(f"no issues returned from GitHub api. with url: {response.url}")
-                    await ctx.send(f"ERROR: no issues returned from GitHub api. with url: {response.url}")
-                    return None
-
-                if option == "beginner":
-                    self.cache_beginner = data
-                    self.cache_timer_beginner = ctx.message.created_at
-                else:
-                    self.cache_normal = data
-                    self.cache_timer_normal = ctx.message.created_at
-
-                return data
+        if option == "beginner":
+            url = URL + '+label:"good first issue"'
+            if self.cache_beginner is not None:
+                page = random.randint(1, min(1000, self.cache_beginner["total_count"]) // 100)
+                url += f"&page={page}"
+        else:
+            url = URL
+            if self.cache_normal is not None:
+                page = random.randint(1, min(1000, self.cache_normal["total_count"]) // 100)
+                url += f"&page={page}"
+
+        log.debug(f"making api request to url: {url}")
+        response = await self.bot.http_service.get(url, headers=HEADERS, revalidate=True)
+        if response.status != 200:
+            log.error(f"expected 200 status (got {response.status}) from the GitHub api.")
+            await ctx.send(f"ERROR: expected 200 status (got {response.status}) from the GitHub api.")
+            await ctx.send(response.text())
+            return None
+        data = response.json()
+
+        if len(data["items"]) == 0:
+            log.error(f"no issues returned from GitHub api. with url: {response.url}")
+            await ctx.send(f"ERROR: no issues returned from GitHub api. with url: {response.url}")
+            return None
+
+        if option == "beginner":
+            self.cache_beginner = data
+            self.cache_timer_beginner = ctx.message.created_at
+        else:
+            self.cache_normal = data
+            self.cache_timer_normal = ctx.message.created_at
+
+        return data
 
     @staticmethod
     def format_embed(issue: Dict) -> discord.Embed:
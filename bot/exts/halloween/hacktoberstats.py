@@ -1,4 +1,3 @@
-import json
 import logging
 import re
 from collections import Counter
@@ -6,18 +5,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple
 
-import aiohttp
 import discord
 from discord.ext import commands
 
 from bot.constants import Channels, Month, WHITELISTED_CHANNELS
 from bot.utils.decorators import in_month, override_in_channel
-from bot.utils.persist import make_persistent
+from bot.utils.persist import get_store
 
 log = logging.getLogger(__name__)
 
 CURRENT_YEAR = datetime.now().year  # Used to construct GH API query
 PRS_FOR_SHIRT = 4  # Minimum number of PRs before a shirt is awarded
+PRS_CACHE_TTL = 5 * 60  # Seconds a user's PR search result is reused for
 HACKTOBER_WHITELIST = WHITELISTED_CHANNELS + (Channels.hacktoberfest_2019,)
 
 
@@ -26,8 +25,14 @@ class HacktoberStats(commands.Cog):
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.link_json = make_persistent(Path("bot", "resources", "halloween", "github_links.json"))
-        self.linked_accounts = self.load_linked_users()
+        # Linked users are stored as a nested dict:
+        #     {
+        #         Discord_ID: {
+        #             "github_username": str
+        #             "date_added": datetime
+        #         }
+        #     }
+        self.linked_accounts = get_store(Path("bot", "resources", "halloween", "github_links.json"))
 
     @in_month(Month.OCTOBER)
     @commands.group(name="hacktoberstats", aliases=("hackstats",), invoke_without_command=True)
@@ -84,10 +89,8 @@ class HacktoberStats(commands.Cog):
 
             self.linked_accounts[author_id] = {
                 "github_username": github_username,
-                "date_added": datetime.now()
+                "date_added": str(datetime.now())
             }
-
-            self.save_linked_users()
         else:
             logging.info(f"{author_id} tried to link a GitHub account but didn't provide a username")
             await ctx.send(f"{author_mention}, a GitHub username is required to link your account")
@@ -107,48 +110,6 @@ class HacktoberStats(commands.Cog):
             await ctx.send(f"{author_mention}, you do not currently have a linked GitHub account")
             logging.info(f"{author_id} tried to unlink their GitHub account but no account was linked")
 
-        self.save_linked_users()
-
-    def load_linked_users(self) -> dict:
-        """
-        Load list of linked users from local JSON file.
-
-        Linked users are stored as a nested dict:
-            {
-                Discord_ID: {
-                    "github_username": str
-                    "date_added": datetime
-                }
-            }
-        """
-        if self.link_json.exists():
-            logging.info(f"Loading linked GitHub accounts from '{self.link_json}'")
-            with open(self.link_json, 'r', encoding="utf8") as file:
-                linked_accounts = json.load(file)
-
-            logging.info(f"Loaded {len(linked_accounts)} linked GitHub accounts from '{self.link_json}'")
-            return linked_accounts
-        else:
-            logging.info(f"Linked account log: '{self.link_json}' does not exist")
-            return {}
-
-    def save_linked_users(self) -> None:
-        """
-        Save list of linked users to local JSON file.
-
-        Linked users are stored as a nested dict:
-            {
-                Discord_ID: {
-                    "github_username": str
-                    "date_added": datetime
-                }
-            }
-        """
-        logging.info(f"Saving linked_accounts to '{self.link_json}'")
-        with open(self.link_json, 'w', encoding="utf8") as file:
-            json.dump(self.linked_accounts, file, default=str)
-        logging.info(f"linked_accounts saved to '{self.link_json}'")
-
     async def get_stats(self, ctx: commands.Context, github_username: str) -> None:
         """
         Query GitHub's API for PRs created by a GitHub user during the month of October.
@@ -206,8 +167,7 @@ class HacktoberStats(commands.Cog):
         logging.info(f"Hacktoberfest PR built for GitHub user '{github_username}'")
         return stats_embed
 
-    @staticmethod
-    async def get_october_prs(github_username: str) -> List[dict]:
+    async def get_october_prs(self, github_username: str) -> List[dict]:
         """
         Query GitHub's API for PRs created during the month of October by github_username.
 
@@ -243,9 +203,9 @@ class HacktoberStats(commands.Cog):
         )
 
         headers = {"user-agent": "Discord Python Hacktoberbot"}
-        async with aiohttp.ClientSession() as session:
-            async with session.get(query_url, headers=headers) as resp:
-                jsonresp = await resp.json()
+        jsonresp = await self.bot.http_service.get_json(
+            query_url, headers=headers, ttl=PRS_CACHE_TTL, revalidate=True
+        )
 
         if "message" in jsonresp.keys():
             # One of the parameters is invalid, short circuit for now
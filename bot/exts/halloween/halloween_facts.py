@@ -1,13 +1,13 @@
-import json
 import logging
 import random
 from datetime import timedelta
-from pathlib import Path
 from typing import Tuple
 
 import discord
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
 SPOOKY_EMOJIS = [
@@ -23,20 +23,22 @@ SPOOKY_EMOJIS = [
 PUMPKIN_ORANGE = discord.Color(0xFF7518)
 INTERVAL = timedelta(hours=6).total_seconds()
 
+FACTS = resource(
+    "bot/resources/halloween/halloween_facts.json",
+    shape=[str],
+    transform=lambda facts: list(enumerate(facts))
+)
+
 
 class HalloweenFacts(commands.Cog):
     """A Cog for displaying interesting facts about Halloween."""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        with open(Path("bot/resources/halloween/halloween_facts.json"), "r", encoding="utf8") as file:
-            self.halloween_facts = json.load(file)
-        self.facts = list(enumerate(self.halloween_facts))
-        random.shuffle(self.facts)
 
     def random_fact(self) -> Tuple[int, str]:
         """Return a random fact from the loaded facts."""
-        return random.choice(self.facts)
+        return FACTS.choice()
 
     @commands.command(name="spookyfact", aliases=("halloweenfact",), brief="Get the most recent Halloween fact")
     async def get_random_fact(self, ctx: commands.Context) -> None:
@@ -1,15 +1,16 @@
 import logging
-from json import load
-from pathlib import Path
-from random import choice
 
 import discord
 from discord.errors import Forbidden
 from discord.ext import commands
 from discord.ext.commands.cooldowns import BucketType
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
+CHARACTERS = resource("bot/resources/halloween/halloweenify.json", shape={"characters": [{str: str}]})
+
 
 class Halloweenify(commands.Cog):
     """A cog to change a invokers nickname to a spooky one!"""
@@ -22,11 +23,8 @@ class Halloweenify(commands.Cog):
     async def halloweenify(self, ctx: commands.Context) -> None:
         """Change your nickname into a much spookier one!"""
         async with ctx.typing():
-            with open(Path("bot/resources/halloween/halloweenify.json"), "r", encoding="utf8") as f:
-                data = load(f)
-
-            # Choose a random character from our list we loaded above and set apart the nickname and image url.
-            character = choice(data["characters"])
+            # Choose a random character and set apart the nickname and image url.
+            character = CHARACTERS.choice("characters")
             nickname = ''.join([nickname for nickname in character])
             image = ''.join([character[nickname] for nickname in character])
 
@@ -1,17 +1,16 @@
-import json
 import logging
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/halloween/monster.json"), "r", encoding="utf8") as f:
-    TEXT_OPTIONS = json.load(f)  # Data for a mad-lib style generation of text
+# Data for a mad-lib style generation of text
+TEXT_OPTIONS = resource("bot/resources/halloween/monster.json", shape={str: list})
 
 
 class MonsterBio(commands.Cog):
@@ -22,8 +21,8 @@ class MonsterBio(commands.Cog):
 
     def generate_name(self, seeded_random: random.Random) -> str:
         """Generates a name (for either monster species or monster name)."""
-        n_candidate_strings = seeded_random.randint(2, len(TEXT_OPTIONS["monster_type"]))
-        return "".join(seeded_random.choice(TEXT_OPTIONS["monster_type"][i]) for i in range(n_candidate_strings))
+        n_candidate_strings = seeded_random.randint(2, len(TEXT_OPTIONS.data["monster_type"]))
+        return "".join(seeded_random.choice(TEXT_OPTIONS.data["monster_type"][i]) for i in range(n_candidate_strings))
 
     @commands.command(brief="Sends your monster bio!")
     async def monsterbio(self, ctx: commands.Context) -> None:
@@ -32,13 +31,13 @@ class MonsterBio(commands.Cog):
 
         name = self.generate_name(seeded_random)
         species = self.generate_name(seeded_random)
-        biography_text = seeded_random.choice(TEXT_OPTIONS["biography_text"])
+        biography_text = seeded_random.choice(TEXT_OPTIONS.data["biography_text"])
         words = {"monster_name": name, "monster_species": species}
         for key, value in biography_text.items():
             if key == "text":
                 continue
 
-            options = seeded_random.sample(TEXT_OPTIONS[key], value)
+            options = seeded_random.sample(TEXT_OPTIONS.data[key], value)
             words[key] = ' '.join(options)
 
         embed = discord.Embed(
@@ -1,13 +1,28 @@
 import json
 import logging
-import os
+from pathlib import Path
 
 from discord import Embed
 from discord.ext import commands
 from discord.ext.commands import Bot, Cog, Context
 
+from bot.utils.leaderboard import Leaderboard
+from bot.utils.persist import DIRECTORY, get_store
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
+MONSTERS = resource(
+    "bot/resources/halloween/monstersurvey.json",
+    shape={str: {"full_name": str, "summary": str, "image": str}}
+)
+
+# Where votes were stored as a list per monster, imported once into the empty vote store
+LEGACY_VOTES = (
+    Path(DIRECTORY, "halloween", "monstersurvey.json"),
+    Path("bot", "resources", "halloween", "monstersurvey.json"),
+)
+
 EMOJIS = {
     'SUCCESS': u'\u2705',
     'ERROR': u'\u274C'
@@ -26,15 +41,33 @@ class MonsterSurvey(Cog):
     def __init__(self, bot: Bot):
         """Initializes values for the bot to use within the voting commands."""
         self.bot = bot
-        self.registry_location = os.path.join(os.getcwd(), 'bot', 'resources', 'halloween', 'monstersurvey.json')
-        with open(self.registry_location, 'r', encoding="utf8") as jason:
-            self.voter_registry = json.load(jason)
 
-    def json_write(self) -> None:
-        """Write voting results to a local JSON file."""
-        log.info("Saved Monster Survey Results")
-        with open(self.registry_location, 'w', encoding="utf8") as jason:
-            json.dump(self.voter_registry, jason, indent=2)
+        # Maps the ID of every voter to the monster they voted for; a vote only saves that one entry
+        self.votes = get_store(Path('bot', 'resources', 'halloween', 'monster_votes.json'))
+        if not self.votes:
+            self.import_legacy_votes()
+
+        # Vote counts, updated as votes are cast rather than counted again for every leaderboard
+        self.tally = Leaderboard(dict.fromkeys(MONSTERS.data, 0))
+        for monster in self.votes.values():
+            if monster in self.tally:
+                self.tally.add(monster, 1)
+
+    def import_legacy_votes(self) -> None:
+        """Import the votes of the old survey file, where each monster had a list of voters."""
+        path = next((path for path in LEGACY_VOTES if path.exists()), None)
+        if path is None:
+            return
+
+        with path.open(encoding="utf8") as f:
+            legacy = json.load(f)
+
+        for monster, entry in legacy.items():
+            for voter in entry.get('votes', ()):
+                self.votes[str(voter)] = monster
+
+        if self.votes:
+            log.info(f"Imported {len(self.votes)} monster survey votes from {path}")
 
     def cast_vote(self, id: int, monster: str) -> None:
         """
@@ -42,21 +75,18 @@ class MonsterSurvey(Cog):
 
         If the user has already voted, their existing vote is removed.
         """
-        vr = self.voter_registry
-        for m in vr.keys():
-            if id not in vr[m]['votes'] and m == monster:
-                vr[m]['votes'].append(id)
-            else:
-                if id in vr[m]['votes'] and m != monster:
-                    vr[m]['votes'].remove(id)
+        previous = self.votes.get(str(id))
+        if previous == monster:
+            return
+
+        if previous in self.tally:
+            self.tally.add(previous, -1)
+        self.tally.add(monster, 1)
+        self.votes[str(id)] = monster
 
     def get_name_by_leaderboard_index(self, n: int) -> str:
         """Return the monster at the specified leaderboard index."""
-        n = n - 1
-        vr = self.voter_registry
-        top = sorted(vr, key=lambda k: len(vr[k]['votes']), reverse=True)
-        name = top[n] if n >= 0 else None
-        return name
+        return self.tally.at(n)
 
     @commands.group(
         name='monster',
@@ -85,7 +115,7 @@ class MonsterSurvey(Cog):
                     value='Which monster has the most votes? This command will tell you.',
                     inline=False
                 )
-                default_embed.set_footer(text=f"Monsters choices are: {', '.join(self.voter_registry.keys())}")
+                default_embed.set_footer(text=f"Monsters choices are: {', '.join(MONSTERS.data.keys())}")
 
             await ctx.send(embed=default_embed)
 
@@ -115,7 +145,7 @@ class MonsterSurvey(Cog):
                 color=0xFF6800
             )
 
-            m = self.voter_registry.get(name)
+            m = MONSTERS.data.get(name)
             if m is None:
                 vote_embed.description = f'You cannot vote for {name} because it\'s not in the running.'
                 vote_embed.add_field(
@@ -125,7 +155,7 @@ class MonsterSurvey(Cog):
                 )
                 vote_embed.add_field(
                     name='You may vote for or show the following monsters:',
-                    value=f"{', '.join(self.voter_registry.keys())}"
+                    value=f"{', '.join(MONSTERS.data.keys())}"
                 )
             else:
                 self.cast_vote(ctx.author.id, name)
@@ -136,7 +166,6 @@ class MonsterSurvey(Cog):
                 )
                 vote_embed.set_thumbnail(url=m['image'])
                 vote_embed.set_footer(text="Please note that any previous votes have been removed.")
-                self.json_write()
 
         await ctx.send(embed=vote_embed)
 
@@ -157,7 +186,7 @@ class MonsterSurvey(Cog):
             except ValueError:
                 name = name.lower()
 
-            m = self.voter_registry.get(name)
+            m = MONSTERS.data.get(name)
             if not m:
                 await ctx.send('That monster does not exist.')
                 await ctx.invoke(self.monster_vote)
@@ -177,15 +206,12 @@ class MonsterSurvey(Cog):
     async def monster_leaderboard(self, ctx: Context) -> None:
         """Shows the current standings."""
         async with ctx.typing():
-            vr = self.voter_registry
-            top = sorted(vr, key=lambda k: len(vr[k]['votes']), reverse=True)
-            total_votes = sum(len(m['votes']) for m in self.voter_registry.values())
+            total_votes = self.tally.total
 
             embed = Embed(title="Monster Survey Leader Board", color=0xFF6800)
-            for rank, m in enumerate(top):
-                votes = len(vr[m]['votes'])
+            for rank, (m, votes) in enumerate(self.tally.top()):
                 percentage = ((votes / total_votes) * 100) if total_votes > 0 else 0
-                embed.add_field(name=f"{rank+1}. {vr[m]['full_name']}",
+                embed.add_field(name=f"{rank+1}. {MONSTERS.data[m]['full_name']}",
                                 value=(
                                     f"{votes} votes. {percentage:.1f}% of total votes.\n"
                                     f"Vote for this monster by typing "
@@ -2,7 +2,6 @@ import logging
 import random
 from os import environ
 
-import aiohttp
 from discord import Embed
 from discord.ext import commands
 
@@ -12,6 +11,8 @@ log = logging.getLogger(__name__)
 TMDB_API_KEY = environ.get('TMDB_API_KEY')
 TMDB_TOKEN = environ.get('TMDB_TOKEN')
 
+PAGE_COUNT_TTL = 60 * 60  # The number of horror movies on TMDb barely changes within an hour
+
 
 class ScaryMovie(commands.Cog):
     """Selects a random scary movie and embeds info into Discord chat."""
@@ -28,8 +29,7 @@ class ScaryMovie(commands.Cog):
 
         await ctx.send(embed=movie_details)
 
-    @staticmethod
-    async def select_movie() -> dict:
+    async def select_movie(self) -> dict:
         """Selects a random movie and returns a JSON of movie details from TMDb."""
         url = 'https://api.themoviedb.org/4/discover/movie'
         params = {
@@ -40,26 +40,22 @@ class ScaryMovie(commands.Cog):
             'Authorization': 'Bearer ' + TMDB_TOKEN,
             'Content-Type': 'application/json;charset=utf-8'
         }
+        http = self.bot.http_service
 
         # Get total page count of horror movies
-        async with aiohttp.ClientSession() as session:
-            response = await session.get(url=url, params=params, headers=headers)
-            total_pages = await response.json()
-            total_pages = total_pages.get('total_pages')
-
-            # Get movie details from one random result on a random page
-            params['page'] = random.randint(1, total_pages)
-            response = await session.get(url=url, params=params, headers=headers)
-            response = await response.json()
-            selection_id = random.choice(response.get('results')).get('id')
-
-            # Get full details and credits
-            selection = await session.get(
-                url='https://api.themoviedb.org/3/movie/' + str(selection_id),
-                params={'api_key': TMDB_API_KEY, 'append_to_response': 'credits'}
-            )
-
-            return await selection.json()
+        total_pages = await http.get_json(url, params=params, headers=headers, ttl=PAGE_COUNT_TTL)
+        total_pages = total_pages.get('total_pages')
+
+        # Get movie details from one random result on a random page
+        params['page'] = random.randint(1, total_pages)
+        response = await http.get_json(url, params=params, headers=headers)
+        selection_id = random.choice(response.get('results')).get('id')
+
+        # Get full details and credits
+        return await http.get_json(
+            'https://api.themoviedb.org/3/movie/' + str(selection_id),
+            params={'api_key': TMDB_API_KEY, 'append_to_response': 'credits'}
+        )
 
     @staticmethod
     async def format_metadata(movie: dict) -> Embed:
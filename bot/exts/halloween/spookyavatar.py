@@ -1,17 +1,26 @@
 import logging
-import os
 from io import BytesIO
 
-import aiohttp
 import discord
 from PIL import Image
 from discord.ext import commands
 
+from bot.utils.assets import image_cache
 from bot.utils.halloween import spookifications
 
 log = logging.getLogger(__name__)
 
 
+def spookify(image_bytes: bytes) -> bytes:
+    """Apply a random spooky effect to the image in `image_bytes`, returning PNG bytes."""
+    im = Image.open(BytesIO(image_bytes))
+    modified_im = spookifications.get_random_effect(im)
+
+    bufferedio = BytesIO()
+    modified_im.save(bufferedio, format="PNG")
+    return bufferedio.getvalue()
+
+
 class SpookyAvatar(commands.Cog):
     """A cog that spookifies an avatar."""
 
@@ -20,9 +29,7 @@ class SpookyAvatar(commands.Cog):
 
     async def get(self, url: str) -> bytes:
         """Returns the contents of the supplied URL."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                return await resp.read()
+        return await self.bot.http_service.get_bytes(url)
 
     @commands.command(name='savatar', aliases=('spookyavatar', 'spookify'),
                       brief='Spookify an user\'s avatar.')
@@ -37,16 +44,16 @@ class SpookyAvatar(commands.Cog):
             embed.set_author(name=str(user.name), icon_url=user.avatar_url)
 
             image_bytes = await ctx.author.avatar_url.read()
-            im = Image.open(BytesIO(image_bytes))
-            modified_im = spookifications.get_random_effect(im)
-            modified_im.save(str(ctx.message.id)+'.png')
-            f = discord.File(str(ctx.message.id)+'.png')
-            embed.set_image(url='attachment://'+str(ctx.message.id)+'.png')
+            modified_im = await self.bot.image_pool.submit(spookify, image_bytes)
+            f = discord.File(BytesIO(modified_im), filename=f"{ctx.message.id}.png")
+            embed.set_image(url=f"attachment://{ctx.message.id}.png")
 
         await ctx.send(file=f, embed=embed)
-        os.remove(str(ctx.message.id)+'.png')
 
 
 def setup(bot: commands.Bot) -> None:
     """Spooky avatar Cog load."""
+    # Avatars are fetched at 1024x1024 by default, which is what the pentagram gets stretched to
+    image_cache.preload(spookifications.BAT, spookifications.PENTAGRAM)
+    image_cache.preload(spookifications.PENTAGRAM, size=(1024, 1024))
     bot.add_cog(SpookyAvatar(bot))
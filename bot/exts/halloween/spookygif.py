@@ -1,6 +1,5 @@
 import logging
 
-import aiohttp
 import discord
 from discord.ext import commands
 
@@ -19,16 +18,17 @@ class SpookyGif(commands.Cog):
     async def spookygif(self, ctx: commands.Context) -> None:
         """Fetches a random gif from the GIPHY API and responds with it."""
         async with ctx.typing():
-            async with aiohttp.ClientSession() as session:
-                params = {'api_key': Tokens.giphy, 'tag': 'halloween', 'rating': 'g'}
-                # Make a GET request to the Giphy API to get a random halloween gif.
-                async with session.get('http://api.giphy.com/v1/gifs/random', params=params) as resp:
-                    data = await resp.json()
-                url = data['data']['image_url']
-
-                embed = discord.Embed(colour=0x9b59b6)
-                embed.title = "A spooooky gif!"
-                embed.set_image(url=url)
+            params = {'api_key': Tokens.giphy, 'tag': 'halloween', 'rating': 'g'}
+            # Make a GET request to the Giphy API to get a random halloween gif.
+            # Concurrent requests are not coalesced, as everyone should get their own random gif.
+            data = await self.bot.http_service.get_json(
+                'http://api.giphy.com/v1/gifs/random', params=params, coalesce=False
+            )
+            url = data['data']['image_url']
+
+            embed = discord.Embed(colour=0x9b59b6)
+            embed.title = "A spooooky gif!"
+            embed.set_image(url=url)
 
         await ctx.send(embed=embed)
 
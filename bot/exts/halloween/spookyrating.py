@@ -1,19 +1,20 @@
 import bisect
-import json
 import logging
 import random
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with Path("bot/resources/halloween/spooky_rating.json").open(encoding="utf8") as file:
-    SPOOKY_DATA = json.load(file)
-    SPOOKY_DATA = sorted((int(key), value) for key, value in SPOOKY_DATA.items())
+SPOOKY_DATA = resource(
+    "bot/resources/halloween/spooky_rating.json",
+    shape={str: {"title": str, "text": str, "image": str}},
+    transform=lambda data: sorted((int(key), value) for key, value in data.items())
+)
 
 
 class SpookyRating(commands.Cog):
@@ -41,9 +42,9 @@ class SpookyRating(commands.Cog):
         # We need the -1 due to how bisect returns the point
         # see the documentation for further detail
         # https://docs.python.org/3/library/bisect.html#bisect.bisect
-        index = bisect.bisect(SPOOKY_DATA, (spooky_percent,)) - 1
+        index = bisect.bisect(SPOOKY_DATA.data, (spooky_percent,)) - 1
 
-        _, data = SPOOKY_DATA[index]
+        _, data = SPOOKY_DATA.data[index]
 
         embed = discord.Embed(
             title=data['title'],
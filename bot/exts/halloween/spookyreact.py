@@ -1,24 +1,41 @@
+import asyncio
 import logging
 import re
+import typing as t
 
 import discord
 from discord.ext.commands import Bot, Cog
 
-from bot.constants import Month
-from bot.utils.decorators import in_month
+from bot.constants import Client, Month
+from bot.utils.dispatch import listen
 
 log = logging.getLogger(__name__)
 
+# Triggers are matched as whole words, in lowercased messages
 SPOOKY_TRIGGERS = {
-    'spooky': (r"\bspo{2,}ky\b", "\U0001F47B"),
-    'skeleton': (r"\bskeleton\b", "\U0001F480"),
-    'doot': (r"\bdo{2,}t\b", "\U0001F480"),
-    'pumpkin': (r"\bpumpkin\b", "\U0001F383"),
-    'halloween': (r"\bhalloween\b", "\U0001F383"),
-    'jack-o-lantern': (r"\bjack-o-lantern\b", "\U0001F383"),
-    'danger': (r"\bdanger\b", "\U00002620")
+    'spooky': (r"spo{2,}ky", "\U0001F47B"),
+    'skeleton': (r"skeleton", "\U0001F480"),
+    'doot': (r"do{2,}t", "\U0001F480"),
+    'pumpkin': (r"pumpkin", "\U0001F383"),
+    'halloween': (r"halloween", "\U0001F383"),
+    'jack-o-lantern': (r"jack-o-lantern", "\U0001F383"),
+    'danger': (r"danger", "\U00002620")
 }
 
+# Every trigger in a single alternation, so a message is scanned once however many triggers there are.
+# Each trigger is wrapped in a group, in order, so the index of the group which matched names the trigger.
+# The lookahead on the first letters of the triggers quickly skips the positions where none of them can start.
+TRIGGER_NAMES = tuple(SPOOKY_TRIGGERS)
+_FIRST_LETTERS = "".join(sorted({pattern[0] for pattern, _ in SPOOKY_TRIGGERS.values()}))
+_ALTERNATION = "|".join(f"({pattern})" for pattern, _ in SPOOKY_TRIGGERS.values())
+TRIGGER_PATTERN = re.compile(rf"(?=[{_FIRST_LETTERS}])\b(?:{_ALTERNATION})\b")
+
+
+def find_triggers(content: str) -> t.List[str]:
+    """Return the name of every trigger found in `content`, in order of first appearance."""
+    found = {TRIGGER_NAMES[match.lastindex - 1]: None for match in TRIGGER_PATTERN.finditer(content.lower())}
+    return list(found)
+
 
 class SpookyReact(Cog):
     """A cog that makes the bot react to message triggers."""
@@ -26,45 +43,37 @@ class SpookyReact(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
-    @in_month(Month.OCTOBER)
-    @Cog.listener()
+    @listen("message", months=(Month.OCTOBER,), content=TRIGGER_PATTERN)
     async def on_message(self, ctx: discord.Message) -> None:
         """
-        A command to send the seasonalbot github project.
+        React to spooky words in messages, with an emoji per trigger.
 
         Lines that begin with the bot's command prefix are ignored
 
-        Seasonalbot's own messages are ignored
+        Messages from bots, including Seasonalbot's own, are ignored by the dispatcher
         """
-        for trigger in SPOOKY_TRIGGERS.keys():
-            trigger_test = re.search(SPOOKY_TRIGGERS[trigger][0], ctx.content.lower())
-            if trigger_test:
-                # Check message for bot replies and/or command invocations
-                # Short circuit if they're found, logging is handled in _short_circuit_check
-                if await self._short_circuit_check(ctx):
-                    return
-                else:
-                    await ctx.add_reaction(SPOOKY_TRIGGERS[trigger][1])
-                    logging.info(f"Added '{trigger}' reaction to message ID: {ctx.id}")
-
-    async def _short_circuit_check(self, ctx: discord.Message) -> bool:
+        # Check message for command invocations
+        # Short circuit if they're found, logging is handled in _short_circuit_check
+        if self._short_circuit_check(ctx):
+            return
+
+        triggers = find_triggers(ctx.content)
+
+        # Triggers sharing an emoji only need it added once
+        emojis = dict.fromkeys(SPOOKY_TRIGGERS[trigger][1] for trigger in triggers)
+        await asyncio.gather(*(ctx.add_reaction(emoji) for emoji in emojis))
+        log.info(f"Added {', '.join(map(repr, triggers))} reactions to message ID: {ctx.id}")
+
+    def _short_circuit_check(self, ctx: discord.Message) -> bool:
         """
         Short-circuit helper check.
 
-        Return True if:
-          * author is the bot
-          * prefix is not None
+        Return True if the message starts with the command prefix.
         """
-        # Check for self reaction
-        if ctx.author == self.bot.user:
-            logging.debug(f"Ignoring reactions on self message. Message ID: {ctx.id}")
-            return True
-
         # Check for command invocation
-        # Because on_message doesn't give a full Context object, generate one first
-        tmp_ctx = await self.bot.get_context(ctx)
-        if tmp_ctx.prefix:
-            logging.debug(f"Ignoring reactions on command invocation. Message ID: {ctx.id}")
+        # The prefix is a plain string, so there's no need to build a full Context as get_context does
+        if ctx.content.startswith(Client.prefix):
+            log.debug(f"Ignoring reactions on command invocation. Message ID: {ctx.id}")
             return True
 
         return False
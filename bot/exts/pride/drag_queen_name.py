@@ -1,30 +1,24 @@
-import json
 import logging
-import random
-from pathlib import Path
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
+NAMES = resource("bot/resources/pride/drag_queen_names.json", shape=[str])
+
 
 class DragNames(commands.Cog):
     """Gives a random drag queen name!"""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.names = self.load_names()
-
-    @staticmethod
-    def load_names() -> list:
-        """Loads a list of drag queen names."""
-        with open(Path("bot/resources/pride/drag_queen_names.json"), "r", encoding="utf8") as f:
-            return json.load(f)
 
     @commands.command(name="dragname", aliases=["dragqueenname", "queenme"])
     async def dragname(self, ctx: commands.Context) -> None:
         """Sends a message with a drag queen name."""
-        await ctx.send(random.choice(self.names))
+        await ctx.send(NAMES.choice())
 
 
 def setup(bot: commands.Bot) -> None:
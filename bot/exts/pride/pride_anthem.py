@@ -1,19 +1,23 @@
-import json
 import logging
 import random
-from pathlib import Path
 
 from discord.ext import commands
 
+from bot.utils.resources import resource
+
 log = logging.getLogger(__name__)
 
+ANTHEMS = resource(
+    "bot/resources/pride/anthems.json",
+    shape=[{"title": str, "artist": str, "url": str, "genre": [str]}]
+)
+
 
 class PrideAnthem(commands.Cog):
     """Embed a random youtube video for a gay anthem!"""
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.anthems = self.load_vids()
 
     def get_video(self, genre: str = None) -> dict:
         """
@@ -23,21 +27,14 @@ class PrideAnthem(commands.Cog):
         If none can be found, it will log this as well as provide that information to the user.
         """
         if not genre:
-            return random.choice(self.anthems)
+            return ANTHEMS.choice()
         else:
-            songs = [song for song in self.anthems if genre.casefold() in song["genre"]]
+            songs = [song for song in ANTHEMS.data if genre.casefold() in song["genre"]]
             try:
                 return random.choice(songs)
             except IndexError:
                 log.info("No videos for that genre.")
 
-    @staticmethod
-    def load_vids() -> list:
-        """Loads a list of videos from the resources folder as dictionaries."""
-        with open(Path("bot/resources/pride/anthems.json"), "r", encoding="utf8") as f:
-            anthems = json.load(f)
-        return anthems
-
     @commands.command(name="prideanthem", aliases=["anthem", "pridesong"])
     async def prideanthem(self, ctx: commands.Context, genre: str = None) -> None:
         """
@@ -7,9 +7,13 @@ from PIL import Image, ImageDraw
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.assets import image_cache
 
 log = logging.getLogger(__name__)
 
+FLAGS = Path("bot/resources/pride/flags")
+RING_SIZE = (1024, 1024)
+
 OPTIONS = {
     "agender": "agender",
     "androgyne": "androgyne",
@@ -53,6 +57,23 @@ OPTIONS = {
 }
 
 
+def prideify(image_bytes: bytes, flag: str, pixels: int) -> bytes:
+    """Surround the avatar in `image_bytes` with a `pixels` thick ring of `flag`, returning PNG bytes."""
+    avatar = Image.open(BytesIO(image_bytes))
+    avatar = avatar.convert("RGBA").resize(RING_SIZE)
+
+    avatar = PrideAvatar.crop_avatar(avatar)
+
+    ring = image_cache.get(FLAGS / f"{flag}.png", size=RING_SIZE)
+    ring = ring.convert("RGBA")
+    ring = PrideAvatar.crop_ring(ring, pixels)
+
+    avatar.alpha_composite(ring, (0, 0))
+    bufferedio = BytesIO()
+    avatar.save(bufferedio, format="PNG")
+    return bufferedio.getvalue()
+
+
 class PrideAvatar(commands.Cog):
     """Put an LGBT spin on your avatar!"""
 
@@ -98,22 +119,9 @@ class PrideAvatar(commands.Cog):
         flag = OPTIONS[option]
 
         async with ctx.typing():
-
-            # Get avatar bytes
             image_bytes = await ctx.author.avatar_url.read()
-            avatar = Image.open(BytesIO(image_bytes))
-            avatar = avatar.convert("RGBA").resize((1024, 1024))
-
-            avatar = self.crop_avatar(avatar)
-
-            ring = Image.open(Path(f"bot/resources/pride/flags/{flag}.png")).resize((1024, 1024))
-            ring = ring.convert("RGBA")
-            ring = self.crop_ring(ring, pixels)
-
-            avatar.alpha_composite(ring, (0, 0))
-            bufferedio = BytesIO()
-            avatar.save(bufferedio, format="PNG")
-            bufferedio.seek(0)
+            avatar = await self.bot.image_pool.submit(prideify, image_bytes, flag, pixels)
+            bufferedio = BytesIO(avatar)
 
             file = discord.File(bufferedio, filename="pride_avatar.png")  # Creates file to be used in embed
             embed = discord.Embed(
@@ -141,4 +149,5 @@ class PrideAvatar(commands.Cog):
 
 def setup(bot: commands.Bot) -> None:
     """Cog load."""
+    image_cache.preload(*(FLAGS / f"{flag}.png" for flag in set(OPTIONS.values())), size=RING_SIZE)
     bot.add_cog(PrideAvatar(bot))
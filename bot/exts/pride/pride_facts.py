@@ -1,8 +1,6 @@
-import json
 import logging
 import random
 from datetime import datetime
-from pathlib import Path
 from typing import Union
 
 import dateutil.parser
@@ -11,29 +9,23 @@ from discord.ext import commands
 
 from bot.bot import SeasonalBot
 from bot.constants import Channels, Colours, Month
-from bot.utils.decorators import seasonal_task
+from bot.utils.resources import resource
+from bot.utils.scheduler import Cron, scheduled
 
 log = logging.getLogger(__name__)
 
 Sendable = Union[commands.Context, discord.TextChannel]
 
+FACTS = resource("bot/resources/pride/facts.json", shape={str: [str]})  # Years mapping to lists of facts
+
 
 class PrideFacts(commands.Cog):
     """Provides a new fact every day during the Pride season!"""
 
     def __init__(self, bot: SeasonalBot):
         self.bot = bot
-        self.facts = self.load_facts()
-
-        self.daily_fact_task = self.bot.loop.create_task(self.send_pride_fact_daily())
-
-    @staticmethod
-    def load_facts() -> dict:
-        """Loads a dictionary of years mapping to lists of facts."""
-        with open(Path("bot/resources/pride/facts.json"), "r", encoding="utf8") as f:
-            return json.load(f)
 
-    @seasonal_task(Month.JUNE)
+    @scheduled(Cron("0 0 * * *", months=(Month.JUNE,)), catch_up=True)
     async def send_pride_fact_daily(self) -> None:
         """Background task to post the daily pride fact every day."""
         await self.bot.wait_until_guild_available()
@@ -44,8 +36,8 @@ class PrideFacts(commands.Cog):
     async def send_random_fact(self, ctx: commands.Context) -> None:
         """Provides a fact from any previous day, or today."""
         now = datetime.utcnow()
-        previous_years_facts = (self.facts[x] for x in self.facts.keys() if int(x) < now.year)
-        current_year_facts = self.facts.get(str(now.year), [])[:now.day]
+        previous_years_facts = (FACTS.data[x] for x in FACTS.data.keys() if int(x) < now.year)
+        current_year_facts = FACTS.data.get(str(now.year), [])[:now.day]
         previous_facts = current_year_facts + [x for y in previous_years_facts for x in y]
         try:
             await ctx.send(embed=self.make_embed(random.choice(previous_facts)))
@@ -65,7 +57,7 @@ class PrideFacts(commands.Cog):
             date = _date
         if date.year < now.year or (date.year == now.year and date.day <= now.day):
             try:
-                await target.send(embed=self.make_embed(self.facts[str(date.year)][date.day - 1]))
+                await target.send(embed=self.make_embed(FACTS.data[str(date.year)][date.day - 1]))
             except KeyError:
                 await target.send(f"The year {date.year} is not yet supported")
                 return
@@ -0,0 +1,82 @@
+import logging
+
+from discord import Colour, Embed
+from discord.ext.commands import Cog, Context, group
+
+from bot.bot import SeasonalBot as Bot
+from bot.constants import Emojis, MODERATION_ROLES
+from bot.utils.checks import with_role_check
+
+log = logging.getLogger(__name__)
+
+
+def human_size(size: int) -> str:
+    """Format a `size` in bytes using a human-friendly unit."""
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+class HTTPCache(Cog):
+    """Inspect and clear the HTTP response caches."""
+
+    def __init__(self, bot: Bot):
+        self.bot = bot
+
+    @group(name="cache", aliases=("httpcache",), invoke_without_command=True)
+    async def cache_group(self, ctx: Context) -> None:
+        """Show the state of the in-memory and on-disk HTTP caches."""
+        http = self.bot.http_service
+        disk = http.disk_cache
+        stats = http.stats()
+        entries, size = await disk.info()
+
+        embed = Embed(title="HTTP cache", colour=Colour.blurple())
+        embed.add_field(
+            name="Memory",
+            value=(
+                f"Entries: {stats['cached']}\n"
+                f"Hits: {stats['hits']}\n"
+                f"Misses: {stats['misses']}\n"
+                f"Coalesced: {stats['coalesced']}"
+            )
+        )
+        embed.add_field(
+            name="Disk",
+            value=(
+                f"Entries: {entries}\n"
+                f"Size: {human_size(size)} / {human_size(disk.max_size)}\n"
+                f"Not modified: {disk.revalidated}\n"
+                f"Evicted: {disk.evicted}"
+            )
+        )
+
+        hosts = "\n".join(
+            f"`{host}`: {host_stats.requests} req, {host_stats.mean_latency * 1000:.0f}ms avg, "
+            f"{host_stats.max_latency * 1000:.0f}ms max"
+            for host, host_stats in stats["hosts"].items()
+        )
+        embed.add_field(name="Upstream", value=hosts or "No requests yet", inline=False)
+
+        await ctx.send(embed=embed)
+
+    @cache_group.command(name="clear")
+    async def clear_command(self, ctx: Context) -> None:
+        """Drop all cached responses, both in memory and on disk."""
+        self.bot.http_service.clear_cache()
+        deleted = await self.bot.http_service.disk_cache.clear()
+
+        log.info(f"{ctx.author} cleared the HTTP cache ({deleted} stored responses)")
+        await ctx.send(f"{Emojis.ok_hand} Cleared the HTTP cache ({deleted} stored responses).")
+
+    # This cannot be static (must have a __func__ attribute).
+    def cog_check(self, ctx: Context) -> bool:
+        """Only allow moderators to invoke the commands in this cog."""
+        return with_role_check(ctx, *MODERATION_ROLES)
+
+
+def setup(bot: Bot) -> None:
+    """Load the HTTPCache cog."""
+    bot.add_cog(HTTPCache(bot))
@@ -10,8 +10,9 @@ from discord.ext.commands import Context, group
 from bot import exts
 from bot.bot import SeasonalBot as Bot
 from bot.constants import Client, Emojis, MODERATION_ROLES, Roles
+from bot.seasons import SeasonBase, get_current_season
 from bot.utils.checks import with_role_check
-from bot.utils.extensions import EXTENSIONS, unqualify
+from bot.utils.extensions import get_active_extensions, get_extensions, get_package, get_seasonal_packages, unqualify
 from bot.utils.pagination import LinePaginator
 
 log = logging.getLogger(__name__)
@@ -44,14 +45,15 @@ class Extension(commands.Converter):
             return argument
 
         argument = argument.lower()
+        extensions = get_extensions()
 
-        if argument in EXTENSIONS:
+        if argument in extensions:
             return argument
-        elif (qualified_arg := f"{exts.__name__}.{argument}") in EXTENSIONS:
+        elif (qualified_arg := f"{exts.__name__}.{argument}") in extensions:
             return qualified_arg
 
         matches = []
-        for ext in EXTENSIONS:
+        for ext in extensions:
             if argument == unqualify(ext):
                 matches.append(ext)
 
@@ -74,6 +76,33 @@ class Extensions(commands.Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
 
+    @commands.Cog.listener()
+    async def on_season_change(self, previous: t.Type[SeasonBase], season: t.Type[SeasonBase]) -> None:
+        """Swap the loaded seasonal extensions whenever a new season starts."""
+        await self.bot.wait_until_ready()
+        self.sync_seasonal_extensions()
+
+    def sync_seasonal_extensions(self) -> None:
+        """
+        Load the extensions of the current season and unload those of all other seasons.
+
+        Extensions which are active all year round are left alone.
+        """
+        season = get_current_season()
+        active = get_active_extensions(season)
+        seasonal = get_seasonal_packages()
+
+        log.info(f"Switching seasonal extensions to the {season.season_name} season")
+
+        # Only the loaded and the newly active packages are walked, other dormant packages stay unimported
+        unload = {ext for ext in self.bot.extensions if get_package(ext) in seasonal and ext not in active}
+        load = {ext for ext in active if get_package(ext) in seasonal and ext not in self.bot.extensions}
+
+        for action, extensions in ((Action.UNLOAD, unload), (Action.LOAD, load)):
+            for ext in sorted(extensions):
+                msg, _ = self.manage(action, ext)
+                log.info(msg)
+
     @group(name="extensions", aliases=("ext", "exts", "c", "cogs"), invoke_without_command=True)
     async def extensions_group(self, ctx: Context) -> None:
         """Load, unload, reload, and list loaded extensions."""
@@ -91,7 +120,7 @@ class Extensions(commands.Cog):
             return
 
         if "*" in extensions or "**" in extensions:
-            extensions = set(EXTENSIONS) - set(self.bot.extensions.keys())
+            extensions = set(get_extensions()) - set(self.bot.extensions.keys())
 
         msg = self.batch_manage(Action.LOAD, *extensions)
         await ctx.send(msg)
@@ -134,7 +163,7 @@ class Extensions(commands.Cog):
             return
 
         if "**" in extensions:
-            extensions = EXTENSIONS
+            extensions = get_extensions()
         elif "*" in extensions:
             extensions = set(self.bot.extensions.keys()) | set(extensions)
             extensions.remove("*")
@@ -150,6 +179,7 @@ class Extensions(commands.Cog):
 
         Grey indicates that the extension is unloaded.
         Green indicates that the extension is currently loaded.
+        Yellow indicates that the extension is dormant, as its season is not active.
         """
         embed = Embed(colour=Colour.blurple())
         embed.set_author(
@@ -173,10 +203,13 @@ class Extensions(commands.Cog):
     def group_extension_statuses(self) -> t.Mapping[str, str]:
         """Return a mapping of extension names and statuses to their categories."""
         categories = {}
+        active = get_active_extensions(get_current_season())
 
-        for ext in EXTENSIONS:
+        for ext in get_extensions():
             if ext in self.bot.extensions:
                 status = Emojis.status_online
+            elif ext not in active:
+                status = Emojis.status_idle
             else:
                 status = Emojis.status_offline
 
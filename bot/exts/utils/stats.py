@@ -0,0 +1,219 @@
+import logging
+import typing as t
+from pathlib import Path
+
+import arrow
+from aiohttp import web
+from discord import Colour, Embed
+from discord.ext.commands import Cog, Context, group
+
+from bot.bot import SeasonalBot as Bot
+from bot.constants import Client, Emojis, MODERATION_ROLES
+from bot.utils.checks import with_role_check
+from bot.utils.pagination import LinePaginator
+from bot.utils import persist
+
+log = logging.getLogger(__name__)
+
+METRICS_FILE = Path(persist.DIRECTORY, "metrics.prom")
+TOP_COMMANDS = 10  # Commands listed in the stats embed, slowest first
+
+
+class Stats(Cog):
+    """Inspect command latency and throughput, and export them for Prometheus."""
+
+    def __init__(self, bot: Bot):
+        self.bot = bot
+        self.runner: t.Optional[web.AppRunner] = None
+
+        if Client.metrics_port is not None:
+            self.bot.loop.create_task(self.start_server(Client.metrics_host, Client.metrics_port))
+
+    def render(self) -> str:
+        """Render the bot's metrics in the Prometheus text format."""
+        return self.bot.metrics.to_prometheus(
+            self.bot.http_service.stats(),
+            self.bot.image_pool.stats(),
+            self.bot.dispatcher.stats,
+            self.bot.sessions.stats(),
+        )
+
+    async def serve_metrics(self, request: web.Request) -> web.Response:
+        """Respond with the current metrics."""
+        return web.Response(text=self.render(), content_type="text/plain", charset="utf-8")
+
+    async def start_server(self, host: str, port: int) -> None:
+        """Serve the metrics on `/metrics` at `host` and `port`."""
+        app = web.Application()
+        app.router.add_get("/metrics", self.serve_metrics)
+
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host=host, port=port).start()
+        log.info(f"Serving metrics on {host}:{port}")
+
+    def cog_unload(self) -> None:
+        """Stop the metrics server, if it is running."""
+        if self.runner is not None:
+            self.bot.loop.create_task(self.runner.cleanup())
+
+    @group(name="stats", aliases=("metrics",), invoke_without_command=True)
+    async def stats_group(self, ctx: Context) -> None:
+        """Show the slowest commands and listeners, and the state of the image workers and HTTP service."""
+        metrics = self.bot.metrics
+        summary = metrics.recent_summary()
+        slowest = sorted(summary.items(), key=lambda item: item[1]["p99"], reverse=True)[:TOP_COMMANDS]
+
+        embed = Embed(
+            title="Command stats",
+            description=f"Last {len(metrics.recent)} invocations, slowest first. Times are in ms.",
+            colour=Colour.blurple(),
+        )
+
+        lines = []
+        for command, recent in slowest:
+            stats = metrics.commands[command]
+            lines.append(
+                f"`{command}`: {recent['count']:.0f}x, p50 {recent['p50'] * 1000:.0f}, "
+                f"p99 {recent['p99'] * 1000:.0f} (http {recent['http'] * 1000:.0f}, "
+                f"image {recent['image'] * 1000:.0f}, other {recent['other'] * 1000:.0f}), "
+                f"{stats.error_rate:.0%} errors"
+            )
+        embed.add_field(name="Commands", value="\n".join(lines) or "No commands invoked yet", inline=False)
+
+        failing = sorted(
+            ((command, stats) for command, stats in metrics.commands.items() if stats.errors),
+            key=lambda item: item[1].error_rate,
+            reverse=True,
+        )[:TOP_COMMANDS]
+        errors = "\n".join(
+            f"`{command}`: " + ", ".join(f"{error} {count}x" for error, count in stats.errors.most_common(3))
+            for command, stats in failing
+        )
+        embed.add_field(name="Errors", value=errors or "No errors", inline=False)
+
+        listeners = "\n".join(
+            f"`{listener}`: {stats.calls}x, {stats.total:.2f}s total, {stats.worst * 1000:.0f}ms worst, "
+            f"{stats.errors} errors"
+            for listener, stats in self.bot.dispatcher.slowest()
+            if stats.calls
+        )
+        embed.add_field(name="Listeners", value=listeners or "No listeners called yet", inline=False)
+
+        images = self.bot.image_pool.stats()
+        embed.add_field(
+            name="Image workers",
+            value=(
+                f"Queued: {images['queued']}\n"
+                f"Running: {images['running']}\n"
+                f"Rejected: {images['rejected']}"
+            )
+        )
+
+        http = self.bot.http_service.stats()
+        requests = sum(host.requests for host in http["hosts"].values())
+        embed.add_field(
+            name="HTTP",
+            value=(
+                f"Upstream: {requests}\n"
+                f"Cache hits: {http['hits']}\n"
+                f"Coalesced: {http['coalesced']}"
+            )
+        )
+
+        sessions = self.bot.sessions.stats()
+        embed.add_field(
+            name="Sessions",
+            value="\n".join(f"{event.replace('_', ' ').capitalize()}: {count}" for event, count in sessions.items())
+        )
+
+        await ctx.send(embed=embed)
+
+    @stats_group.command(name="lag", aliases=("loop",))
+    async def lag_command(self, ctx: Context) -> None:
+        """Show the event loop lag, and the commands and listeners which blocked the loop the longest."""
+        watchdog = self.bot.watchdog
+        lag = watchdog.stats()
+
+        embed = Embed(
+            title="Event loop lag",
+            description=(
+                f"Recent lag: p50 {lag['p50'] * 1000:.1f}ms, p99 {lag['p99'] * 1000:.1f}ms, "
+                f"max {lag['max'] * 1000:.0f}ms\n"
+                f"Stalls over {watchdog.threshold * 1000:.0f}ms: {lag['stalls']:.0f}"
+            ),
+            colour=Colour.blurple(),
+        )
+
+        offenders = "\n".join(
+            f"`{culprit}`: {offender.stalls}x, {offender.total:.2f}s total, {offender.worst:.2f}s worst"
+            for culprit, offender in watchdog.worst_offenders()
+        )
+        embed.add_field(name="Worst offenders", value=offenders or "No stalls yet", inline=False)
+
+        if watchdog.stalls:
+            stall = watchdog.stalls[-1]
+            stack = "".join(stall.stack)[-900:]
+            embed.add_field(
+                name=f"Latest stall: {stall.culprit}, {stall.duration:.2f}s",
+                value=f"```py\n{stack}\n```",
+                inline=False,
+            )
+
+        await ctx.send(embed=embed)
+
+    @stats_group.command(name="jobs", aliases=("scheduler",))
+    async def jobs_command(self, ctx: Context) -> None:
+        """Show the scheduled jobs, soonest first, with their last run."""
+        lines = []
+        for job in self.bot.scheduler.upcoming():
+            if job.running:
+                last = "running now"
+            elif job.last_run is not None:
+                last = f"last ran {arrow.get(job.last_run).humanize()} for {job.last_duration:.2f}s"
+            else:
+                last = "never ran"
+
+            failures = f", {job.failures}/{job.runs} runs failed" if job.failures else ""
+            lines.append(
+                f"`{job.name}` ({job.schedule}): next {arrow.get(job.next_run).humanize()}, {last}{failures}"
+            )
+
+        embed = Embed(title="Scheduled jobs", colour=Colour.blurple())
+        await LinePaginator.paginate(lines, ctx, embed, max_lines=10, empty=False)
+
+    @stats_group.command(name="ratelimits", aliases=("buckets", "hosts"))
+    async def ratelimits_command(self, ctx: Context) -> None:
+        """Show the rate limit bucket of every host requests were sent to, most requests first."""
+        governor = self.bot.http_service.governor
+        buckets = sorted(governor.stats().items(), key=lambda item: item[1]["sent"], reverse=True)
+
+        lines = []
+        for host, bucket in buckets:
+            limit = governor.bucket(host).limit
+            paused = f", paused for {bucket['blocked']:.0f}s" if bucket["blocked"] else ""
+            lines.append(
+                f"`{host}` ({limit.requests} per {limit.per:g}s): {bucket['tokens']:.1f}/{bucket['capacity']} left, "
+                f"{bucket['queued']} queued{paused}, {bucket['sent']} sent, {bucket['shed']} shed"
+            )
+
+        embed = Embed(title="Rate limits", colour=Colour.blurple())
+        await LinePaginator.paginate(lines, ctx, embed, max_lines=10, empty=False)
+
+    @stats_group.command(name="dump")
+    async def dump_command(self, ctx: Context) -> None:
+        """Write all metrics to a file in the Prometheus text format."""
+        await persist.write_text(METRICS_FILE, self.render())
+
+        log.info(f"{ctx.author} dumped the metrics to {METRICS_FILE}")
+        await ctx.send(f"{Emojis.ok_hand} Metrics written to `{METRICS_FILE}`.")
+
+    # This cannot be static (must have a __func__ attribute).
+    def cog_check(self, ctx: Context) -> bool:
+        """Only allow moderators to invoke the commands in this cog."""
+        return with_role_check(ctx, *MODERATION_ROLES)
+
+
+def setup(bot: Bot) -> None:
+    """Load the Stats cog."""
+    bot.add_cog(Stats(bot))
@@ -1,9 +1,7 @@
 import bisect
 import hashlib
-import json
 import logging
 import random
-from pathlib import Path
 from typing import Union
 
 import discord
@@ -12,12 +10,15 @@ from discord.ext import commands
 from discord.ext.commands import BadArgument, Cog, clean_content
 
 from bot.constants import Roles
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with Path("bot/resources/valentines/love_matches.json").open(encoding="utf8") as file:
-    LOVE_DATA = json.load(file)
-    LOVE_DATA = sorted((int(key), value) for key, value in LOVE_DATA.items())
+LOVE_DATA = resource(
+    "bot/resources/valentines/love_matches.json",
+    shape={str: {"titles": [str], "text": str}},
+    transform=lambda data: sorted((int(key), value) for key, value in data.items())
+)
 
 
 class LoveCalculator(Cog):
@@ -79,10 +80,10 @@ class LoveCalculator(Cog):
         # We need the -1 due to how bisect returns the point
         # see the documentation for further detail
         # https://docs.python.org/3/library/bisect.html#bisect.bisect
-        index = bisect.bisect(LOVE_DATA, (love_percent,)) - 1
+        index = bisect.bisect(LOVE_DATA.data, (love_percent,)) - 1
         # We already have the nearest "fit" love level
         # We only need the dict, so we can ditch the first element
-        _, data = LOVE_DATA[index]
+        _, data = LOVE_DATA.data[index]
 
         status = random.choice(data['titles'])
         embed = discord.Embed(
@@ -1,18 +1,17 @@
-import collections
-import json
 import logging
-from pathlib import Path
 from random import choice
+from typing import Dict
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.fuzzy import BKTree
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/valentines/valenstates.json"), "r", encoding="utf8") as file:
-    STATES = json.load(file)
+STATES = resource("bot/resources/valentines/valenstates.json", shape={str: {"text": str, "flag": str}})
 
 
 class MyValenstate(commands.Cog):
@@ -21,40 +20,29 @@ class MyValenstate(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
-    def levenshtein(self, source: str, goal: str) -> int:
-        """Calculates the Levenshtein Distance between source and goal."""
-        if len(source) < len(goal):
-            return self.levenshtein(goal, source)
-        if len(source) == 0:
-            return len(goal)
-        if len(goal) == 0:
-            return len(source)
+        # Tree of the states' normalised names, rebuilt whenever the resource is reloaded
+        self._states = None
+        self._names: Dict[str, str] = {}
+        self._tree = BKTree(())
 
-        pre_row = list(range(0, len(source) + 1))
-        for i, source_c in enumerate(source):
-            cur_row = [i + 1]
-            for j, goal_c in enumerate(goal):
-                if source_c != goal_c:
-                    cur_row.append(min(pre_row[j], pre_row[j + 1], cur_row[j]) + 1)
-                else:
-                    cur_row.append(min(pre_row[j], pre_row[j + 1], cur_row[j]))
-            pre_row = cur_row
-        return pre_row[-1]
+    def get_tree(self) -> BKTree:
+        """Return the tree of normalised state names, rebuilding it if the states changed."""
+        if self._states is not STATES.data:
+            self._states = STATES.data
+            self._names = {state.lower().replace(' ', ''): state for state in self._states}
+            self._tree = BKTree(self._names)
+        return self._tree
 
     @commands.command()
     async def myvalenstate(self, ctx: commands.Context, *, name: str = None) -> None:
         """Find the vacation spot(s) with the most matching characters to the invoking user."""
-        eq_chars = collections.defaultdict(int)
         if name is None:
             author = ctx.message.author.name.lower().replace(' ', '')
         else:
             author = name.lower().replace(' ', '')
 
-        for state in STATES.keys():
-            lower_state = state.lower().replace(' ', '')
-            eq_chars[state] = self.levenshtein(author, lower_state)
-
-        matches = [x for x, y in eq_chars.items() if y == min(eq_chars.values())]
+        _, nearest = self.get_tree().nearest(author)
+        matches = [self._names[match] for match in nearest]
         valenstate = choice(matches)
         matches.remove(valenstate)
 
@@ -73,11 +61,11 @@ class MyValenstate(commands.Cog):
 
         embed = discord.Embed(
             title=f'Your Valenstate is {valenstate} \u2764',
-            description=f'{STATES[valenstate]["text"]}',
+            description=f'{STATES.data[valenstate]["text"]}',
             colour=Colours.pink
         )
         embed.add_field(name=embed_title, value=embed_text)
-        embed.set_image(url=STATES[valenstate]["flag"])
+        embed.set_image(url=STATES.data[valenstate]["flag"])
         await ctx.channel.send(embed=embed)
 
 
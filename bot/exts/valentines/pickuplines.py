@@ -1,17 +1,14 @@
 import logging
-import random
-from json import load
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/valentines/pickup_lines.json"), "r", encoding="utf8") as f:
-    pickup_lines = load(f)
+PICKUP_LINES = resource("bot/resources/valentines/pickup_lines.json", shape={"placeholder": str, "lines": [dict]})
 
 
 class PickupLine(commands.Cog):
@@ -27,14 +24,14 @@ class PickupLine(commands.Cog):
 
         Note that most of them are very cheesy.
         """
-        random_line = random.choice(pickup_lines['lines'])
+        random_line = PICKUP_LINES.choice("lines")
         embed = discord.Embed(
             title=':cheese: Your pickup line :cheese:',
             description=random_line['line'],
             color=Colours.pink
         )
         embed.set_thumbnail(
-            url=random_line.get('image', pickup_lines['placeholder'])
+            url=random_line.get('image', PICKUP_LINES.data["placeholder"])
         )
         await ctx.send(embed=embed)
 
@@ -1,19 +1,17 @@
 import logging
 import random
-from json import load
-from pathlib import Path
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
 HEART_EMOJIS = [":heart:", ":gift_heart:", ":revolving_hearts:", ":sparkling_heart:", ":two_hearts:"]
 
-with open(Path("bot/resources/valentines/date_ideas.json"), "r", encoding="utf8") as f:
-    VALENTINES_DATES = load(f)
+VALENTINES_DATES = resource("bot/resources/valentines/date_ideas.json", shape={"ideas": [dict]})
 
 
 class SaveTheDate(commands.Cog):
@@ -25,7 +23,7 @@ class SaveTheDate(commands.Cog):
     @commands.command()
     async def savethedate(self, ctx: commands.Context) -> None:
         """Gives you ideas for what to do on a date with your valentine."""
-        random_date = random.choice(VALENTINES_DATES['ideas'])
+        random_date = VALENTINES_DATES.choice("ideas")
         emoji_1 = random.choice(HEART_EMOJIS)
         emoji_2 = random.choice(HEART_EMOJIS)
         embed = discord.Embed(
@@ -1,17 +1,14 @@
-import json
 import logging
-from pathlib import Path
-from random import choice
 
 import discord
 from discord.ext import commands
 
 from bot.constants import Colours
+from bot.utils.resources import resource
 
 log = logging.getLogger(__name__)
 
-with open(Path("bot/resources/valentines/valentine_facts.json"), "r", encoding="utf8") as file:
-    FACTS = json.load(file)
+FACTS = resource("bot/resources/valentines/valentine_facts.json", shape={"whois": str, "titles": [str], "text": [str]})
 
 
 class ValentineFacts(commands.Cog):
@@ -25,7 +22,7 @@ class ValentineFacts(commands.Cog):
         """Displays info about Saint Valentine."""
         embed = discord.Embed(
             title="Who is Saint Valentine?",
-            description=FACTS['whois'],
+            description=FACTS.data["whois"],
             color=Colours.pink
         )
         embed.set_thumbnail(
@@ -39,8 +36,8 @@ class ValentineFacts(commands.Cog):
     async def valentine_fact(self, ctx: commands.Context) -> None:
         """Shows a random fact about Valentine's Day."""
         embed = discord.Embed(
-            title=choice(FACTS['titles']),
-            description=choice(FACTS['text']),
+            title=FACTS.choice("titles"),
+            description=FACTS.choice("text"),
             color=Colours.pink
         )
 
@@ -1,8 +1,10 @@
 import logging
+import math
+import time
 import typing as t
+from datetime import datetime, timezone
 
-from bot.constants import Colours, Month
-from bot.utils import resolve_current_month
+from bot.constants import Client, Colours, Month
 from bot.utils.exceptions import BrandingError
 
 log = logging.getLogger(__name__)
@@ -131,18 +133,7 @@ def get_all_seasons() -> t.List[t.Type[SeasonBase]]:
 
 def get_current_season() -> t.Type[SeasonBase]:
     """Give active season, based on current UTC month."""
-    current_month = resolve_current_month()
-
-    active_seasons = tuple(
-        season
-        for season in SeasonBase.__subclasses__()
-        if current_month in season.months
-    )
-
-    if not active_seasons:
-        return SeasonBase
-
-    return active_seasons[0]
+    return clock.season
 
 
 def get_season(name: str) -> t.Optional[t.Type[SeasonBase]]:
@@ -178,4 +169,77 @@ def _validate_season_overlap() -> None:
                 month_to_season[month] = season
 
 
+def _find_season(month: Month) -> t.Type[SeasonBase]:
+    """Give the season active in `month`, or `SeasonBase` if there is none."""
+    for season in SeasonBase.__subclasses__():
+        if month in season.months:
+            return season
+
+    return SeasonBase
+
+
+class SeasonClock:
+    """
+    The current month and season, resolved once a month rather than on every check.
+
+    The season of every month is looked up once, into `seasons`. The current month is cached until
+    the next UTC month starts, so reading it is a comparison against that time, without any datetime
+    work. If `Client.month_override` is set, the month resolves to it and never expires.
+
+    The clock doesn't announce the season changing by itself: `tick` is called whenever a month
+    starts, which the bot does from its scheduler, dispatching a `season_change` event to the cogs.
+    """
+
+    def __init__(self):
+        self.seasons: t.Dict[Month, t.Type[SeasonBase]] = {month: _find_season(month) for month in Month}
+        self._month: t.Optional[Month] = None
+        self._expires = 0.0  # Timestamp after which the cached month is resolved again
+        self._announced = self.season
+
+    def _resolve(self) -> None:
+        """Resolve the current month, and cache it until the next one starts."""
+        if Client.month_override is not None:
+            self._month = Month(Client.month_override)
+            self._expires = math.inf
+            return
+
+        now = datetime.now(timezone.utc)
+        if now.month == 12:
+            next_month = datetime(now.year + 1, 1, 1, tzinfo=timezone.utc)
+        else:
+            next_month = datetime(now.year, now.month + 1, 1, tzinfo=timezone.utc)
+
+        self._month = Month(now.month)
+        self._expires = next_month.timestamp()
+
+    @property
+    def month(self) -> Month:
+        """The current UTC month, or `Client.month_override` if it is set."""
+        if time.time() >= self._expires:
+            self._resolve()
+        return self._month
+
+    @property
+    def season(self) -> t.Type[SeasonBase]:
+        """The season active in the current month."""
+        return self.seasons[self.month]
+
+    def tick(self) -> t.Optional[t.Tuple[t.Type[SeasonBase], t.Type[SeasonBase]]]:
+        """
+        Give the previous and the new season if the season changed since the last tick, else None.
+
+        The month is resolved again regardless of the cache, in case the system clock was adjusted.
+        """
+        self._expires = 0.0
+        season = self.season
+
+        if season is self._announced:
+            return None
+
+        previous, self._announced = self._announced, season
+        log.info(f"Season changed from {previous.season_name} to {season.season_name}")
+        return previous, season
+
+
 _validate_season_overlap()
+clock = SeasonClock()
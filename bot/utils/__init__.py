@@ -2,13 +2,12 @@ import asyncio
 import contextlib
 import re
 import string
-from datetime import datetime
 from typing import Iterable, List
 
 import discord
 from discord.ext.commands import BadArgument, Context
 
-from bot.constants import Client, Month
+from bot.constants import Month
 from bot.utils.pagination import LinePaginator
 
 
@@ -17,19 +16,6 @@ def human_months(months: Iterable[Month]) -> str:
     return ", ".join(str(m) for m in months)
 
 
-def resolve_current_month() -> Month:
-    """
-    Determine current month w.r.t. `Client.month_override` env var.
-
-    If the env variable was set, current month always resolves to the configured value.
-    Otherwise, the current UTC month is given.
-    """
-    if Client.month_override is not None:
-        return Month(Client.month_override)
-    else:
-        return Month(datetime.utcnow().month)
-
-
 async def disambiguate(
         ctx: Context, entries: List[str], *, timeout: float = 30,
         entries_per_page: int = 20, empty: bool = False, embed: discord.Embed = None
@@ -51,15 +37,13 @@ async def disambiguate(
     choices = (f'{index}: {entry}' for index, entry in enumerate(entries, start=1))
 
     def check(message: discord.Message) -> bool:
-        return (message.content.isdigit()
-                and message.author == ctx.author
-                and message.channel == ctx.channel)
+        return message.content.isdigit() and message.author == ctx.author
 
     try:
         if embed is None:
             embed = discord.Embed()
 
-        coro1 = ctx.bot.wait_for('message', check=check, timeout=timeout)
+        coro1 = ctx.bot.sessions.wait_for('message', ctx.channel.id, check=check, timeout=timeout)
         coro2 = LinePaginator.paginate(choices, ctx, embed=embed, max_lines=entries_per_page,
                                        empty=empty, max_size=6000, timeout=9000)
 
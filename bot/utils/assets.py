@@ -0,0 +1,94 @@
+import logging
+import time
+import typing as t
+from collections import OrderedDict
+from pathlib import Path
+
+from PIL import Image
+
+__all__ = ("ImageCache", "image_cache")
+
+log = logging.getLogger(__name__)
+
+MAX_SIZE = 64 * 2**20  # Total bytes of decoded pixel data kept in memory
+
+Size = t.Optional[t.Tuple[int, int]]
+AssetKey = t.Tuple[str, Size]
+
+
+def image_size(im: Image.Image) -> int:
+    """Return the approximate number of bytes taken up by the pixel data of `im`."""
+    return im.width * im.height * len(im.getbands())
+
+
+class ImageCache:
+    """
+    In-memory cache of decoded static images from `bot/resources`.
+
+    Decoding a PNG and resizing it is far more expensive than copying the decoded pixels, so images
+    are decoded once (optionally resized) and then handed out as copies, which callers are free to
+    modify. Pixel data is capped at `max_size` bytes; least recently used images are evicted first.
+
+    Extensions call `preload` from their `setup` to warm the cache, so that even the first
+    invocation of a command finds its assets already decoded. Image pool workers are forked from
+    the bot process after extensions are loaded, so they inherit the warmed cache as well.
+    """
+
+    def __init__(self, max_size: int = MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+
+        self.hits = 0
+        self.misses = 0
+        self._images: t.OrderedDict[AssetKey, Image.Image] = OrderedDict()
+
+    def _load(self, key: AssetKey) -> Image.Image:
+        """Return the cached image for `key`, decoding and storing it first if necessary."""
+        if (im := self._images.get(key)) is not None:
+            self.hits += 1
+            self._images.move_to_end(key)
+            return im
+
+        self.misses += 1
+        path, size = key
+
+        start = time.perf_counter()
+        im = Image.open(path)
+        if size is not None:
+            im = im.resize(size)
+        im.load()
+        log.trace(f"Decoded {path} at {size or im.size} in {(time.perf_counter() - start) * 1000:.0f}ms")
+
+        self._images[key] = im
+        self.size += image_size(im)
+
+        while self.size > self.max_size and len(self._images) > 1:
+            _, evicted = self._images.popitem(last=False)
+            self.size -= image_size(evicted)
+
+        return im
+
+    def get(self, path: t.Union[str, Path], *, size: Size = None) -> Image.Image:
+        """
+        Return a copy of the image at `path`, resized to `size` if given.
+
+        Each distinct `size` of the same image is cached separately.
+        """
+        return self._load((str(path), size)).copy()
+
+    def preload(self, *paths: t.Union[str, Path], size: Size = None) -> None:
+        """Decode the images at `paths` (resized to `size`, if given) ahead of their first use."""
+        for path in paths:
+            self._load((str(path), size))
+
+    def stats(self) -> t.Dict[str, int]:
+        """Return a snapshot of the cache counters."""
+        return {
+            "images": len(self._images),
+            "size": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+image_cache = ImageCache()
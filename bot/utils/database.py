@@ -0,0 +1,80 @@
+import asyncio
+import logging
+import sqlite3
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from bot.utils.persist import DIRECTORY
+
+__all__ = ("Database",)
+
+log = logging.getLogger(__name__)
+
+T = t.TypeVar("T")
+
+
+class Database:
+    """
+    An SQLite database in the persistent data directory, accessed without blocking the event loop.
+
+    The database is created at `DIRECTORY / path` on first use, and `schema` is run on every
+    connect, so it should only contain `CREATE ... IF NOT EXISTS` statements. It is opened in WAL
+    mode, so that readers never wait for a writer, and commits only wait for the log to be written.
+
+    All database access happens on a single worker thread. Blocking code which needs several
+    statements to happen atomically can be run there with `run`, inside `with db:` to wrap it in a
+    transaction.
+    """
+
+    def __init__(self, path: t.Union[str, Path], schema: str):
+        self.path = Path(DIRECTORY, path)
+        self.schema = schema
+
+        name = self.path.stem.replace("_", "-")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"db-{name}")
+        self._db: t.Optional[sqlite3.Connection] = None  # Opened lazily on the worker thread
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, creating the database on first use."""
+        if self._db is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = NORMAL")
+            self._db.executescript(self.schema)
+            log.trace(f"Opened database {self.path}")
+        return self._db
+
+    async def run(self, func: t.Callable[..., T], *args) -> T:
+        """Call `func(connection, *args)` on the worker thread and return its result."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, lambda: func(self._connect(), *args))
+
+    async def execute(self, sql: str, params: t.Sequence = ()) -> int:
+        """Execute a single statement in its own transaction, and return the number of rows it changed."""
+        def _execute(db: sqlite3.Connection) -> int:
+            with db:
+                return db.execute(sql, params).rowcount
+
+        return await self.run(_execute)
+
+    async def fetchone(self, sql: str, params: t.Sequence = ()) -> t.Optional[t.Tuple]:
+        """Return the first row of a query, if any."""
+        return await self.run(lambda db: db.execute(sql, params).fetchone())
+
+    async def fetchall(self, sql: str, params: t.Sequence = ()) -> t.List[t.Tuple]:
+        """Return all rows of a query."""
+        return await self.run(lambda db: db.execute(sql, params).fetchall())
+
+    def _close(self) -> None:
+        """Blocking implementation of `close`."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def close(self) -> None:
+        """Close the connection and stop the worker thread."""
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._close)
+        self._executor.shutdown(wait=False)
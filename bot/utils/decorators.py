@@ -1,4 +1,3 @@
-import asyncio
 import functools
 import logging
 import random
@@ -12,9 +11,8 @@ from discord.ext import commands
 from discord.ext.commands import CheckFailure, Command, Context
 
 from bot.constants import Client, ERROR_REPLIES, Month
-from bot.utils import human_months, resolve_current_month
-
-ONE_DAY = 24 * 60 * 60
+from bot.seasons import clock
+from bot.utils import human_months
 
 log = logging.getLogger(__name__)
 
@@ -31,48 +29,17 @@ class InMonthCheckFailure(CheckFailure):
     pass
 
 
-def seasonal_task(*allowed_months: Month, sleep_time: t.Union[float, int] = ONE_DAY) -> t.Callable:
-    """
-    Perform the decorated method periodically in `allowed_months`.
-
-    This provides a convenience wrapper to avoid code repetition where some task shall
-    perform an operation repeatedly in a constant interval, but only in specific months.
-
-    The decorated function will be called once every `sleep_time` seconds while
-    the current UTC month is in `allowed_months`. Sleep time defaults to 24 hours.
-
-    The wrapped task is responsible for waiting for the bot to be ready, if necessary.
-    """
-    def decorator(task_body: t.Callable) -> t.Callable:
-        @functools.wraps(task_body)
-        async def decorated_task(*args, **kwargs) -> None:
-            """Call `task_body` once every `sleep_time` seconds in `allowed_months`."""
-            log.info(f"Starting seasonal task {task_body.__qualname__} ({human_months(allowed_months)})")
-
-            while True:
-                current_month = resolve_current_month()
-
-                if current_month in allowed_months:
-                    await task_body(*args, **kwargs)
-                else:
-                    log.debug(f"Seasonal task {task_body.__qualname__} sleeps in {current_month!s}")
-
-                await asyncio.sleep(sleep_time)
-        return decorated_task
-    return decorator
-
-
 def in_month_listener(*allowed_months: Month) -> t.Callable:
     """
     Shield a listener from being invoked outside of `allowed_months`.
 
-    The check is performed against current UTC month.
+    The check is performed against current UTC month, as cached by the season clock.
     """
     def decorator(listener: t.Callable) -> t.Callable:
         @functools.wraps(listener)
         async def guarded_listener(*args, **kwargs) -> None:
             """Wrapped listener will abort if not in allowed month."""
-            current_month = resolve_current_month()
+            current_month = clock.month
 
             if current_month in allowed_months:
                 # Propagate return value although it should always be None
@@ -87,10 +54,10 @@ def in_month_command(*allowed_months: Month) -> t.Callable:
     """
     Check whether the command was invoked in one of `enabled_months`.
 
-    Uses the current UTC month at the time of running the predicate.
+    Uses the current UTC month at the time of running the predicate, as cached by the season clock.
     """
     async def predicate(ctx: Context) -> bool:
-        current_month = resolve_current_month()
+        current_month = clock.month
         can_run = current_month in allowed_months
 
         log.debug(
@@ -0,0 +1,184 @@
+import asyncio
+import inspect
+import logging
+import time
+import typing as t
+from dataclasses import dataclass
+
+import discord
+from discord.ext import commands
+
+from bot.constants import Month
+from bot.seasons import clock
+
+__all__ = ("Dispatcher", "ListenerFilter", "ListenerStats", "listen")
+
+log = logging.getLogger(__name__)
+
+Handler = t.Callable[..., t.Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class ListenerFilter:
+    """
+    The events a listener is interested in.
+
+    Empty `channels` or `months` match any channel or month. `content` is searched for in the
+    lowercased message content, and only applies to message events.
+    """
+
+    channels: t.FrozenSet[int] = frozenset()
+    months: t.FrozenSet[Month] = frozenset()
+    humans_only: bool = True
+    content: t.Optional[t.Pattern] = None
+
+
+@dataclass
+class ListenerStats:
+    """Call totals of a single listener."""
+
+    calls: int = 0
+    errors: int = 0
+    total: float = 0.0
+    worst: float = 0.0
+
+    def record(self, duration: float) -> None:
+        """Account for a call which took `duration` seconds."""
+        self.calls += 1
+        self.total += duration
+        self.worst = max(self.worst, duration)
+
+
+@dataclass(frozen=True)
+class EventParts:
+    """The parts of a gateway event which listeners can be filtered on."""
+
+    author: t.Union[discord.Member, discord.User]
+    channel: discord.abc.Messageable
+    content: t.Optional[str]
+
+
+# How to get the filtered parts out of the arguments of each supported event
+EVENTS: t.Dict[str, t.Callable[..., EventParts]] = {
+    "message": lambda message: EventParts(message.author, message.channel, message.content),
+    "reaction_add": lambda reaction, user: EventParts(user, reaction.message.channel, None),
+}
+
+
+def listen(
+    event: str,
+    *,
+    channels: t.Iterable[int] = (),
+    months: t.Iterable[Month] = (),
+    humans_only: bool = True,
+    content: t.Optional[t.Pattern] = None,
+) -> t.Callable[[Handler], Handler]:
+    """
+    Register the decorated cog method as a listener of `event` through the bot's `Dispatcher`.
+
+    The listener is only called for events in `channels`, during `months`, from humans unless
+    `humans_only` is False, and for messages whose lowercased content matches the `content` pattern.
+
+    Unlike `commands.Cog.listener`, the event name is given without its "on_" prefix, as in
+    `listen("message")`, and only the events in `EVENTS` are supported.
+    """
+    if event not in EVENTS:
+        raise ValueError(f"Listening to {event!r} through the dispatcher is not supported")
+    if content is not None and event != "message":
+        raise ValueError("Content filters only apply to message events")
+
+    def decorator(handler: Handler) -> Handler:
+        if not inspect.iscoroutinefunction(handler):
+            raise TypeError("Listener callback is not a coroutine.")
+
+        handler.__dispatch_listener__ = (
+            event, ListenerFilter(frozenset(channels), frozenset(months), humans_only, content)
+        )
+        return handler
+    return decorator
+
+
+class Dispatcher:
+    """
+    Route gateway events to the listeners registered with `listen`.
+
+    Listeners are indexed by event and channel, so an event is only checked against the listeners
+    of its channel and the listeners of every channel. The current month, whether the author is a
+    bot and the lowercased content are only resolved once per event, however many listeners are
+    registered.
+
+    Every listener is run in its own task, like discord.py's own listeners, and its calls are timed.
+    """
+
+    def __init__(self):
+        # Listeners by event, then by channel, with None for those listening in every channel
+        self._listeners: t.Dict[str, t.Dict[t.Optional[int], t.List[t.Tuple[Handler, ListenerFilter]]]] = {
+            event: {} for event in EVENTS
+        }
+        self.stats: t.Dict[str, ListenerStats] = {}
+
+    def add_cog(self, cog: commands.Cog) -> None:
+        """Register the listeners of `cog`."""
+        for _, method in inspect.getmembers(cog, inspect.ismethod):
+            registration = getattr(method, "__dispatch_listener__", None)
+            if registration is not None:
+                self.add_listener(method, *registration)
+
+    def remove_cog(self, cog: commands.Cog) -> None:
+        """Unregister the listeners of `cog`."""
+        for by_channel in self._listeners.values():
+            for listeners in by_channel.values():
+                listeners[:] = [listener for listener in listeners if getattr(listener[0], "__self__", None) is not cog]
+
+    def add_listener(self, handler: Handler, event: str, listener_filter: ListenerFilter) -> None:
+        """Register `handler` to be called with the arguments of `event` when they pass `listener_filter`."""
+        by_channel = self._listeners[event]
+        for channel in listener_filter.channels or (None,):
+            by_channel.setdefault(channel, []).append((handler, listener_filter))
+
+        self.stats.setdefault(handler.__qualname__, ListenerStats())
+        log.trace(f"Registered {handler.__qualname__} as a dispatched {event} listener")
+
+    def dispatch(self, event: str, *args) -> None:
+        """Call every listener of `event` interested in it, in a task each. Events not in `EVENTS` are ignored."""
+        by_channel = self._listeners.get(event)
+        if not by_channel:
+            return
+
+        parts = EVENTS[event](*args)
+        listeners = [*by_channel.get(parts.channel.id, ()), *by_channel.get(None, ())]
+        if not listeners:
+            return
+
+        month = clock.month
+        is_bot = parts.author.bot
+        content = None
+
+        for handler, listener_filter in listeners:
+            if listener_filter.months and month not in listener_filter.months:
+                continue
+            if listener_filter.humans_only and is_bot:
+                continue
+            if listener_filter.content is not None:
+                if content is None:
+                    content = parts.content.lower()
+                if not listener_filter.content.search(content):
+                    continue
+
+            asyncio.ensure_future(self._run(handler, args))
+
+    async def _run(self, handler: Handler, args: t.Tuple) -> None:
+        """Call `handler` with `args`, timing it and logging its errors."""
+        stats = self.stats[handler.__qualname__]
+        start = time.perf_counter()
+        try:
+            await handler(*args)
+        except Exception:
+            stats.errors += 1
+            log.exception(f"Unhandled exception in dispatched listener {handler.__qualname__}")
+        finally:
+            stats.record(time.perf_counter() - start)
+
+    def slowest(self, count: int = 5) -> t.List[t.Tuple[str, ListenerStats]]:
+        """Return the `count` listeners which took the longest in total."""
+        return sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True)[:count]
@@ -8,3 +8,15 @@ class UserNotPlayingError(Exception):
     """Will raised when user try to use game commands when not playing."""
 
     pass
+
+
+class ImageProcessingError(Exception):
+    """Raised when an image job is rejected by, or times out in, the image worker pool."""
+
+    pass
+
+
+class RateLimitedError(Exception):
+    """Raised when an outbound request is shed by the rate-limit governor, instead of waiting for its host."""
+
+    pass
@@ -1,9 +1,12 @@
+import functools
 import importlib
 import inspect
 import pkgutil
-from typing import Iterator, NoReturn
+from typing import Collection, Dict, FrozenSet, Iterator, NoReturn, Type
 
 from bot import exts
+from bot.exts import get_package_names
+from bot.seasons import SeasonBase
 
 
 def unqualify(name: str) -> str:
@@ -11,13 +14,21 @@ def unqualify(name: str) -> str:
     return name.rsplit(".", maxsplit=1)[-1]
 
 
-def walk_extensions() -> Iterator[str]:
-    """Yield extension names from the bot.exts subpackage."""
+def walk_extensions(package: str) -> Iterator[str]:
+    """
+    Yield extension names from the `package` subpackage of bot.exts.
+
+    Only `package` and its own subpackages are imported to find out whether they are extensions.
+    """
 
     def on_error(name: str) -> NoReturn:
         raise ImportError(name=name)  # pragma: no cover
 
-    for module in pkgutil.walk_packages(exts.__path__, f"{exts.__name__}.", onerror=on_error):
+    root = importlib.import_module(f"{exts.__name__}.{package}")
+    if inspect.isfunction(getattr(root, "setup", None)):
+        yield root.__name__
+
+    for module in pkgutil.walk_packages(root.__path__, f"{root.__name__}.", onerror=on_error):
         if unqualify(module.name).startswith("_"):
             # Ignore module/package names starting with an underscore.
             continue
@@ -31,4 +42,51 @@ def walk_extensions() -> Iterator[str]:
         yield module.name
 
 
-EXTENSIONS = frozenset(walk_extensions())
+@functools.lru_cache(maxsize=None)
+def _get_package_extensions(package: str) -> FrozenSet[str]:
+    """Return the extensions in the `package` subpackage of bot.exts, walking it on first use."""
+    return frozenset(walk_extensions(package))
+
+
+def get_extensions(exclude: Collection[str] = ()) -> FrozenSet[str]:
+    """
+    Return the names of all extensions in bot.exts, skipping the top-level packages in `exclude`.
+
+    Packages are only walked, and thus imported, when their extensions are first asked for.
+    Excluding the dormant seasonal packages therefore leaves them unimported.
+    """
+    extensions = set()
+
+    for module in pkgutil.iter_modules(exts.__path__, f"{exts.__name__}."):
+        name = unqualify(module.name)
+        if name.startswith("_") or name in exclude:
+            continue
+
+        if module.ispkg:
+            extensions.update(_get_package_extensions(name))
+        else:
+            extensions.add(module.name)
+
+    return frozenset(extensions)
+
+
+def get_package(extension: str) -> str:
+    """Return the name of the top-level package in bot.exts that `extension` belongs to."""
+    return extension[len(exts.__name__) + 1:].split(".", maxsplit=1)[0]
+
+
+def get_seasonal_packages() -> Dict[str, Type[SeasonBase]]:
+    """
+    Map the names of seasonal packages in bot.exts to their season.
+
+    A package is seasonal if it is named after a season class, e.g. `halloween` for `Halloween`.
+    Extensions in any other package are active all year round.
+    """
+    seasons = {season.__name__.casefold(): season for season in SeasonBase.__subclasses__()}
+    return {package: seasons[package] for package in get_package_names() if package in seasons}
+
+
+def get_active_extensions(season: Type[SeasonBase]) -> FrozenSet[str]:
+    """Return all extensions which should be loaded while `season` is active, without importing other seasons'."""
+    dormant = {package for package, package_season in get_seasonal_packages().items() if package_season is not season}
+    return get_extensions(exclude=dormant)
@@ -0,0 +1,192 @@
+import heapq
+import math
+import typing as t
+from collections import Counter
+
+from fuzzywuzzy import fuzz
+
+__all__ = ("BKTree", "FuzzyIndex", "levenshtein", "ngrams")
+
+NGRAM_SIZE = 3
+# Fraction of the n-grams of the query, or of the candidate if it is shorter, which a candidate must share to be scored
+MIN_OVERLAP = 0.25
+
+Scorer = t.Callable[[str, str], float]
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> t.Set[str]:
+    """
+    Return the set of `n`-grams of `text`.
+
+    The text is padded, so that its start and end make up n-grams of their own, and strings
+    shorter than `n` still have some.
+    """
+    padded = " " * (n - 1) + text + " "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def levenshtein(source: str, goal: str) -> int:
+    """Calculates the Levenshtein Distance between source and goal."""
+    if len(source) < len(goal):
+        return levenshtein(goal, source)
+    if len(goal) == 0:
+        return len(source)
+
+    pre_row = list(range(len(goal) + 1))
+    for i, source_c in enumerate(source):
+        cur_row = [i + 1]
+        for j, goal_c in enumerate(goal):
+            cur_row.append(min(pre_row[j] + (source_c != goal_c), pre_row[j + 1] + 1, cur_row[j] + 1))
+        pre_row = cur_row
+    return pre_row[-1]
+
+
+class FuzzyIndex:
+    """
+    Trigram index for fuzzy lookups in a fixed set of strings.
+
+    Instead of scoring the query against every choice, the index only scores the choices which
+    share at least `min_overlap` of the n-grams of the query (or of the choice, if it is shorter,
+    so that substring matches are kept), found through an inverted index of n-gram to choices.
+    Build it once per corpus, then `search` it as often as needed.
+
+    Choices may have `aliases`: other strings which match the choice, such as its separate words.
+    A choice scores as well as its best matching alias.
+    """
+
+    def __init__(
+        self,
+        choices: t.Iterable[str],
+        *,
+        aliases: t.Optional[t.Mapping[str, t.Iterable[str]]] = None,
+        processor: t.Callable[[str], str] = str.lower,
+        min_overlap: float = MIN_OVERLAP,
+    ):
+        self.processor = processor
+        self.min_overlap = min_overlap
+
+        # Every key is a processed choice or alias, along with the choice it stands for
+        self._keys: t.List[t.Tuple[str, str]] = []
+        self._sizes: t.List[int] = []  # Number of n-grams of each key
+        self._exact: t.Dict[str, str] = {}
+        self._postings: t.Dict[str, t.List[int]] = {}
+
+        aliases = aliases or {}
+        for choice in choices:
+            for text in (choice, *aliases.get(choice, ())):
+                self._add(processor(text), choice)
+
+    def _add(self, key: str, choice: str) -> None:
+        """Add `key` to the index as a way to match `choice`."""
+        if not key:
+            return
+
+        self._exact.setdefault(key, choice)
+        grams = ngrams(key)
+        key_id = len(self._keys)
+        self._keys.append((key, choice))
+        self._sizes.append(len(grams))
+
+        for gram in grams:
+            self._postings.setdefault(gram, []).append(key_id)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def get(self, query: str) -> t.Optional[str]:
+        """Return the choice which `query` matches exactly once processed, if any."""
+        return self._exact.get(self.processor(query))
+
+    def candidates(self, query: str) -> t.List[t.Tuple[str, str]]:
+        """Return the processed keys and their choices which share enough n-grams with the processed `query`."""
+        grams = ngrams(query)
+
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        return [
+            self._keys[key_id] for key_id, count in shared.items()
+            if count >= math.ceil(min(len(grams), self._sizes[key_id]) * self.min_overlap)
+        ]
+
+    def search(
+        self,
+        query: str,
+        *,
+        scorer: Scorer = fuzz.ratio,
+        cutoff: float = 0,
+        limit: t.Optional[int] = 5,
+    ) -> t.List[t.Tuple[float, str]]:
+        """
+        Return up to `limit` (all, if None) `(score, choice)` pairs scoring at least `cutoff`, best first.
+
+        `scorer` is called with the processed query and a processed key.
+        """
+        query = self.processor(query)
+
+        scores: t.Dict[str, float] = {}
+        for key, choice in self.candidates(query):
+            score = scorer(query, key)
+            if score >= cutoff and score > scores.get(choice, -math.inf):
+                scores[choice] = score
+
+        results = ((score, choice) for choice, score in scores.items())
+        if limit is None:
+            return sorted(results, key=lambda result: result[0], reverse=True)
+        return heapq.nlargest(limit, results, key=lambda result: result[0])
+
+
+class BKTree:
+    """
+    Burkhard-Keller tree over a set of strings, for exact nearest neighbour lookups by edit distance.
+
+    The triangle inequality lets a search skip every subtree whose distance to its parent
+    rules out beating the best match found so far.
+    """
+
+    def __init__(self, items: t.Iterable[str], *, distance: t.Callable[[str, str], int] = levenshtein):
+        self.distance = distance
+        self._root: t.Optional[t.Tuple[str, t.Dict[int, t.Any]]] = None
+
+        for item in items:
+            self.add(item)
+
+    def add(self, item: str) -> None:
+        """Insert `item` into the tree."""
+        if self._root is None:
+            self._root = (item, {})
+            return
+
+        node = self._root
+        while True:
+            parent, children = node
+            dist = self.distance(item, parent)
+            if dist == 0:
+                return
+            if dist not in children:
+                children[dist] = (item, {})
+                return
+            node = children[dist]
+
+    def nearest(self, query: str) -> t.Tuple[int, t.List[str]]:
+        """Return the smallest distance from `query` to an item, and every item at that distance."""
+        if self._root is None:
+            return 0, []
+
+        best = math.inf
+        matches = []
+        stack = [self._root]
+
+        while stack:
+            item, children = stack.pop()
+            dist = self.distance(query, item)
+
+            if dist < best:
+                best, matches = dist, [item]
+            elif dist == best:
+                matches.append(item)
+
+            stack.extend(child for edge, child in children.items() if dist - best <= edge <= dist + best)
+
+        return best, matches
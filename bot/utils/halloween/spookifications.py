@@ -4,8 +4,13 @@ from random import choice, randint
 from PIL import Image
 from PIL import ImageOps
 
+from bot.utils.assets import image_cache
+
 log = logging.getLogger()
 
+PENTAGRAM = "bot/resources/halloween/bloody-pentagram.png"
+BAT = "bot/resources/halloween/bat-clipart.png"
+
 
 def inversion(im: Image) -> Image:
     """
@@ -22,8 +27,7 @@ def pentagram(im: Image) -> Image:
     """Adds pentagram to the image."""
     im = im.convert('RGB')
     wt, ht = im.size
-    penta = Image.open('bot/resources/halloween/bloody-pentagram.png')
-    penta = penta.resize((wt, ht))
+    penta = image_cache.get(PENTAGRAM, size=(wt, ht))
     im.paste(penta, (0, 0), penta)
     return im
 
@@ -37,7 +41,7 @@ def bat(im: Image) -> Image:
     """
     im = im.convert('RGB')
     wt, ht = im.size
-    bat = Image.open('bot/resources/halloween/bat-clipart.png')
+    bat = image_cache.get(BAT)
     bat_size = randint(wt//10, wt//7)
     rot = randint(0, 90)
     bat = bat.resize((bat_size, bat_size))
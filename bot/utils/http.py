@@ -0,0 +1,365 @@
+import asyncio
+import hashlib
+import json
+import logging
+import socket
+import time
+import typing as t
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from aiohttp import AsyncResolver, ClientSession, ClientTimeout, TCPConnector, TraceConfig
+from multidict import CIMultiDictProxy
+from yarl import URL
+
+from bot.utils.http_cache import CacheEntry, DiskCache
+from bot.utils.metrics import record_wait
+from bot.utils.ratelimit import Governor
+
+__all__ = ("HTTPResponse", "HTTPService", "HostStats")
+
+log = logging.getLogger(__name__)
+
+LIMIT_PER_HOST = 10  # Concurrent connections allowed to any single host
+KEEPALIVE_TIMEOUT = 60  # Seconds an idle connection is kept open for reuse
+DNS_CACHE_TTL = 300  # Seconds a resolved address is reused for
+DEFAULT_TIMEOUT = 30  # Total seconds allowed for a single request
+MAX_CACHE_ENTRIES = 512  # Responses kept in the in-memory TTL cache
+
+# Only idempotent methods are cached and coalesced
+CACHEABLE_METHODS = {"GET", "HEAD"}
+
+CacheKey = t.Tuple[str, str, t.Tuple[t.Tuple[str, str], ...], str]
+Params = t.Optional[t.Union[t.Mapping[str, t.Any], t.Sequence[t.Tuple[str, t.Any]]]]
+
+# Set while inside `HTTPService.request`, which records the caller's wait itself
+_in_request: ContextVar[bool] = ContextVar("in_request", default=False)
+
+
+async def _on_request_start(session: ClientSession, trace: SimpleNamespace, params: t.Any) -> None:
+    """Note when a request made directly on the session started."""
+    trace.start = time.perf_counter()
+
+
+async def _on_request_end(session: ClientSession, trace: SimpleNamespace, params: t.Any) -> None:
+    """Attribute the time taken by a request made directly on the session to the current command."""
+    if not _in_request.get():
+        record_wait("http", time.perf_counter() - trace.start)
+
+
+def _make_trace_config() -> TraceConfig:
+    """Return a trace config timing requests which bypass `HTTPService.request`."""
+    config = TraceConfig()
+    config.on_request_start.append(_on_request_start)
+    config.on_request_end.append(_on_request_end)
+    config.on_request_exception.append(_on_request_end)
+    return config
+
+
+class HTTPResponse(t.NamedTuple):
+    """
+    A fully read HTTP response.
+
+    The body is read eagerly so that a single instance can be safely handed out to every
+    caller that shares a coalesced request, and stored in the cache.
+    """
+
+    url: str
+    status: int
+    headers: CIMultiDictProxy
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        """True if the status code is below 400."""
+        return self.status < 400
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Decode the body as text."""
+        return self.body.decode(encoding, errors="replace")
+
+    def json(self) -> t.Any:
+        """Decode the body as JSON."""
+        return json.loads(self.body)
+
+
+@dataclass
+class HostStats:
+    """Request counters and latency totals for a single host."""
+
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean latency of all completed requests, in seconds."""
+        return self.total_latency / self.requests if self.requests else 0.0
+
+    def record(self, latency: float, failed: bool) -> None:
+        """Account for a single upstream request which took `latency` seconds."""
+        self.requests += 1
+        self.errors += failed
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+
+class HTTPService:
+    """
+    Bot-wide HTTP client.
+
+    Owns the single `ClientSession` used by every extension. The underlying connector keeps
+    connections alive and caps the number of concurrent connections per host, so that repeated
+    calls to the same API reuse an established TCP + TLS connection instead of paying for a new
+    handshake and DNS lookup every time.
+
+    On top of the session, `request` provides:
+        - an in-memory TTL cache keyed on method, URL, query params and headers (opt-in via `ttl`)
+        - a persistent `DiskCache` revalidated with conditional requests (opt-in via `revalidate`)
+        - coalescing of concurrent identical GET/HEAD requests into a single upstream request
+        - hit, miss and per-host latency counters
+        - attribution of the time spent waiting on requests to the invoking command, see `bot.utils.metrics`
+
+    The raw `session` remains available for callers that need streaming or a request body. Requests
+    made on it either way are paced by the `governor`, see `bot.utils.ratelimit`.
+    """
+
+    def __init__(self, *, limit_per_host: int = LIMIT_PER_HOST, max_cache_entries: int = MAX_CACHE_ENTRIES):
+        self.governor = Governor()
+        self.session = ClientSession(
+            connector=TCPConnector(
+                resolver=AsyncResolver(),
+                family=socket.AF_INET,
+                limit_per_host=limit_per_host,
+                keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=DNS_CACHE_TTL,
+            ),
+            timeout=ClientTimeout(total=DEFAULT_TIMEOUT),
+            trace_configs=[_make_trace_config(), self.governor.trace_config()],
+        )
+        self.max_cache_entries = max_cache_entries
+        self.disk_cache = DiskCache()
+
+        self._cache: t.OrderedDict[CacheKey, t.Tuple[float, HTTPResponse]] = OrderedDict()
+        self._inflight: t.Dict[CacheKey, asyncio.Future] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.hosts: t.Dict[str, HostStats] = {}
+
+    @staticmethod
+    def _make_key(method: str, url: str, params: Params, headers: t.Optional[t.Mapping[str, str]]) -> CacheKey:
+        """
+        Build a hashable cache key out of the request's identity.
+
+        Request headers such as `Accept` or `Authorization` change the response, so they are part of the key.
+        They are only included as a digest, since keys are persisted by the disk cache.
+        """
+        if not params:
+            query = ()
+        else:
+            items = params.items() if isinstance(params, t.Mapping) else params
+            query = tuple(sorted((str(name), str(value)) for name, value in items))
+
+        if not headers:
+            digest = ""
+        else:
+            fields = sorted((str(name).casefold(), str(value)) for name, value in headers.items())
+            digest = hashlib.sha256(json.dumps(fields).encode()).hexdigest()
+
+        return method, url, query, digest
+
+    def _get_cached(self, key: CacheKey) -> t.Optional[HTTPResponse]:
+        """Return a fresh cached response for `key`, evicting it if it has expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if expires_at <= time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return response
+
+    def _store(self, key: CacheKey, response: HTTPResponse, ttl: float) -> None:
+        """Cache `response` under `key` for `ttl` seconds, evicting the least recently used entries."""
+        self._cache[key] = (time.monotonic() + ttl, response)
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self.max_cache_entries:
+            self._cache.popitem(last=False)
+
+    async def _fetch(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        """Perform the upstream request, read the whole body and record its latency."""
+        host = URL(url).host or ""
+        failed = True
+        start = time.perf_counter()
+
+        try:
+            async with self.session.request(method, url, **kwargs) as resp:
+                body = await resp.read()
+                failed = resp.status >= 500
+                return HTTPResponse(str(resp.url), resp.status, resp.headers, body)
+        finally:
+            latency = time.perf_counter() - start
+            self.hosts.setdefault(host, HostStats()).record(latency, failed)
+            log.trace(f"{method} {url} took {latency * 1000:.0f}ms")
+
+    async def _fetch_revalidated(self, key: CacheKey, method: str, url: str, **kwargs) -> HTTPResponse:
+        """
+        Perform the upstream request as a conditional request against the `disk_cache`.
+
+        If a stored response for `key` exists, its validators are sent along. A 304 response is
+        then answered with the stored body. Fresh 200 responses carrying validators are stored.
+        """
+        disk_key = json.dumps(key)
+        entry = await self.disk_cache.get(disk_key)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+
+        response = await self._fetch(method, url, headers=headers, **kwargs)
+
+        if response.status == 304 and entry is not None:
+            log.trace(f"{url} not modified, serving stored response")
+            self.disk_cache.revalidated += 1
+            await self.disk_cache.touch(disk_key)
+            return HTTPResponse(entry.url, entry.status, entry.headers, entry.body)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+
+        if response.status == 200 and (etag or last_modified):
+            await self.disk_cache.put(disk_key, CacheEntry(*response, etag, last_modified))
+
+        return response
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params = None,
+        ttl: float = 0,
+        revalidate: bool = False,
+        coalesce: bool = True,
+        **kwargs
+    ) -> HTTPResponse:
+        """
+        Send a request and return the fully read response.
+
+        If `ttl` is given, successful (200) GET/HEAD responses are cached for `ttl` seconds.
+        If `revalidate` is True, responses are also persisted to the disk cache and revalidated
+        with a conditional request once the in-memory entry (if any) is gone.
+        Concurrent identical GET/HEAD requests share a single upstream request, unless
+        `coalesce` is False, e.g. for endpoints which return a random result on each call.
+
+        Requests which carry a body (`data` or `json` kwargs) are never cached nor coalesced.
+        All other kwargs are passed to `ClientSession.request`.
+        """
+        token = _in_request.set(True)
+        start = time.perf_counter()
+        try:
+            return await self._request(
+                method, url, params=params, ttl=ttl, revalidate=revalidate, coalesce=coalesce, **kwargs
+            )
+        finally:
+            record_wait("http", time.perf_counter() - start)
+            _in_request.reset(token)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Params,
+        ttl: float,
+        revalidate: bool,
+        coalesce: bool,
+        **kwargs
+    ) -> HTTPResponse:
+        """Serve the request from the caches, or send it. See `request` for details."""
+        method = method.upper()
+        if method not in CACHEABLE_METHODS or "data" in kwargs or "json" in kwargs:
+            self.misses += 1
+            return await self._fetch(method, url, params=params, **kwargs)
+
+        key = self._make_key(method, url, params, kwargs.get("headers"))
+
+        if (cached := self._get_cached(key)) is not None:
+            self.hits += 1
+            return cached
+
+        if coalesce and (pending := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        if revalidate:
+            task = asyncio.ensure_future(self._fetch_revalidated(key, method, url, params=params, **kwargs))
+        else:
+            task = asyncio.ensure_future(self._fetch(method, url, params=params, **kwargs))
+
+        if coalesce:
+            self._inflight[key] = task
+
+        def on_done(done: asyncio.Future) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+
+            # Retrieving the exception prevents "never retrieved" warnings if every waiter was cancelled
+            if done.cancelled() or done.exception() is not None:
+                return
+
+            response = done.result()
+            if ttl and response.status == 200:
+                self._store(key, response, ttl)
+
+        task.add_done_callback(on_done)
+
+        # Shielded, so that a cancelled caller does not cancel the request for the others sharing it
+        return await asyncio.shield(task)
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        """Send a GET request. See `request` for details."""
+        return await self.request("GET", url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs) -> t.Any:
+        """Send a GET request and decode the response body as JSON."""
+        response = await self.get(url, **kwargs)
+        return response.json()
+
+    async def get_bytes(self, url: str, **kwargs) -> bytes:
+        """Send a GET request and return the raw response body."""
+        response = await self.get(url, **kwargs)
+        return response.body
+
+    def clear_cache(self) -> None:
+        """Drop all cached responses."""
+        self._cache.clear()
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        """Return a snapshot of the cache counters and per-host latency statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "cached": len(self._cache),
+            "inflight": len(self._inflight),
+            "hosts": {host: stats for host, stats in sorted(self.hosts.items())},
+        }
+
+    async def close(self) -> None:
+        """Close the underlying session and its connections, and the disk cache."""
+        await self.session.close()
+        await self.disk_cache.close()
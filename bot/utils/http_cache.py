@@ -0,0 +1,181 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from bot.utils.persist import DIRECTORY
+
+__all__ = ("CacheEntry", "DiskCache")
+
+log = logging.getLogger(__name__)
+
+DATABASE = Path(DIRECTORY, "http_cache.sqlite3")
+MAX_SIZE = 64 * 2**20  # Total bytes of response bodies kept on disk
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used);
+"""
+
+
+class CacheEntry(t.NamedTuple):
+    """A stored response along with the validators used to revalidate it."""
+
+    url: str
+    status: int
+    headers: CIMultiDictProxy
+    body: bytes
+    etag: t.Optional[str]
+    last_modified: t.Optional[str]
+
+
+class DiskCache:
+    """
+    Persistent response store for conditional requests.
+
+    Responses carrying an `ETag` or `Last-Modified` header are stored in an SQLite database in
+    the persistent data directory, so they survive restarts. When the same request is made again,
+    the stored validators are sent as `If-None-Match` / `If-Modified-Since`, and a 304 response
+    is answered with the stored body. For GitHub, such 304 responses do not count against the
+    rate limit.
+
+    The total size of stored bodies is capped at `max_size` bytes; least recently used entries
+    are evicted first.
+
+    All database access happens on a single worker thread, so the event loop never blocks on disk.
+    """
+
+    def __init__(self, path: Path = DATABASE, max_size: int = MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+
+        self.revalidated = 0  # Requests answered by a 304
+        self.stored = 0
+        self.evicted = 0
+
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="http-cache")
+        self._db: t.Optional[sqlite3.Connection] = None  # Opened lazily on the worker thread
+
+    async def _run(self, func: t.Callable, *args) -> t.Any:
+        """Run `func` on the worker thread."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the database connection, creating the database on first use."""
+        if self._db is None:
+            self.path.parent.mkdir(exist_ok=True)
+            self._db = sqlite3.connect(self.path)
+            self._db.executescript(SCHEMA)
+        return self._db
+
+    def _get(self, key: str) -> t.Optional[CacheEntry]:
+        """Blocking implementation of `get`."""
+        db = self._connect()
+        row = db.execute(
+            "SELECT url, status, headers, body, etag, last_modified FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        url, status, headers, body, etag, last_modified = row
+        headers = CIMultiDictProxy(CIMultiDict(json.loads(headers)))
+        return CacheEntry(url, status, headers, body, etag, last_modified)
+
+    def _touch(self, key: str) -> None:
+        """Blocking implementation of `touch`."""
+        with self._connect() as db:
+            db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+
+    def _put(self, key: str, entry: CacheEntry) -> None:
+        """Blocking implementation of `put`."""
+        size = len(entry.body)
+        if size > self.max_size:
+            log.debug(f"Not storing response from {entry.url}, it exceeds the cache size ({size} bytes)")
+            return
+
+        with self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, entry.url, entry.status, json.dumps(list(entry.headers.items())), entry.body,
+                    entry.etag, entry.last_modified, size, time.time(),
+                )
+            )
+            self.stored += 1
+            self._evict(db)
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        """Delete least recently used entries until the total size fits into `max_size`."""
+        total, = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_size:
+            return
+
+        victims = []
+        for key, size in db.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            victims.append((key,))
+            total -= size
+            if total <= self.max_size:
+                break
+
+        db.executemany("DELETE FROM responses WHERE key = ?", victims)
+        self.evicted += len(victims)
+        log.debug(f"Evicted {len(victims)} responses from the HTTP disk cache")
+
+    def _info(self) -> t.Tuple[int, int]:
+        """Blocking implementation of `info`."""
+        db = self._connect()
+        return db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+
+    def _clear(self) -> int:
+        """Blocking implementation of `clear`."""
+        with self._connect() as db:
+            return db.execute("DELETE FROM responses").rowcount
+
+    def _close(self) -> None:
+        """Close the database connection, if open."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    async def get(self, key: str) -> t.Optional[CacheEntry]:
+        """Return the stored entry for `key`, if any."""
+        return await self._run(self._get, key)
+
+    async def touch(self, key: str) -> None:
+        """Mark the entry for `key` as recently used."""
+        await self._run(self._touch, key)
+
+    async def put(self, key: str, entry: CacheEntry) -> None:
+        """Store `entry` under `key`, evicting old entries if the size cap is exceeded."""
+        await self._run(self._put, key, entry)
+
+    async def info(self) -> t.Tuple[int, int]:
+        """Return the number of stored responses and their total size in bytes."""
+        return await self._run(self._info)
+
+    async def clear(self) -> int:
+        """Delete all stored responses and return how many there were."""
+        return await self._run(self._clear)
+
+    async def close(self) -> None:
+        """Close the database and stop the worker thread."""
+        await self._run(self._close)
+        self._executor.shutdown(wait=False)
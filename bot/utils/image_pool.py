@@ -0,0 +1,166 @@
+import asyncio
+import logging
+import os
+import time
+import typing as t
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+
+from bot.utils.exceptions import ImageProcessingError
+from bot.utils.metrics import record_wait
+
+__all__ = ("ImagePool", "JobStats")
+
+log = logging.getLogger(__name__)
+
+MAX_WORKERS = min(4, os.cpu_count() or 1)  # Worker processes doing image work in parallel
+MAX_QUEUED = 16  # Jobs allowed to wait for a free worker before new ones are rejected
+JOB_TIMEOUT = 20  # Seconds a single job may take, including time spent in the queue
+
+
+@dataclass
+class JobStats:
+    """Counters and timings for a single kind of job."""
+
+    completed: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    total_wait: float = 0.0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def mean_latency(self) -> float:
+        """Mean processing time of completed jobs, in seconds."""
+        return self.total_latency / self.completed if self.completed else 0.0
+
+    @property
+    def mean_wait(self) -> float:
+        """Mean time completed jobs spent waiting for a free worker, in seconds."""
+        return self.total_wait / self.completed if self.completed else 0.0
+
+
+class ImagePool:
+    """
+    Process pool for CPU-bound image work.
+
+    Pillow decoding, transforms and PNG encoding hold the GIL for long stretches; done on the event
+    loop, a single avatar command delays gateway heartbeats and every other command. Instead, cogs
+    `submit` a picklable job to this pool, typically a module-level function which takes image bytes
+    and returns PNG bytes.
+
+    At most `max_workers` jobs run at once. Up to `max_queued` further jobs wait for a free
+    worker, beyond that new jobs are rejected with `ImageProcessingError`. The same error is raised
+    if a job does not finish within its timeout.
+    """
+
+    def __init__(self, *, max_workers: int = MAX_WORKERS, max_queued: int = MAX_QUEUED):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        self._slots = asyncio.Semaphore(max_workers)
+
+        self.queued = 0
+        self.running = 0
+        self.rejected = 0
+        self.jobs: t.Dict[str, JobStats] = {}
+
+    def _release(self, future: asyncio.Future) -> None:
+        """Free the worker slot once the job has actually finished in the worker process."""
+        self.running -= 1
+        self._slots.release()
+
+        # Mark the exception as retrieved in case the waiting caller has already timed out
+        if not future.cancelled():
+            future.exception()
+
+    async def submit(self, func: t.Callable, *args, timeout: float = JOB_TIMEOUT) -> t.Any:
+        """
+        Run `func(*args)` in a worker process and return its result.
+
+        Both `func` and `args` must be picklable, so `func` has to be importable at module level.
+        The whole wait, in the queue and in the worker, is attributed to the invoking command.
+        """
+        start = time.perf_counter()
+        try:
+            return await self._submit(func, *args, timeout=timeout)
+        finally:
+            record_wait("image", time.perf_counter() - start)
+
+    async def _submit(self, func: t.Callable, *args, timeout: float) -> t.Any:
+        """Queue the job and wait for its result. See `submit` for details."""
+        if self.queued >= self.max_queued:
+            self.rejected += 1
+            raise ImageProcessingError("I'm busy drawing lots of pictures right now, please try again in a bit!")
+
+        stats = self.jobs.setdefault(func.__qualname__, JobStats())
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + timeout
+
+        queued_at = time.perf_counter()
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout)
+        except asyncio.TimeoutError:
+            stats.timed_out += 1
+            raise ImageProcessingError("Timed out waiting for the image to be processed.") from None
+        finally:
+            self.queued -= 1
+
+        started_at = time.perf_counter()
+        self.running += 1
+        try:
+            future = loop.run_in_executor(self._executor, func, *args)
+        except BrokenProcessPool:
+            self.running -= 1
+            self._slots.release()
+            self._restart()
+            stats.failed += 1
+            raise ImageProcessingError("The image worker crashed, please try again.") from None
+
+        # The slot is only freed once the worker is done, even if we stop waiting for it earlier
+        future.add_done_callback(self._release)
+
+        try:
+            result = await asyncio.wait_for(asyncio.shield(future), max(deadline - loop.time(), 0))
+        except asyncio.TimeoutError:
+            stats.timed_out += 1
+            log.warning(f"Image job {func.__qualname__} timed out after {timeout}s")
+            raise ImageProcessingError("Timed out waiting for the image to be processed.") from None
+        except BrokenProcessPool:
+            self._restart()
+            stats.failed += 1
+            raise ImageProcessingError("The image worker crashed, please try again.") from None
+        except Exception:
+            stats.failed += 1
+            raise
+
+        latency = time.perf_counter() - started_at
+        stats.completed += 1
+        stats.total_wait += started_at - queued_at
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+
+        log.trace(f"Image job {func.__qualname__} took {latency * 1000:.0f}ms")
+        return result
+
+    def _restart(self) -> None:
+        """Replace a broken executor with a fresh one."""
+        log.error("Image worker pool is broken, restarting it")
+        self._executor.shutdown(wait=False)
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def stats(self) -> t.Dict[str, t.Any]:
+        """Return a snapshot of the queue depth and per-job statistics."""
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "rejected": self.rejected,
+            "jobs": dict(sorted(self.jobs.items())),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes without waiting for pending jobs."""
+        self._executor.shutdown(wait=False)
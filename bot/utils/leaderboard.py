@@ -0,0 +1,258 @@
+import itertools
+import json
+import logging
+import random
+import typing as t
+from pathlib import Path
+
+from bot.utils.persist import write_json
+
+__all__ = ("Leaderboard",)
+
+log = logging.getLogger(__name__)
+
+K = t.TypeVar("K")
+T = t.TypeVar("T")
+
+MAX_LEVELS = 24  # Skip list levels, enough for millions of entries at the expected O(log n)
+
+
+class _Node(t.Generic[T]):
+    """A skip list node, linked to the next node and storing the distance to it on each of its levels."""
+
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: t.Optional[T], levels: int):
+        self.value = value
+        self.next: t.List[t.Optional[_Node[T]]] = [None] * levels
+        self.width = [1] * levels
+
+
+class _SkipList(t.Generic[T]):
+    """
+    A sorted sequence backed by an indexable skip list.
+
+    Insertion, removal, bisection and indexing take expected O(log n) time, where a sorted list
+    would shift every entry after the one being inserted or removed.
+    """
+
+    def __init__(self, values: t.Iterable[T] = ()):
+        self._head: _Node[T] = _Node(None, MAX_LEVELS)
+        self._tail: _Node[T] = _Node(None, 0)
+        self._head.next = [self._tail] * MAX_LEVELS
+        self._size = 0
+
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> t.Iterator[T]:
+        return self.iter_from(0)
+
+    def iter_from(self, index: int) -> t.Iterator[T]:
+        """Iterate over the values from position `index` onwards, reaching it in O(log n)."""
+        if index >= self._size:
+            return
+
+        # Descend to the node just before `index`, the head being at position 0
+        node = self._head
+        remaining = index
+        for level in reversed(range(MAX_LEVELS)):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+
+        node = node.next[0]
+        while node is not self._tail:
+            yield node.value
+            node = node.next[0]
+
+    def __getitem__(self, index: int) -> T:
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+
+        # The head is at position 0, the first value at position 1
+        node = self._head
+        remaining = index + 1
+        for level in reversed(range(MAX_LEVELS)):
+            while node.width[level] <= remaining:
+                remaining -= node.width[level]
+                node = node.next[level]
+
+        return node.value
+
+    def _before(self, value: T) -> t.Tuple[t.List[_Node[T]], t.List[int]]:
+        """Return the last node before `value` on each level, and the position of each of them."""
+        chain = [self._head] * MAX_LEVELS
+        positions = [0] * MAX_LEVELS
+
+        node = self._head
+        position = 0
+        for level in reversed(range(MAX_LEVELS)):
+            while (following := node.next[level]) is not self._tail and following.value < value:
+                position += node.width[level]
+                node = following
+            chain[level] = node
+            positions[level] = position
+
+        return chain, positions
+
+    def bisect_left(self, value: T) -> int:
+        """Return the number of values lower than `value`."""
+        _, positions = self._before(value)
+        return positions[0]
+
+    def add(self, value: T) -> None:
+        """Insert `value` at its sorted position."""
+        chain, positions = self._before(value)
+        position = positions[0] + 1
+
+        levels = 1
+        while levels < MAX_LEVELS and random.random() < 0.5:
+            levels += 1
+
+        node = _Node(value, levels)
+        for level in range(levels):
+            previous = chain[level]
+            node.next[level] = previous.next[level]
+            node.width[level] = positions[level] + previous.width[level] - position + 1
+            previous.next[level] = node
+            previous.width[level] = position - positions[level]
+
+        # Links passing over the new node get one step longer
+        for level in range(levels, MAX_LEVELS):
+            chain[level].width[level] += 1
+
+        self._size += 1
+
+    def remove(self, value: T) -> None:
+        """Remove `value`, raising a ValueError if it is absent."""
+        chain, _ = self._before(value)
+        node = chain[0].next[0]
+        if node is self._tail or node.value != value:
+            raise ValueError(f"{value!r} is not in the skip list")
+
+        for level in range(len(node.next)):
+            previous = chain[level]
+            previous.width[level] += node.width[level] - 1
+            previous.next[level] = node.next[level]
+
+        for level in range(len(node.next), MAX_LEVELS):
+            chain[level].width[level] -= 1
+
+        self._size -= 1
+
+
+class Leaderboard(t.Generic[K]):
+    """
+    Scores kept ranked as they change, highest first.
+
+    The ranking is a skip list of `(-score, key)`, so an update, a rank lookup and finding the entry
+    at a rank take expected O(log n) time, rather than a sort of every score, and reading the top `k`
+    entries walks only those. Entries with equal scores are ordered by key, so keys must be
+    comparable with each other.
+
+    Leaderboards can be snapshotted to a JSON file with `save` and restored with `load`, in which
+    case keys must also be JSON serializable, e.g. user IDs.
+    """
+
+    def __init__(self, scores: t.Optional[t.Mapping[K, float]] = None):
+        self._scores: t.Dict[K, float] = dict(scores or {})
+        self._ranking: _SkipList[t.Tuple[float, K]] = _SkipList((-score, key) for key, score in self._scores.items())
+        self.total = sum(self._scores.values())
+
+    def __getitem__(self, key: K) -> float:
+        return self._scores[key]
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._scores
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def _unrank(self, key: K) -> None:
+        """Remove `key` from the ranking."""
+        self._ranking.remove((-self._scores[key], key))
+
+    def set(self, key: K, score: float) -> None:
+        """Set the score of `key`, adding it if necessary."""
+        if key in self._scores:
+            self._unrank(key)
+            self.total -= self._scores[key]
+
+        self._scores[key] = score
+        self.total += score
+        self._ranking.add((-score, key))
+
+    def add(self, key: K, delta: float) -> None:
+        """Add `delta` to the score of `key`, which starts at 0 if it has none yet."""
+        self.set(key, self._scores.get(key, 0) + delta)
+
+    def remove(self, key: K) -> None:
+        """Remove `key` from the leaderboard."""
+        self._unrank(key)
+        self.total -= self._scores.pop(key)
+
+    def top(self, k: t.Optional[int] = None) -> t.List[t.Tuple[K, float]]:
+        """Return the `k` (all, if None) highest `(key, score)` pairs, highest first."""
+        return [(key, -score) for score, key in itertools.islice(self._ranking, k)]
+
+    def rank(self, key: K) -> int:
+        """Return the rank of `key`, starting at 1; entries with equal scores share the same rank."""
+        return self._ranking.bisect_left((-self._scores[key],)) + 1
+
+    def leaders(self) -> t.List[K]:
+        """Return every key sharing the highest score."""
+        if not self._ranking:
+            return []
+
+        highest = self._ranking[0][0]
+        return [key for score, key in itertools.takewhile(lambda entry: entry[0] == highest, self._ranking)]
+
+    def at(self, rank: int) -> t.Optional[K]:
+        """Return the key at the 1-based position `rank`, if there is one."""
+        if 1 <= rank <= len(self._ranking):
+            return self._ranking[rank - 1][1]
+        return None
+
+    def lines(
+        self, format_entry: t.Callable[[int, K, float], str], start: int = 0, stop: t.Optional[int] = None
+    ) -> t.List[str]:
+        """
+        Return `format_entry(rank, key, score)` for the entries from position `start` up to `stop`, highest first.
+
+        Like `rank`, entries with equal scores share the same rank. Only the requested entries are
+        formatted, and reaching `start` takes O(log n), so this can back `LazyLines` for
+        `LinePaginator.paginate`, which renders one page at a time.
+        """
+        entries = itertools.islice(self._ranking.iter_from(start), None if stop is None else max(stop - start, 0))
+
+        lines = []
+        rank = 0
+        previous = None
+        for position, (score, key) in enumerate(entries, start=start + 1):
+            if score != previous:
+                # The first entry may share its score with entries before `start`
+                rank = position if previous is not None else self._ranking.bisect_left((score,)) + 1
+                previous = score
+            lines.append(format_entry(rank, key, -score))
+
+        return lines
+
+    async def save(self, path: Path) -> None:
+        """Snapshot the scores to the JSON file at `path`, without blocking the event loop."""
+        await write_json(path, list(self._scores.items()))
+
+    @classmethod
+    def load(cls, path: Path) -> "Leaderboard":
+        """Restore the scores snapshotted to `path`, or return an empty leaderboard if there is no snapshot."""
+        if not path.exists():
+            return cls()
+
+        with path.open(encoding="utf8") as f:
+            scores = json.load(f)
+
+        log.trace(f"Loaded {len(scores)} scores from {path}")
+        return cls(dict(scores))
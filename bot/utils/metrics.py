@@ -0,0 +1,275 @@
+import bisect
+import logging
+import time
+import typing as t
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from discord.ext import commands
+
+__all__ = ("CommandStats", "Invocation", "Metrics", "record_wait")
+
+log = logging.getLogger(__name__)
+
+RECENT_INVOCATIONS = 2048  # Invocations kept for percentiles over recent traffic
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf"))
+
+# Kinds of time an invocation can spend waiting on something other than the event loop
+WAIT_KINDS = ("http", "image")
+
+
+@dataclass
+class Invocation:
+    """Timings of a single command invocation."""
+
+    command: str
+    started: float = field(default_factory=time.perf_counter)
+    latency: float = 0.0
+    failed: bool = False
+    waits: t.Dict[str, float] = field(default_factory=lambda: dict.fromkeys(WAIT_KINDS, 0.0))
+
+    @property
+    def other(self) -> float:
+        """Time not spent waiting on HTTP or image workers; mostly event loop CPU time and Discord API calls."""
+        return max(self.latency - sum(self.waits.values()), 0.0)
+
+
+# The invocation being handled by the current task, so that waits can be attributed to it
+current_invocation: ContextVar[t.Optional[Invocation]] = ContextVar("current_invocation", default=None)
+
+
+def record_wait(kind: str, seconds: float) -> None:
+    """Attribute `seconds` spent waiting on `kind` (one of `WAIT_KINDS`) to the current invocation, if any."""
+    invocation = current_invocation.get()
+    if invocation is not None:
+        invocation.waits[kind] += seconds
+
+
+@dataclass
+class CommandStats:
+    """Cumulative counters and latency histogram of a single command."""
+
+    calls: int = 0
+    failed: int = 0
+    rejected: int = 0  # Errors raised before the command ran, e.g. by checks or converters
+    latency_sum: float = 0.0
+    buckets: t.List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    waits: t.Dict[str, float] = field(default_factory=lambda: dict.fromkeys(WAIT_KINDS, 0.0))
+    errors: t.Counter[str] = field(default_factory=Counter)
+
+    @property
+    def error_rate(self) -> float:
+        """Fraction of attempted invocations which raised an error."""
+        attempts = self.calls + self.rejected
+        return (self.failed + self.rejected) / attempts if attempts else 0.0
+
+    def record(self, invocation: Invocation) -> None:
+        """Account for a finished invocation."""
+        self.calls += 1
+        self.failed += invocation.failed
+        self.latency_sum += invocation.latency
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS, invocation.latency)] += 1
+
+        for kind, seconds in invocation.waits.items():
+            self.waits[kind] += seconds
+
+
+def percentile(values: t.Sequence[float], fraction: float) -> float:
+    """Return the `fraction` percentile of the sorted `values`, using the nearest-rank method."""
+    if not values:
+        return 0.0
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+class Metrics:
+    """
+    Command latency and throughput metrics.
+
+    `SeasonalBot` feeds this from its before/after invoke hooks and `on_command_error`. Memory use
+    is fixed: cumulative counters and a latency histogram are kept per command, and only the last
+    `RECENT_INVOCATIONS` invocations are kept individually, in a ring buffer.
+
+    While a command runs, its `Invocation` is available through `current_invocation`, so that
+    `HTTPService` and `ImagePool` can attribute their waiting time to it via `record_wait`.
+    """
+
+    def __init__(self, recent: int = RECENT_INVOCATIONS):
+        self.started = time.time()
+        self.commands: t.Dict[str, CommandStats] = {}
+        self.recent: t.Deque[Invocation] = deque(maxlen=recent)
+
+    def _stats(self, command: str) -> CommandStats:
+        """Return the stats of `command`, creating them if necessary."""
+        if command not in self.commands:
+            self.commands[command] = CommandStats()
+        return self.commands[command]
+
+    def start(self, ctx: commands.Context) -> None:
+        """Start timing the invocation of `ctx`."""
+        invocation = Invocation(ctx.command.qualified_name)
+        ctx.invocation = invocation
+        current_invocation.set(invocation)
+
+    def finish(self, ctx: commands.Context) -> None:
+        """Stop timing the invocation of `ctx` and record it."""
+        invocation = getattr(ctx, "invocation", None)
+        if invocation is None:
+            return
+
+        # The invocation is left on `ctx`, as `record_error` runs after this hook when the command raised
+        current_invocation.set(None)
+
+        invocation.latency = time.perf_counter() - invocation.started
+        invocation.failed = ctx.command_failed
+
+        self._stats(invocation.command).record(invocation)
+        self.recent.append(invocation)
+
+        log.trace(
+            f"{invocation.command} took {invocation.latency * 1000:.0f}ms "
+            f"(http {invocation.waits['http'] * 1000:.0f}ms, image {invocation.waits['image'] * 1000:.0f}ms)"
+        )
+
+    def record_error(self, ctx: commands.Context, error: Exception) -> None:
+        """Count an error raised by the command of `ctx`."""
+        if ctx.command is None:
+            return
+
+        stats = self._stats(ctx.command.qualified_name)
+        stats.errors[type(getattr(error, "original", error)).__name__] += 1
+
+        # The before invoke hook only runs after the checks and converters passed, and starts the invocation
+        if getattr(ctx, "invocation", None) is None:
+            stats.rejected += 1
+
+    def recent_summary(self) -> t.Dict[str, t.Dict[str, float]]:
+        """Return count, p50, p99 and mean waits of every command over the recent invocations."""
+        grouped: t.Dict[str, t.List[Invocation]] = {}
+        for invocation in self.recent:
+            grouped.setdefault(invocation.command, []).append(invocation)
+
+        summary = {}
+        for command, invocations in grouped.items():
+            latencies = sorted(invocation.latency for invocation in invocations)
+            summary[command] = {
+                "count": len(invocations),
+                "p50": percentile(latencies, 0.5),
+                "p99": percentile(latencies, 0.99),
+                "http": sum(i.waits["http"] for i in invocations) / len(invocations),
+                "image": sum(i.waits["image"] for i in invocations) / len(invocations),
+                "other": sum(i.other for i in invocations) / len(invocations),
+            }
+        return summary
+
+    def to_prometheus(
+        self,
+        http: t.Mapping[str, t.Any],
+        images: t.Mapping[str, t.Any],
+        listeners: t.Mapping[str, t.Any],
+        sessions: t.Mapping[str, int],
+    ) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        `http`, `images` and `sessions` are the `stats()` snapshots of the bot's `HTTPService`,
+        `ImagePool` and `SessionRouter`, and `listeners` the `stats` of its `Dispatcher`.
+        """
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP seasonalbot_{name} {help_text}")
+            lines.append(f"# TYPE seasonalbot_{name} {kind}")
+
+        def sample(name: str, value: float, **labels: t.Union[str, float]) -> None:
+            if labels:
+                label_text = ",".join(f'{key}="{escape(str(label))}"' for key, label in labels.items())
+                lines.append(f"seasonalbot_{name}{{{label_text}}} {value}")
+            else:
+                lines.append(f"seasonalbot_{name} {value}")
+
+        metric("uptime_seconds", "gauge", "Seconds since metrics collection started.")
+        sample("uptime_seconds", time.time() - self.started)
+
+        metric("command_latency_seconds", "histogram", "Wall-clock latency of command invocations.")
+        for command, stats in sorted(self.commands.items()):
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else bound
+                sample("command_latency_seconds_bucket", cumulative, command=command, le=le)
+            sample("command_latency_seconds_sum", stats.latency_sum, command=command)
+            sample("command_latency_seconds_count", stats.calls, command=command)
+
+        metric("command_wait_seconds_total", "counter", "Time command invocations spent waiting, by kind.")
+        for command, stats in sorted(self.commands.items()):
+            for kind, seconds in stats.waits.items():
+                sample("command_wait_seconds_total", seconds, command=command, kind=kind)
+
+        metric("command_failed_total", "counter", "Command invocations which raised an error.")
+        for command, stats in sorted(self.commands.items()):
+            sample("command_failed_total", stats.failed, command=command)
+
+        metric("command_rejected_total", "counter", "Commands which failed before running, e.g. in checks.")
+        for command, stats in sorted(self.commands.items()):
+            sample("command_rejected_total", stats.rejected, command=command)
+
+        metric("command_errors_total", "counter", "Command errors, by exception type.")
+        for command, stats in sorted(self.commands.items()):
+            for error, count in sorted(stats.errors.items()):
+                sample("command_errors_total", count, command=command, error=error)
+
+        metric("listener_calls_total", "counter", "Calls of dispatched listeners.")
+        for listener, stats in sorted(listeners.items()):
+            sample("listener_calls_total", stats.calls, listener=listener)
+
+        metric("listener_errors_total", "counter", "Calls of dispatched listeners which raised an error.")
+        for listener, stats in sorted(listeners.items()):
+            sample("listener_errors_total", stats.errors, listener=listener)
+
+        metric("listener_seconds_total", "counter", "Total wall-clock time of dispatched listener calls.")
+        for listener, stats in sorted(listeners.items()):
+            sample("listener_seconds_total", stats.total, listener=listener)
+
+        metric("sessions_live", "gauge", "Interactive sessions waiting for an event, by event.")
+        for event, count in sessions.items():
+            sample("sessions_live", count, event=event)
+
+        metric("http_cache_total", "counter", "HTTP requests by cache outcome.")
+        for outcome in ("hits", "misses", "coalesced"):
+            sample("http_cache_total", http[outcome], outcome=outcome)
+
+        metric("http_requests_total", "counter", "Upstream HTTP requests, by host.")
+        for host, stats in http["hosts"].items():
+            sample("http_requests_total", stats.requests, host=host)
+
+        metric("http_errors_total", "counter", "Upstream HTTP requests which failed, by host.")
+        for host, stats in http["hosts"].items():
+            sample("http_errors_total", stats.errors, host=host)
+
+        metric("http_latency_seconds_total", "counter", "Total upstream HTTP latency, by host.")
+        for host, stats in http["hosts"].items():
+            sample("http_latency_seconds_total", stats.total_latency, host=host)
+
+        metric("image_jobs_queued", "gauge", "Image jobs waiting for a worker.")
+        sample("image_jobs_queued", images["queued"])
+
+        metric("image_jobs_running", "gauge", "Image jobs currently running.")
+        sample("image_jobs_running", images["running"])
+
+        metric("image_jobs_rejected_total", "counter", "Image jobs rejected because the queue was full.")
+        sample("image_jobs_rejected_total", images["rejected"])
+
+        metric("image_jobs_total", "counter", "Finished image jobs, by job and outcome.")
+        for job, stats in images["jobs"].items():
+            for outcome in ("completed", "failed", "timed_out"):
+                sample("image_jobs_total", getattr(stats, outcome), job=job, outcome=outcome)
+
+        return "\n".join(lines) + "\n"
+
+
+def escape(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
@@ -1,6 +1,7 @@
 import asyncio
 import logging
-from typing import Iterable, List, Optional, Tuple
+import math
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 from discord import Embed, Member, Reaction
 from discord.abc import User
@@ -23,6 +24,53 @@ class EmptyPaginatorEmbed(Exception):
     """Base Exception class for an empty paginator embed."""
 
 
+class LazyLines(NamedTuple):
+    """
+    Lines which `LinePaginator.paginate` renders a page at a time, when the page is shown.
+
+    `render(start, stop)` gives the lines from `start` up to `stop`, out of `count` lines in total.
+    """
+
+    count: int
+    render: Callable[[int, int], List[str]]
+
+
+class _LazyPages(Sequence[str]):
+    """The pages of `LazyLines`, each holding `max_lines` lines, rendered when first accessed."""
+
+    def __init__(self, lines: LazyLines, *, prefix: str, suffix: str, max_size: int, max_lines: int, empty: bool):
+        self.lines = lines
+        self.prefix = prefix
+        self.suffix = suffix
+        self.max_size = max_size
+        self.max_lines = max_lines
+        self.empty = empty
+        self._pages: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return math.ceil(self.lines.count / self.max_lines)
+
+    def __getitem__(self, index: int) -> str:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        if index not in self._pages:
+            paginator = LinePaginator(
+                prefix=self.prefix, suffix=self.suffix, max_size=self.max_size, max_lines=self.max_lines
+            )
+            start = index * self.max_lines
+            for line in self.lines.render(start, start + self.max_lines):
+                paginator.add_line(line, empty=self.empty)
+
+            if len(paginator.pages) > 1:
+                raise RuntimeError(f"Page {index + 1} exceeds maximum page size {self.max_size}")
+
+            log.trace(f"Rendered page {index + 1} of lazy lines")
+            self._pages[index] = paginator.pages[0]
+
+        return self._pages[index]
+
+
 class LinePaginator(Paginator):
     """A class that aids in paginating code blocks for Discord messages."""
 
@@ -75,7 +123,7 @@ class LinePaginator(Paginator):
             self._count += 1
 
     @classmethod
-    async def paginate(cls, lines: Iterable[str], ctx: Context, embed: Embed,
+    async def paginate(cls, lines: Union[Iterable[str], LazyLines], ctx: Context, embed: Embed,
                        prefix: str = "", suffix: str = "", max_lines: Optional[int] = None,
                        max_size: int = 500, empty: bool = True, restrict_to_user: User = None,
                        timeout: int = 300, footer_text: str = None, url: str = None,
@@ -93,6 +141,9 @@ class LinePaginator(Paginator):
 
         If `empty` is True, an empty line will be placed between each given line.
 
+        If `lines` are `LazyLines`, each page holds `max_lines` lines, and is only rendered once it is
+        shown, so that large sources such as leaderboards aren't formatted in full up front.
+
         >>> embed = Embed()
         >>> embed.set_author(name="Some Operation", url=url, icon_url=icon)
         >>> await LinePaginator.paginate(
@@ -112,8 +163,6 @@ class LinePaginator(Paginator):
             return (
                 # Conditions for a successful pagination:
                 all((
-                    # Reaction is on this message
-                    reaction_.message.id == message.id,
                     # Reaction is one of the pagination emotes
                     str(reaction_.emoji) in PAGINATION_EMOJI,  # Note: DELETE_EMOJI is a string and not unicode
                     # Reaction was not made by the Bot
@@ -126,6 +175,12 @@ class LinePaginator(Paginator):
         paginator = cls(prefix=prefix, suffix=suffix, max_size=max_size, max_lines=max_lines)
         current_page = 0
 
+        if isinstance(lines, LazyLines):
+            if max_lines is None:
+                raise ValueError("Lazy lines can only be paginated with max_lines")
+            if not lines.count:
+                lines = []
+
         if not lines:
             if exception_on_empty_embed:
                 log.exception("Pagination asked for empty lines iterable")
@@ -134,20 +189,27 @@ class LinePaginator(Paginator):
             log.debug("No lines to add to paginator, adding '(nothing to display)' message")
             lines.append("(nothing to display)")
 
-        for line in lines:
-            try:
-                paginator.add_line(line, empty=empty)
-            except Exception:
-                log.exception(f"Failed to add line to paginator: '{line}'")
-                raise  # Should propagate
-            else:
-                log.trace(f"Added line to paginator: '{line}'")
+        if isinstance(lines, LazyLines):
+            pages = _LazyPages(
+                lines, prefix=prefix, suffix=suffix, max_size=max_size, max_lines=max_lines, empty=empty
+            )
+        else:
+            for line in lines:
+                try:
+                    paginator.add_line(line, empty=empty)
+                except Exception:
+                    log.exception(f"Failed to add line to paginator: '{line}'")
+                    raise  # Should propagate
+                else:
+                    log.trace(f"Added line to paginator: '{line}'")
 
-        log.debug(f"Paginator created with {len(paginator.pages)} pages")
+            pages = paginator.pages
 
-        embed.description = paginator.pages[current_page]
+        log.debug(f"Paginator created with {len(pages)} pages")
 
-        if len(paginator.pages) <= 1:
+        embed.description = pages[current_page]
+
+        if len(pages) <= 1:
             if footer_text:
                 embed.set_footer(text=footer_text)
                 log.trace(f"Setting embed footer to '{footer_text}'")
@@ -160,9 +222,9 @@ class LinePaginator(Paginator):
             return await ctx.send(embed=embed)
         else:
             if footer_text:
-                embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
+                embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(pages)})")
             else:
-                embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
+                embed.set_footer(text=f"Page {current_page + 1}/{len(pages)}")
             log.trace(f"Setting embed footer to '{embed.footer.text}'")
 
             if url:
@@ -181,7 +243,9 @@ class LinePaginator(Paginator):
 
         while True:
             try:
-                reaction, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=event_check)
+                reaction, user = await ctx.bot.sessions.wait_for(
+                    "reaction_add", message.id, timeout=timeout, check=event_check
+                )
                 log.trace(f"Got reaction: {reaction}")
             except asyncio.TimeoutError:
                 log.debug("Timed out waiting for a reaction")
@@ -195,30 +259,30 @@ class LinePaginator(Paginator):
                 await message.remove_reaction(reaction.emoji, user)
                 current_page = 0
 
-                log.debug(f"Got first page reaction - changing to page 1/{len(paginator.pages)}")
+                log.debug(f"Got first page reaction - changing to page 1/{len(pages)}")
 
                 embed.description = ""
                 await message.edit(embed=embed)
-                embed.description = paginator.pages[current_page]
+                embed.description = pages[current_page]
                 if footer_text:
-                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
+                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(pages)})")
                 else:
-                    embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
+                    embed.set_footer(text=f"Page {current_page + 1}/{len(pages)}")
                 await message.edit(embed=embed)
 
             if reaction.emoji == LAST_EMOJI:
                 await message.remove_reaction(reaction.emoji, user)
-                current_page = len(paginator.pages) - 1
+                current_page = len(pages) - 1
 
-                log.debug(f"Got last page reaction - changing to page {current_page + 1}/{len(paginator.pages)}")
+                log.debug(f"Got last page reaction - changing to page {current_page + 1}/{len(pages)}")
 
                 embed.description = ""
                 await message.edit(embed=embed)
-                embed.description = paginator.pages[current_page]
+                embed.description = pages[current_page]
                 if footer_text:
-                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
+                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(pages)})")
                 else:
-                    embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
+                    embed.set_footer(text=f"Page {current_page + 1}/{len(pages)}")
                 await message.edit(embed=embed)
 
             if reaction.emoji == LEFT_EMOJI:
@@ -229,37 +293,37 @@ class LinePaginator(Paginator):
                     continue
 
                 current_page -= 1
-                log.debug(f"Got previous page reaction - changing to page {current_page + 1}/{len(paginator.pages)}")
+                log.debug(f"Got previous page reaction - changing to page {current_page + 1}/{len(pages)}")
 
                 embed.description = ""
                 await message.edit(embed=embed)
-                embed.description = paginator.pages[current_page]
+                embed.description = pages[current_page]
 
                 if footer_text:
-                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
+                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(pages)})")
                 else:
-                    embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
+                    embed.set_footer(text=f"Page {current_page + 1}/{len(pages)}")
 
                 await message.edit(embed=embed)
 
             if reaction.emoji == RIGHT_EMOJI:
                 await message.remove_reaction(reaction.emoji, user)
 
-                if current_page >= len(paginator.pages) - 1:
+                if current_page >= len(pages) - 1:
                     log.debug("Got next page reaction, but we're on the last page - ignoring")
                     continue
 
                 current_page += 1
-                log.debug(f"Got next page reaction - changing to page {current_page + 1}/{len(paginator.pages)}")
+                log.debug(f"Got next page reaction - changing to page {current_page + 1}/{len(pages)}")
 
                 embed.description = ""
                 await message.edit(embed=embed)
-                embed.description = paginator.pages[current_page]
+                embed.description = pages[current_page]
 
                 if footer_text:
-                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(paginator.pages)})")
+                    embed.set_footer(text=f"{footer_text} (Page {current_page + 1}/{len(pages)})")
                 else:
-                    embed.set_footer(text=f"Page {current_page + 1}/{len(paginator.pages)}")
+                    embed.set_footer(text=f"Page {current_page + 1}/{len(pages)}")
 
                 await message.edit(embed=embed)
 
@@ -322,8 +386,6 @@ class ImagePaginator(Paginator):
         def check_event(reaction_: Reaction, member: Member) -> bool:
             """Checks each reaction added, if it matches our conditions pass the wait_for."""
             return all((
-                # Reaction is on the same message sent
-                reaction_.message.id == message.id,
                 # The reaction is part of the navigation menu
                 str(reaction_.emoji) in PAGINATION_EMOJI,  # Note: DELETE_EMOJI is a string and not unicode
                 # The reactor is not a bot
@@ -363,7 +425,9 @@ class ImagePaginator(Paginator):
         while True:
             # Start waiting for reactions
             try:
-                reaction, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=check_event)
+                reaction, user = await ctx.bot.sessions.wait_for(
+                    "reaction_add", message.id, timeout=timeout, check=check_event
+                )
             except asyncio.TimeoutError:
                 log.debug("Timed out waiting for a reaction")
                 break  # We're done, no reactions for the last 5 minutes
@@ -0,0 +1,58 @@
+import itertools
+import typing as t
+
+from PIL import Image, ImageChops
+
+__all__ = ("Palette",)
+
+RGB = t.Tuple[int, int, int]
+
+PALETTE_SIZE = 256  # Entries in a "P" mode palette
+
+
+class Palette:
+    """
+    Maps whole images onto a fixed set of colours.
+
+    Mapping is delegated to Pillow's palette conversion, which looks up the nearest palette
+    entry (by squared euclidean distance) for every pixel in C, through a cached 3D inverse
+    colour table. Compared to a per-pixel Python loop, this is a couple of orders of magnitude
+    faster and never needs to touch individual pixels from Python.
+
+    Instances are cheap to keep around, so build one per colour set at import time and reuse it.
+    """
+
+    def __init__(self, colours: t.Sequence[RGB]):
+        if not 0 < len(colours) <= PALETTE_SIZE:
+            raise ValueError(f"A palette must have between 1 and {PALETTE_SIZE} colours, got {len(colours)}")
+
+        self.colours = [tuple(colour) for colour in colours]
+
+        # Unused palette slots are padded with the first colour, so they can never be a closer match
+        padding = itertools.repeat(self.colours[0], PALETTE_SIZE - len(self.colours))
+        flat = [channel for colour in itertools.chain(self.colours, padding) for channel in colour]
+
+        self._image = Image.new("P", (1, 1))
+        self._image.putpalette(flat)
+
+    def index(self, im: Image.Image) -> Image.Image:
+        """
+        Return a "P" mode copy of `im` where each pixel points at its nearest palette colour.
+
+        Indices below `len(self.colours)` correspond to `self.colours`. The palette of the returned
+        image can be rewritten with `putpalette` to recolour it without touching any pixel data.
+        """
+        return im.convert("RGB").quantize(palette=self._image, dither=Image.NONE)
+
+    def nearest(self, im: Image.Image) -> Image.Image:
+        """Return an RGB copy of `im` with every pixel replaced by its nearest palette colour."""
+        return self.index(im).convert("RGB")
+
+    def blend(self, im: Image.Image) -> Image.Image:
+        """
+        Return an RGB copy of `im` with every pixel averaged with its nearest palette colour.
+
+        This tints the image towards the palette, while keeping some of the original detail.
+        """
+        rgb = im.convert("RGB")
+        return ImageChops.add(rgb, self.nearest(rgb), scale=2)
@@ -1,10 +1,24 @@
+import asyncio
+import json
+import logging
+import os
 import sqlite3
+import typing as t
+from collections.abc import MutableMapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from shutil import copyfile
 
 from bot.exts import get_package_names
 
+log = logging.getLogger(__name__)
+
 DIRECTORY = Path("data")  # directory that has a persistent volume mapped to it
+FLUSH_INTERVAL = 30  # Seconds after a mutation until a store is written to disk
+
+# All persistent file writes happen on this thread, in the order they were submitted
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="persist")
+_stores: t.Dict[Path, "PersistentStore"] = {}
 
 
 def make_persistent(file_path: Path) -> Path:
@@ -67,3 +81,179 @@ def sqlite(db_path: Path) -> sqlite3.Connection:
     """Copy sqlite file to the persistent data directory and return an open connection."""
     persistent_path = make_persistent(db_path)
     return sqlite3.connect(persistent_path)
+
+
+class PersistentStore(MutableMapping):
+    """
+    A JSON object in the persistent data directory, kept in memory and written to disk in the background.
+
+    Mutations only change the in-memory dict, and append a line describing them to a journal file on
+    a worker thread. Every `interval` seconds after the first unsaved mutation, and when the bot shuts
+    down, the whole dict is written to a temporary file which then atomically replaces the data file,
+    after which the journal is emptied. On load, the journal is replayed on top of the data file, so
+    mutations made since the last write survive a crash.
+
+    Keys must be strings, and values must be JSON serializable. Values mutated in place, e.g. a list
+    which was appended to, have to be assigned again for the change to be saved.
+
+    Use `get_store` rather than instantiating this directly, so that each file has a single store.
+    """
+
+    def __init__(self, path: Path, *, interval: float = FLUSH_INTERVAL):
+        self.path = path
+        self.journal_path = path.with_name(f"{path.name}.journal")
+        self.interval = interval
+
+        self._data = self._load()
+        self._flush_handle: t.Optional[asyncio.TimerHandle] = None
+
+    def _load(self) -> t.Dict[str, t.Any]:
+        """Read the data file and replay the journal on top of it."""
+        with self.path.open(encoding="utf8") as f:
+            data = json.load(f)
+
+        if not self.journal_path.exists():
+            return data
+
+        replayed = 0
+        with self.journal_path.open(encoding="utf8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    log.warning(f"Ignoring the incomplete end of {self.journal_path}")
+                    break
+
+                if "set" in entry:
+                    data[entry["set"]] = entry["value"]
+                else:
+                    data.pop(entry["del"], None)
+                replayed += 1
+
+        if replayed:
+            log.info(f"Replayed {replayed} unsaved changes to {self.path} from its journal")
+        return data
+
+    def __getitem__(self, key: str) -> t.Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: t.Any) -> None:
+        if not isinstance(key, str):
+            raise TypeError(f"Keys must be strings, not {type(key).__name__}")
+        self._data[key] = value
+        self._journal({"set": key, "value": value})
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        self._journal({"del": key})
+
+    def __iter__(self) -> t.Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _journal(self, entry: t.Dict[str, t.Any]) -> None:
+        """Append `entry` to the journal in the background, and schedule a flush."""
+        _submit(self._append, json.dumps(entry, default=str) + "\n")
+
+        if self._flush_handle is None:
+            loop = asyncio.get_event_loop()
+            self._flush_handle = loop.call_later(self.interval, lambda: asyncio.ensure_future(self.flush()))
+
+    def _append(self, line: str) -> None:
+        """Blocking implementation of appending to the journal."""
+        _append(self.journal_path, line)
+
+    def _write(self, snapshot: str) -> None:
+        """Blocking implementation of `flush`."""
+        _replace(self.path, snapshot)
+        self.journal_path.unlink(missing_ok=True)
+
+    async def flush(self) -> None:
+        """Write the whole dict to the data file, if it changed since it was last written."""
+        if self._flush_handle is None:
+            return
+
+        self._flush_handle.cancel()
+        self._flush_handle = None
+
+        # Serialized now, but written after every journal entry submitted so far, which it includes
+        snapshot = json.dumps(self._data, default=str, indent=2)
+        await asyncio.wrap_future(_submit(self._write, snapshot))
+        log.trace(f"Saved {self.path}")
+
+
+def _replace(path: Path, data: t.Union[str, bytes]) -> None:
+    """Write `data` to a temporary file, then atomically replace the file at `path` with it."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.tmp")
+    with (temporary.open("wb") if isinstance(data, bytes) else temporary.open("w", encoding="utf8")) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temporary, path)
+
+
+def _append(path: Path, text: str) -> None:
+    """Append `text` to the file at `path`, creating it if necessary."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+async def append_text(path: Path, text: str) -> None:
+    """Append `text` to the file at `path`, without blocking the event loop."""
+    await asyncio.wrap_future(_submit(_append, path, text))
+
+
+async def write_json(path: Path, data: t.Any) -> None:
+    """
+    Atomically replace the file at `path` with `data` serialized as JSON, without blocking the event loop.
+
+    `data` is serialized before this first yields to the event loop, so it may be changed while the file is written.
+    """
+    await asyncio.wrap_future(_submit(_replace, path, json.dumps(data, default=str)))
+
+
+async def write_text(path: Path, text: str) -> None:
+    """Atomically replace the file at `path` with `text`, encoded as UTF-8, without blocking the event loop."""
+    await asyncio.wrap_future(_submit(_replace, path, text))
+
+
+async def write_bytes(path: Path, data: bytes) -> None:
+    """Atomically replace the file at `path` with `data`, without blocking the event loop."""
+    await asyncio.wrap_future(_submit(_replace, path, data))
+
+
+def _submit(func: t.Callable, *args) -> Future:
+    """Run `func` on the worker thread shared by all stores, logging any error it raises."""
+    def log_error(done: Future) -> None:
+        if done.exception() is not None:
+            log.error(f"Failed to save persistent data in {func.__qualname__}", exc_info=done.exception())
+
+    future = _executor.submit(func, *args)
+    future.add_done_callback(log_error)
+    return future
+
+
+def get_store(file_path: Path, *, interval: float = FLUSH_INTERVAL) -> PersistentStore:
+    """
+    Return the `PersistentStore` of the persistent copy of the JSON datafile at `file_path`.
+
+    The datafile is made persistent with `make_persistent` first. The `interval` of the first call
+    for a given file is used.
+    """
+    path = make_persistent(file_path)
+    if path not in _stores:
+        _stores[path] = PersistentStore(path, interval=interval)
+    return _stores[path]
+
+
+async def flush_all() -> None:
+    """Write every store with unsaved changes to disk."""
+    for store in _stores.values():
+        await store.flush()
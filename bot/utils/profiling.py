@@ -0,0 +1,229 @@
+import contextlib
+import importlib.abc
+import json
+import logging
+import sys
+import time
+import tracemalloc
+import typing as t
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+from discord.ext import commands
+
+from bot import exts
+from bot.utils import persist
+
+__all__ = ("StartupProfiler",)
+
+log = logging.getLogger(__name__)
+
+REPORT_FILE = Path(persist.DIRECTORY, "startup_profiles.jsonl")  # One JSON report per line, newest last
+SUMMARY_SIZE = 5  # Slowest extensions listed in the devlog summary
+
+
+@dataclass
+class Phase:
+    """Time and memory spent in a single step of startup."""
+
+    name: str
+    seconds: float
+    memory: int  # Bytes allocated during the phase and still alive at its end
+
+
+@dataclass
+class ExtensionLoad(Phase):
+    """Time spent importing an extension's modules, and time spent in its `setup` function."""
+
+    import_seconds: float = 0.0
+
+    @property
+    def setup_seconds(self) -> float:
+        """Time spent in the extension's `setup` function."""
+        return self.seconds - self.import_seconds
+
+
+class _TimedLoader:
+    """Proxy for a module loader which records how long executing the module takes."""
+
+    def __init__(self, loader: importlib.abc.Loader, timings: t.Dict[str, float]):
+        self._loader = loader
+        self._timings = timings
+
+    def __getattr__(self, name: str) -> t.Any:
+        return getattr(self._loader, name)
+
+    def create_module(self, spec: t.Any) -> t.Any:
+        """Delegate module creation to the wrapped loader."""
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: t.Any) -> None:
+        """Execute the module and record the time taken, including the time spent importing its imports."""
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timings[module.__name__] = time.perf_counter() - start
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder which wraps the loaders of modules in bot.exts to time their execution.
+
+    Discovering the active extensions imports package extensions, such as snakes, before they are loaded.
+    The timer is therefore installed for the whole startup, and timings are kept until claimed by an extension.
+    """
+
+    def __init__(self):
+        self.timings: t.Dict[str, float] = {}
+
+    def find_spec(self, fullname: str, path: t.Any, target: t.Any = None) -> t.Any:
+        """Find the spec using the remaining finders, and wrap its loader."""
+        if not fullname.startswith(f"{exts.__name__}."):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None:
+                    spec.loader = _TimedLoader(spec.loader, self.timings)
+                return spec
+
+        return None
+
+
+class StartupProfiler:
+    """
+    Record where cold start time and memory go.
+
+    When disabled, the profiler only runs the wrapped code. When enabled, memory is traced with
+    `tracemalloc`, which slows down startup somewhat; compare reports with each other rather than
+    with unprofiled startups.
+
+    The report includes:
+        - CPU time spent before the profiler was created, i.e. importing the bot's core modules
+        - every `measure`d phase, such as initialising Sentry
+        - the import and `setup` time and memory of every extension. Modules imported while discovering
+          extensions count towards both the discovery phase and the extension's import and total time
+        - the time until the guild became available
+
+    Reports are appended to `REPORT_FILE`, and a summary is posted to the devlog channel.
+    """
+
+    def __init__(self, enabled: bool):
+        self.enabled = enabled
+        self.phases: t.List[Phase] = []
+        self.extensions: t.List[ExtensionLoad] = []
+
+        self._started = time.perf_counter()
+        self._timer = _ImportTimer()
+        if enabled:
+            tracemalloc.start()
+            sys.meta_path.insert(0, self._timer)
+            self.phases.append(Phase("core imports (CPU time)", time.process_time(), 0))
+
+    @contextlib.contextmanager
+    def _measure(self) -> t.Iterator[t.Dict[str, float]]:
+        """Measure the wrapped block, storing the elapsed time and memory delta in the yielded dict."""
+        result = {}
+        memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield result
+        finally:
+            result["seconds"] = time.perf_counter() - start
+            result["memory"] = tracemalloc.get_traced_memory()[0] - memory
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> t.Iterator[None]:
+        """Record the time and memory taken by the wrapped block as the phase `name`."""
+        if not self.enabled:
+            yield
+            return
+
+        with self._measure() as result:
+            yield
+        self.phases.append(Phase(name, **result))
+
+    def load_extension(self, bot: commands.Bot, name: str) -> None:
+        """Load the extension `name` into `bot`, recording its import and setup times."""
+        if not self.enabled:
+            bot.load_extension(name)
+            return
+
+        # Modules of the extension, and parent packages, may already have been imported by extension discovery
+        imported_before = self._claim_imports(name)
+
+        with self._measure() as result:
+            bot.load_extension(name)
+
+        # Earlier imports are added to the extension's total, so that its import time never exceeds its total
+        imported_within = self._claim_imports(name)
+        result["seconds"] += imported_before
+        self.extensions.append(ExtensionLoad(name, **result, import_seconds=imported_before + imported_within))
+
+    def _claim_imports(self, name: str) -> float:
+        """
+        Return the time spent importing the modules of the extension `name` and its parent packages so far.
+
+        Each module's timing is claimed once, by the first extension that needs it.
+        """
+        imported = [module for module in self._timer.timings if module == name or name.startswith(f"{module}.")]
+        return sum(self._timer.timings.pop(module) for module in imported)
+
+    async def _write_report(self, total: float) -> None:
+        """Append the report to the report file, without blocking the event loop."""
+        report = {
+            "time": datetime.utcnow().isoformat(),
+            "total_seconds": total,
+            "phases": [asdict(phase) for phase in self.phases],
+            "extensions": [
+                {**asdict(ext), "setup_seconds": ext.setup_seconds} for ext in self.extensions
+            ],
+        }
+
+        await persist.append_text(REPORT_FILE, json.dumps(report) + "\n")
+
+    def summary(self, total: float) -> str:
+        """Return a short human-readable summary of the profile."""
+        lines = [f"Guild available after **{total:.2f}s**"]
+        lines.extend(f"{phase.name}: {phase.seconds:.2f}s, {phase.memory / 2**20:+.1f} MiB" for phase in self.phases)
+
+        if self.extensions:
+            import_total = sum(ext.import_seconds for ext in self.extensions)
+            setup_total = sum(ext.setup_seconds for ext in self.extensions)
+            lines.append(
+                f"{len(self.extensions)} extensions: {import_total:.2f}s importing, {setup_total:.2f}s in setup"
+            )
+
+            lines.append("\n**Slowest extensions**")
+            slowest = sorted(self.extensions, key=lambda ext: ext.seconds, reverse=True)[:SUMMARY_SIZE]
+            lines.extend(
+                f"`{ext.name[len(exts.__name__) + 1:]}`: {ext.import_seconds:.2f}s import, "
+                f"{ext.setup_seconds:.2f}s setup, {ext.memory / 2**20:+.1f} MiB"
+                for ext in slowest
+            )
+
+        return "\n".join(lines)
+
+    async def report(self, bot: commands.Bot) -> None:
+        """Once the guild is available, write the report and post its summary to the devlog channel."""
+        if not self.enabled:
+            return
+
+        # Every extension is loaded by the time the loop runs
+        sys.meta_path.remove(self._timer)
+
+        await bot.wait_until_guild_available()
+
+        total = time.perf_counter() - self._started
+        tracemalloc.stop()
+
+        await self._write_report(total)
+        log.info(f"Startup profile written to {REPORT_FILE}")
+
+        await bot.send_log("Startup profile", self.summary(total))
@@ -0,0 +1,248 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+import typing as t
+from email.utils import parsedate_to_datetime
+from types import SimpleNamespace
+
+from aiohttp import ClientSession, TraceConfig
+from multidict import CIMultiDictProxy
+
+from bot.constants import DEFAULT_RATE_LIMIT, RATE_LIMITS, RateLimit
+from bot.utils.exceptions import RateLimitedError
+from bot.utils.metrics import current_invocation
+
+__all__ = ("BACKGROUND", "Governor", "INTERACTIVE", "TokenBucket")
+
+log = logging.getLogger(__name__)
+
+MAX_QUEUED = 20  # Requests allowed to wait for a single host before new ones are shed
+MAX_INTERACTIVE_WAIT = 30  # Seconds a command may have to wait for a host before its request is shed
+
+# Priorities of waiting requests, lowest first
+INTERACTIVE = 0  # Made while a command is being invoked
+BACKGROUND = 1  # Made by anything else, e.g. scheduled jobs refreshing caches
+
+
+def _parse_retry_after(value: t.Optional[str]) -> t.Optional[float]:
+    """Give the seconds to wait according to a `Retry-After` header, which is either seconds or an HTTP date."""
+    if value is None:
+        return None
+
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        log.warning(f"Ignoring invalid Retry-After header {value!r}")
+        return None
+
+
+def _parse_reset(value: t.Optional[str]) -> t.Optional[float]:
+    """
+    Give the seconds to wait according to an `X-RateLimit-Reset` header.
+
+    Some APIs, like GitHub's, give the Unix time at which the limit resets, others, like Reddit's,
+    the seconds until it does. Values which can only be timestamps are taken as such.
+    """
+    if value is None:
+        return None
+
+    try:
+        reset = float(value)
+    except ValueError:
+        log.warning(f"Ignoring invalid X-RateLimit-Reset header {value!r}")
+        return None
+
+    return reset - time.time() if reset > 10**9 else reset
+
+
+class TokenBucket:
+    """
+    Paces the requests sent to a single host.
+
+    The bucket holds up to `limit.requests` tokens, and is refilled by that many tokens every
+    `limit.per` seconds. Sending a request takes a token; when there are none left, requests wait
+    in a queue and are let through as tokens come back, in order of priority, then of arrival.
+
+    Hosts can also pause the bucket outright, until the time given by a `Retry-After` header, or
+    until their `X-RateLimit-Reset` once `X-RateLimit-Remaining` runs out.
+    """
+
+    def __init__(self, host: str, limit: RateLimit):
+        self.host = host
+        self.limit = limit
+
+        self.tokens = float(limit.requests)
+        self.blocked_until = 0.0  # Monotonic time before which no request is sent
+        self.sent = 0
+        self.shed = 0
+
+        self._updated = time.monotonic()
+        self._waiters: t.List[t.Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()  # Keeps waiters of the same priority in order of arrival
+        self._wakeup: t.Optional[asyncio.TimerHandle] = None
+
+    @property
+    def queued(self) -> int:
+        """The number of requests waiting for a token."""
+        return sum(not future.done() for _, _, future in self._waiters)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens which came back since the last refill."""
+        refilled = (now - self._updated) * self.limit.requests / self.limit.per
+        self.tokens = min(self.limit.requests, self.tokens + refilled)
+        self._updated = now
+
+    def delay(self) -> float:
+        """Give the seconds until a token is available, ignoring the requests already waiting for one."""
+        now = time.monotonic()
+        self._refill(now)
+
+        wait = max(self.blocked_until - now, 0)
+        if self.tokens < 1:
+            wait = max(wait, (1 - self.tokens) * self.limit.per / self.limit.requests)
+        return wait
+
+    async def acquire(self, priority: int) -> None:
+        """
+        Take a token, waiting for one if necessary.
+
+        Raise `RateLimitedError` rather than waiting if `MAX_QUEUED` requests are already waiting,
+        or if an `INTERACTIVE` request would have to wait for longer than `MAX_INTERACTIVE_WAIT`.
+        """
+        delay = self.delay()
+        if not delay and not self.queued:
+            self.tokens -= 1
+            self.sent += 1
+            return
+
+        if self.queued >= MAX_QUEUED:
+            self.shed += 1
+            raise RateLimitedError(
+                f"I'm sending too many requests to {self.host} right now, please try again in a bit!"
+            )
+
+        if priority == INTERACTIVE and delay > MAX_INTERACTIVE_WAIT:
+            self.shed += 1
+            raise RateLimitedError(f"{self.host} asked me to slow down, please try again in {delay:.0f} seconds!")
+
+        future = asyncio.get_event_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._schedule(delay)
+
+        # Waiters which are cancelled are left in the queue, and skipped when they come up
+        await future
+
+    def _schedule(self, delay: float) -> None:
+        """Let waiting requests through in `delay` seconds, unless that is already scheduled."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.get_event_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """Hand the available tokens out to the waiting requests, and schedule the next release if some remain."""
+        self._wakeup = None
+
+        while self._waiters:
+            future = self._waiters[0][2]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+
+            delay = self.delay()
+            if delay:
+                self._schedule(delay)
+                return
+
+            heapq.heappop(self._waiters)
+            self.tokens -= 1
+            self.sent += 1
+            future.set_result(None)
+
+    def _block(self, seconds: float, reason: str) -> None:
+        """Send no request for `seconds`."""
+        blocked_until = time.monotonic() + seconds
+        if blocked_until > self.blocked_until:
+            self.blocked_until = blocked_until
+            log.info(f"Pausing requests to {self.host} for {seconds:.1f}s, as {reason}")
+
+    def update(self, status: int, headers: CIMultiDictProxy) -> None:
+        """Honour the rate limit headers of a response from the host."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                remaining = float(remaining)
+            except ValueError:
+                log.warning(f"Ignoring invalid X-RateLimit-Remaining header {remaining!r} from {self.host}")
+            else:
+                self._refill(time.monotonic())
+                self.tokens = min(self.tokens, remaining)
+
+                if remaining < 1 and (reset := _parse_reset(headers.get("X-RateLimit-Reset"))) is not None:
+                    self._block(reset, "its rate limit ran out")
+
+        retry_after = _parse_retry_after(headers.get("Retry-After"))
+        if retry_after is not None and status in (429, 503):
+            self._block(retry_after, f"it responded with {status}")
+        elif status == 429:
+            self._block(self.limit.per / self.limit.requests, "it responded with 429")
+
+    def stats(self) -> t.Dict[str, float]:
+        """Return a snapshot of the bucket's level and counters."""
+        return {
+            "tokens": min(self.limit.requests, self.tokens),
+            "capacity": self.limit.requests,
+            "queued": self.queued,
+            "blocked": max(self.blocked_until - time.monotonic(), 0),
+            "sent": self.sent,
+            "shed": self.shed,
+        }
+
+
+class Governor:
+    """
+    Keeps outbound requests within the rate limits of the hosts they are sent to.
+
+    Each host has a `TokenBucket`, paced according to `RATE_LIMITS` in `bot.constants`, or to
+    `DEFAULT_RATE_LIMIT` if it isn't listed. Requests made while a command is being invoked are
+    `INTERACTIVE`, and go ahead of the `BACKGROUND` ones when a host's requests have to wait.
+
+    The governor hooks into every request made on a session through its `trace_config`, so that
+    it covers both `HTTPService` and the raw session.
+    """
+
+    def __init__(self, limits: t.Mapping[str, RateLimit] = RATE_LIMITS, default: RateLimit = DEFAULT_RATE_LIMIT):
+        self.limits = limits
+        self.default = default
+        self.buckets: t.Dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        """Give the bucket of `host`, creating it if necessary."""
+        if (bucket := self.buckets.get(host)) is None:
+            bucket = self.buckets[host] = TokenBucket(host, self.limits.get(host, self.default))
+        return bucket
+
+    async def _on_request_start(self, session: ClientSession, trace: SimpleNamespace, params: t.Any) -> None:
+        """Wait for the request's turn to be sent."""
+        priority = BACKGROUND if current_invocation.get() is None else INTERACTIVE
+        await self.bucket(params.url.host or "").acquire(priority)
+
+    async def _on_request_end(self, session: ClientSession, trace: SimpleNamespace, params: t.Any) -> None:
+        """Honour the rate limit headers of the response."""
+        self.bucket(params.url.host or "").update(params.response.status, params.response.headers)
+
+    def trace_config(self) -> TraceConfig:
+        """Return a trace config which governs the requests made on a session."""
+        config = TraceConfig()
+        config.on_request_start.append(self._on_request_start)
+        config.on_request_end.append(self._on_request_end)
+        return config
+
+    def stats(self) -> t.Dict[str, t.Dict[str, float]]:
+        """Return a snapshot of every bucket, by host."""
+        return {host: bucket.stats() for host, bucket in sorted(self.buckets.items())}
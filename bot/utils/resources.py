@@ -0,0 +1,168 @@
+import json
+import logging
+import random
+import time
+import typing as t
+from pathlib import Path
+
+import yaml
+
+__all__ = ("Resource", "resource")
+
+log = logging.getLogger(__name__)
+
+RELOAD_INTERVAL = 5  # Seconds between checks whether a loaded file has changed on disk
+
+# A shape is a type, `[item_shape]` for a list of items, `{key_type: value_shape}` for a mapping,
+# or `{"key": value_shape, ...}` for a mapping that must contain at least the given keys
+Shape = t.Union[type, t.List[t.Any], t.Dict[t.Any, t.Any]]
+
+_registry: t.Dict[Path, "Resource"] = {}
+
+
+def check_shape(data: t.Any, shape: Shape, location: str = "root") -> None:
+    """Raise a `ValueError` if `data` does not match `shape`."""
+    if isinstance(shape, type):
+        if not isinstance(data, shape):
+            raise ValueError(f"Expected {shape.__name__} at {location}, got {type(data).__name__}")
+
+    elif isinstance(shape, list):
+        check_shape(data, list, location)
+        for i, item in enumerate(data):
+            check_shape(item, shape[0], f"{location}[{i}]")
+
+    elif isinstance(shape, dict):
+        check_shape(data, dict, location)
+        key_shape, value_shape = next(iter(shape.items()))
+
+        if isinstance(key_shape, type):
+            for key, value in data.items():
+                check_shape(key, key_shape, f"{location} key {key!r}")
+                check_shape(value, value_shape, f"{location}[{key!r}]")
+        else:
+            for key, value_shape in shape.items():
+                if key not in data:
+                    raise ValueError(f"Missing key {key!r} at {location}")
+                check_shape(data[key], value_shape, f"{location}[{key!r}]")
+
+
+def flatten(data: t.Any) -> t.List[t.Any]:
+    """Collect the items of `data`, recursing into the values of mappings."""
+    if isinstance(data, dict):
+        return [item for value in data.values() for item in flatten(value)]
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+class Resource:
+    """
+    A JSON or YAML file from `bot/resources`, loaded on first access.
+
+    The file is parsed and checked against `shape` once, then optionally passed through `transform`,
+    and the result is memoized as `data`. On access, the file's modification time is checked at most
+    every `RELOAD_INTERVAL` seconds; if it changed, the file is loaded again. If the new version
+    cannot be loaded, the previous data is kept.
+
+    Use `resource` rather than instantiating this directly, so each file is only loaded once.
+    """
+
+    def __init__(self, path: Path, *, shape: t.Optional[Shape] = None, transform: t.Optional[t.Callable] = None):
+        self.path = path
+        self.shape = shape
+        self.transform = transform
+
+        self._data = None
+        self._loaded = False
+        self._mtime = 0.0
+        self._checked_at = 0.0
+        self._choices: t.Dict[t.Tuple, t.List[t.Any]] = {}
+
+    def _parse(self) -> t.Any:
+        """Read, validate and transform the file."""
+        with self.path.open(encoding="utf8") as f:
+            if self.path.suffix in (".yaml", ".yml"):
+                data = yaml.load(f, Loader=yaml.FullLoader)
+            else:
+                data = json.load(f)
+
+        if self.shape is not None:
+            try:
+                check_shape(data, self.shape)
+            except ValueError as e:
+                raise ValueError(f"{self.path}: {e}") from None
+
+        if self.transform is not None:
+            data = self.transform(data)
+
+        return data
+
+    def reload(self) -> bool:
+        """Load the file again if it changed since it was last loaded, returning True if it did."""
+        self._checked_at = time.monotonic()
+        mtime = self.path.stat().st_mtime
+
+        if self._loaded and mtime == self._mtime:
+            return False
+
+        start = time.perf_counter()
+        try:
+            data = self._parse()
+        except Exception:
+            if not self._loaded:
+                raise
+            log.exception(f"Failed to reload {self.path}, keeping the previously loaded data")
+            self._mtime = mtime  # Don't retry until the file changes again
+            return False
+
+        if self._loaded:
+            log.info(f"Reloaded {self.path}")
+        else:
+            log.trace(f"Loaded {self.path} in {(time.perf_counter() - start) * 1000:.1f}ms")
+
+        self._data = data
+        self._loaded = True
+        self._mtime = mtime
+        self._choices.clear()
+        return True
+
+    @property
+    def data(self) -> t.Any:
+        """The loaded contents of the file."""
+        if not self._loaded or time.monotonic() - self._checked_at > RELOAD_INTERVAL:
+            self.reload()
+        return self._data
+
+    def choice(self, *keys: t.Hashable) -> t.Any:
+        """
+        Return a random item from `data[key0][key1]...`.
+
+        If the selected value is a mapping, the items of all its values are chosen from. The
+        flattened list is built once per loaded version of the file.
+        """
+        data = self.data
+
+        if (choices := self._choices.get(keys)) is None:
+            for key in keys:
+                data = data[key]
+            choices = self._choices[keys] = flatten(data)
+
+        return random.choice(choices)
+
+
+def resource(
+    path: t.Union[str, Path],
+    *,
+    shape: t.Optional[Shape] = None,
+    transform: t.Optional[t.Callable] = None
+) -> Resource:
+    """
+    Return the `Resource` for the JSON or YAML file at `path`.
+
+    Nothing is read until the resource's data is first accessed. The `shape` and `transform`
+    of the first call for a given path are used.
+    """
+    path = Path(path)
+    if path not in _registry:
+        _registry[path] = Resource(path, shape=shape, transform=transform)
+    return _registry[path]
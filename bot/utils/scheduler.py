@@ -0,0 +1,377 @@
+import abc
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import random
+import time
+import typing as t
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from discord.ext import commands
+
+from bot.constants import Client, Month
+from bot.seasons import clock
+from bot.utils.persist import get_store
+
+__all__ = ("Cron", "Every", "Job", "Schedule", "Scheduler", "scheduled")
+
+log = logging.getLogger(__name__)
+
+# Where the next and last run of every job are kept across restarts
+STATE_FILE = Path("bot", "resources", "evergreen", "scheduler.json")
+
+# Longest the scheduler sleeps at once. Sleeps are measured on the loop's monotonic clock, so
+# waking up now and then keeps jobs on time if the wall clock is adjusted during a long sleep.
+MAX_SLEEP = 60 * 60
+
+Callback = t.Callable[[], t.Awaitable[None]]
+
+
+def _start_of_next_month(moment: datetime) -> datetime:
+    """Return midnight on the first day of the month after the one of `moment`."""
+    if moment.month == 12:
+        return datetime(moment.year + 1, 1, 1)
+    return datetime(moment.year, moment.month + 1, 1)
+
+
+class Schedule(abc.ABC):
+    """
+    When a job runs, as UTC times.
+
+    A schedule can be limited to `months`, in which case it doesn't run at all in the other
+    months, and the job sleeps until its next month starts.
+
+    If `Client.month_override` is set, run times ignore the months, and the job only runs if the
+    overridden month, as given by the season clock, is one of them.
+    """
+
+    def __init__(self, *, months: t.Iterable[Month] = ()):
+        self.months = frozenset(months)
+
+    @abc.abstractmethod
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first time the job runs strictly after `moment`."""
+
+    @property
+    def windowed(self) -> bool:
+        """Whether run times are limited to the schedule's months, which they aren't while the month is overridden."""
+        return bool(self.months) and Client.month_override is None
+
+    def is_active(self) -> bool:
+        """Whether the job may run in the current month of the season clock."""
+        return not self.months or clock.month in self.months
+
+    def _in_window(self, moment: datetime) -> datetime:
+        """Return `moment` if it is in one of the schedule's months, or the start of its next month otherwise."""
+        for _ in range(12):
+            if not self.windowed or moment.month in self.months:
+                return moment
+            moment = _start_of_next_month(moment)
+        raise ValueError("A schedule's months can't be empty")
+
+
+class Every(Schedule):
+    """Run a job at a fixed interval."""
+
+    def __init__(self, *, days: float = 0, hours: float = 0, minutes: float = 0, months: t.Iterable[Month] = ()):
+        super().__init__(months=months)
+        self.interval = timedelta(days=days, hours=hours, minutes=minutes)
+        if self.interval <= timedelta(0):
+            raise ValueError("The interval of a schedule must be positive")
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return `moment` plus the interval, or the start of the next month the job runs in."""
+        return self._in_window(moment + self.interval)
+
+    def __str__(self) -> str:
+        return f"every {self.interval}"
+
+
+class Cron(Schedule):
+    """
+    Run a job at the times matching a cron expression, of the minute, hour, day of month, month and day of week.
+
+    Fields are `*`, a number, or a range such as `1-25`, optionally followed by a step such as
+    `*/5`, or several of these separated by commas. Days of week go from 0 (Sunday) to 6, and like
+    cron, a time matches either day field if both are given.
+    """
+
+    FIELDS = (("minute", 0, 59), ("hour", 0, 23), ("day", 1, 31), ("month", 1, 12), ("weekday", 0, 7))
+
+    def __init__(self, expression: str, *, months: t.Iterable[Month] = ()):
+        super().__init__(months=months)
+        self.expression = expression
+
+        parts = expression.split()
+        if len(parts) != len(self.FIELDS):
+            raise ValueError(f"Cron expression {expression!r} doesn't have {len(self.FIELDS)} fields")
+
+        self.minutes, self.hours, self.days, cron_months, weekdays = (
+            self._parse(part, low, high) for part, (_, low, high) in zip(parts, self.FIELDS)
+        )
+        self.weekdays = {day % 7 for day in weekdays}  # 7 is Sunday as well
+        self.any_day, self.any_weekday = parts[2] == "*", parts[4] == "*"
+
+        # A job limited to months runs in the months both allow
+        self.months = frozenset(cron_months & self.months if self.months else cron_months)
+        if not self.months:
+            raise ValueError(f"Cron expression {expression!r} never matches in the given months")
+
+    @staticmethod
+    def _parse(part: str, low: int, high: int) -> t.Set[int]:
+        """Return the values a single field of a cron expression matches."""
+        values = set()
+        for item in part.split(","):
+            span, _, step = item.partition("/")
+            if span == "*":
+                start, stop = low, high
+            elif "-" in span:
+                start, stop = map(int, span.split("-"))
+            else:
+                start = int(span)
+                stop = high if step else start
+
+            if not low <= start <= stop <= high:
+                raise ValueError(f"Cron field {part!r} isn't within {low}-{high}")
+            values.update(range(start, stop + 1, int(step or 1)))
+        return values
+
+    def _day_matches(self, moment: datetime) -> bool:
+        """Check the day fields against the day of `moment`."""
+        day = moment.day in self.days
+        weekday = (moment.weekday() + 1) % 7 in self.weekdays
+
+        if self.any_day or self.any_weekday:
+            return day and weekday
+        return day or weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first minute after `moment` matching the expression."""
+        moment = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = moment.year + 5
+
+        # Skip a whole month, day or hour at a time whenever it can't match
+        while moment.year <= limit:
+            if self.windowed and moment.month not in self.months:
+                moment = _start_of_next_month(moment)
+            elif not self._day_matches(moment):
+                moment = moment.replace(hour=0, minute=0) + timedelta(days=1)
+            elif moment.hour not in self.hours:
+                moment = moment.replace(minute=0) + timedelta(hours=1)
+            elif moment.minute not in self.minutes:
+                moment += timedelta(minutes=1)
+            else:
+                return moment
+
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+    def __str__(self) -> str:
+        return f"cron {self.expression}"
+
+
+@dataclass
+class Job:
+    """A callback run on a schedule, and the state of its runs."""
+
+    name: str
+    callback: Callback
+    schedule: Schedule
+    jitter: float = 0.0
+    catch_up: bool = False
+
+    next_run: t.Optional[datetime] = None
+    last_run: t.Optional[datetime] = None
+    last_duration: t.Optional[float] = None
+    runs: int = 0
+    failures: int = 0
+    task: t.Optional[asyncio.Task] = field(default=None, repr=False)
+    entry: int = field(default=-1, repr=False)  # Tells the job's current heap entry from outdated ones
+
+    @property
+    def running(self) -> bool:
+        """Whether the job is currently running."""
+        return self.task is not None and not self.task.done()
+
+
+def scheduled(
+    schedule: Schedule, *, jitter: float = 0.0, catch_up: bool = False, run_now: bool = False
+) -> t.Callable[[Callback], Callback]:
+    """
+    Run the decorated cog method on `schedule` through the bot's `Scheduler`, for as long as the cog is loaded.
+
+    See `Scheduler.schedule` for the arguments. The job is named after the method's qualified name.
+    """
+    def decorator(callback: Callback) -> Callback:
+        callback.__scheduled__ = {"schedule": schedule, "jitter": jitter, "catch_up": catch_up, "run_now": run_now}
+        return callback
+    return decorator
+
+
+class Scheduler:
+    """
+    Run jobs on schedules, from a single task.
+
+    Jobs are kept in a heap ordered by their next run time, and the scheduler sleeps until the
+    first one is due, however far away it is, rather than polling. Run times are computed from the
+    previous scheduled time rather than from when the previous run finished, so they don't drift;
+    a job still running when it is due again skips that run.
+
+    The next and last run of every job are persisted, so schedules survive restarts. A job which
+    was due while the bot was down runs once as soon as it is scheduled again if it `catch_up`s,
+    and waits for its next run time otherwise.
+    """
+
+    def __init__(self):
+        self.jobs: t.Dict[str, Job] = {}
+        self._state = get_store(STATE_FILE)
+        self._heap: t.List[t.Tuple[datetime, int, str]] = []
+        self._counter = itertools.count()  # Numbers heap entries, which also breaks ties between them
+        self._wakeup = asyncio.Event()
+        self._task: t.Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start running due jobs, from the next iteration of the loop."""
+        self._task = asyncio.ensure_future(self._run_forever())
+
+    def stop(self) -> None:
+        """Stop running jobs, and cancel the running ones."""
+        if self._task is not None:
+            self._task.cancel()
+        for job in self.jobs.values():
+            if job.running:
+                job.task.cancel()
+
+    def schedule(
+        self,
+        name: str,
+        callback: Callback,
+        schedule: Schedule,
+        *,
+        jitter: float = 0.0,
+        catch_up: bool = False,
+        run_now: bool = False,
+    ) -> Job:
+        """
+        Run `callback` on `schedule` as the job called `name`, replacing any job of the same name.
+
+        Each run is delayed by a random number of seconds up to `jitter`, which doesn't move the
+        following run times. A job which was due while the bot was down runs right away if it
+        `catch_up`s. A job always runs right away if `run_now` is True, for jobs which fill caches.
+        """
+        if name in self.jobs:
+            self.cancel(name)
+
+        job = Job(name, callback, schedule, jitter, catch_up)
+        state = self._state.get(name, {})
+        if state.get("last_run"):
+            job.last_run = datetime.fromisoformat(state["last_run"])
+            job.last_duration = state["last_duration"]
+
+        now = datetime.utcnow()
+        if run_now:
+            job.next_run = now
+        elif state.get("next_run"):
+            job.next_run = datetime.fromisoformat(state["next_run"])
+            if job.next_run <= now and not catch_up:
+                job.next_run = schedule.next_after(now)
+        else:
+            job.next_run = schedule.next_after(now)
+
+        self.jobs[name] = job
+        self._push(job)
+        log.debug(f"Scheduled job {name} ({schedule}), next run at {job.next_run}")
+        return job
+
+    def cancel(self, name: str) -> None:
+        """Remove the job called `name`, and cancel it if it is running. Does nothing if there is no such job."""
+        job = self.jobs.pop(name, None)
+        if job is not None and job.running:
+            job.task.cancel()
+
+    def add_cog(self, cog: commands.Cog) -> None:
+        """Schedule the methods of `cog` decorated with `scheduled`."""
+        # Look the methods up on the class, so that properties of the cog aren't evaluated
+        for name, function in inspect.getmembers(type(cog), inspect.isfunction):
+            options = getattr(function, "__scheduled__", None)
+            if options is not None:
+                self.schedule(function.__qualname__, getattr(cog, name), **options)
+
+    def remove_cog(self, cog: commands.Cog) -> None:
+        """Cancel the jobs of `cog`."""
+        for job in list(self.jobs.values()):
+            if getattr(job.callback, "__self__", None) is cog:
+                self.cancel(job.name)
+
+    def upcoming(self) -> t.List[Job]:
+        """Return all jobs, soonest first."""
+        return sorted(self.jobs.values(), key=lambda job: job.next_run)
+
+    def _push(self, job: Job) -> None:
+        """Add the next run of `job` to the heap, and wake the scheduler up if it is sooner than the others."""
+        wake_at = job.next_run + timedelta(seconds=random.uniform(0, job.jitter))
+        job.entry = next(self._counter)
+        heapq.heappush(self._heap, (wake_at, job.entry, job.name))
+        self._wakeup.set()
+
+    async def _run_forever(self) -> None:
+        """Sleep until the next job is due, run it, and repeat."""
+        while True:
+            self._wakeup.clear()
+            now = datetime.utcnow()
+
+            while self._heap and self._heap[0][0] <= now:
+                _, entry, name = heapq.heappop(self._heap)
+                job = self.jobs.get(name)
+                # Entries of cancelled or replaced jobs are left in the heap, and skipped here
+                if job is not None and job.entry == entry:
+                    self._start(job, now)
+
+            delay = (self._heap[0][0] - now).total_seconds() if self._heap else MAX_SLEEP
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), min(delay, MAX_SLEEP))
+            except asyncio.TimeoutError:
+                pass
+
+    def _start(self, job: Job, now: datetime) -> None:
+        """Start a run of `job`, and schedule the next one."""
+        if not job.schedule.is_active():
+            log.trace(f"Skipping a run of job {job.name}, as it doesn't run in {clock.month.name}")
+        elif job.running:
+            log.warning(f"Skipping a run of job {job.name}, as it is still running since {job.last_run}")
+        else:
+            job.task = asyncio.ensure_future(self._run(job))
+
+        # Runs missed while the bot was down, or while the loop was blocked, are coalesced into this one
+        job.next_run = job.schedule.next_after(job.next_run)
+        if job.next_run <= now:
+            job.next_run = job.schedule.next_after(now)
+
+        self._save(job)
+        self._push(job)
+
+    async def _run(self, job: Job) -> None:
+        """Run `job` once, timing it and logging its errors."""
+        log.debug(f"Running job {job.name}")
+        job.last_run = datetime.utcnow()
+        start = time.perf_counter()
+        try:
+            await job.callback()
+        except Exception:
+            job.failures += 1
+            log.exception(f"Unhandled exception in job {job.name}")
+        finally:
+            job.last_duration = time.perf_counter() - start
+            job.runs += 1
+            self._save(job)
+
+    def _save(self, job: Job) -> None:
+        """Persist the next and last run of `job`."""
+        self._state[job.name] = {
+            "next_run": job.next_run.isoformat(),
+            "last_run": job.last_run.isoformat() if job.last_run else None,
+            "last_duration": job.last_duration,
+        }
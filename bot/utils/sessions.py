@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import typing as t
+from collections import Counter
+
+__all__ = ("SessionRouter",)
+
+log = logging.getLogger(__name__)
+
+Callback = t.Callable[..., t.Awaitable[None]]
+Check = t.Callable[..., bool]
+
+# How to get the key sessions are routed by out of the arguments of each supported event
+KEYS: t.Dict[str, t.Callable[..., int]] = {
+    "message": lambda message: message.channel.id,
+    "message_delete": lambda message: message.id,
+    "reaction_add": lambda reaction, user: reaction.message.id,
+}
+
+
+class SessionRouter:
+    """
+    Deliver events to the interactive sessions, such as paginators and games, they belong to.
+
+    `bot.wait_for` checks every pending predicate against every event, so its cost grows with the
+    number of open sessions. Here, sessions wait on a key instead: the message ID for reactions and
+    deleted messages, and the channel ID for messages, as listed in `KEYS`. An event is only
+    checked against the sessions waiting on its key, found with a dictionary lookup.
+
+    Sessions can either `wait_for` a single event, like `bot.wait_for`, or `subscribe` a callback
+    to every event on a key until they `unsubscribe` it.
+    """
+
+    def __init__(self):
+        self._waiters: t.Dict[t.Tuple[str, int], t.List[t.Tuple[asyncio.Future, t.Optional[Check]]]] = {}
+        self._subscribers: t.Dict[t.Tuple[str, int], t.List[Callback]] = {}
+
+    async def wait_for(
+        self, event: str, key: int, *, check: t.Optional[Check] = None, timeout: t.Optional[float] = None
+    ) -> t.Any:
+        """
+        Wait for the next `event` on `key` for which `check` returns True, and return its arguments.
+
+        Like `bot.wait_for`, a single argument is returned as is, several as a tuple, and
+        `asyncio.TimeoutError` is raised if no such event happens within `timeout` seconds.
+        """
+        if event not in KEYS:
+            raise ValueError(f"Routing {event!r} to sessions is not supported")
+
+        future = asyncio.get_event_loop().create_future()
+        waiters = self._waiters.setdefault((event, key), [])
+        waiter = (future, check)
+        waiters.append(waiter)
+
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            waiters.remove(waiter)
+            if not waiters:
+                del self._waiters[event, key]
+
+    def subscribe(self, event: str, key: int, callback: Callback) -> None:
+        """Call `callback` with the arguments of every `event` on `key`, until it is unsubscribed."""
+        if event not in KEYS:
+            raise ValueError(f"Routing {event!r} to sessions is not supported")
+
+        self._subscribers.setdefault((event, key), []).append(callback)
+
+    def unsubscribe(self, event: str, key: int, callback: Callback) -> None:
+        """Stop calling `callback` for `event` on `key`. Does nothing if it isn't subscribed."""
+        subscribers = self._subscribers.get((event, key), [])
+        if callback in subscribers:
+            subscribers.remove(callback)
+        if not subscribers:
+            self._subscribers.pop((event, key), None)
+
+    def dispatch(self, event: str, *args) -> None:
+        """Deliver an event to the sessions waiting on its key. Events not in `KEYS` are ignored."""
+        get_key = KEYS.get(event)
+        if get_key is None:
+            return
+
+        key = (event, get_key(*args))
+        result = args[0] if len(args) == 1 else args
+
+        for future, check in self._waiters.get(key, ()):
+            if future.done():
+                continue
+            try:
+                if check is None or check(*args):
+                    future.set_result(result)
+            except Exception as e:
+                future.set_exception(e)
+
+        for callback in self._subscribers.get(key, ()):
+            asyncio.ensure_future(self._run(callback, args))
+
+    @staticmethod
+    async def _run(callback: Callback, args: t.Tuple) -> None:
+        """Call `callback` with `args`, logging its errors."""
+        try:
+            await callback(*args)
+        except Exception:
+            log.exception(f"Unhandled exception in session callback {callback.__qualname__}")
+
+    def stats(self) -> t.Dict[str, int]:
+        """Return the number of live waiters and subscriptions, by event."""
+        counts = Counter()
+        for (event, _), waiters in self._waiters.items():
+            counts[event] += len(waiters)
+        for (event, _), subscribers in self._subscribers.items():
+            counts[event] += len(subscribers)
+        return {event: counts[event] for event in KEYS}
+
+    @property
+    def live(self) -> int:
+        """The number of live waiters and subscriptions."""
+        return sum(self.stats().values())
@@ -0,0 +1,185 @@
+import asyncio
+import bisect
+import logging
+import sys
+import threading
+import time
+import traceback
+import typing as t
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+
+import sentry_sdk
+from discord.ext import commands
+
+from bot.utils.metrics import percentile
+
+__all__ = ("LoopWatchdog", "Stall")
+
+log = logging.getLogger(__name__)
+
+TICK_INTERVAL = 0.1  # Seconds between two measurements of the scheduling lag
+STALL_THRESHOLD = 0.5  # Seconds the loop may be blocked before the blocking code's stack is captured
+RECENT_SAMPLES = 3000  # Lag samples kept for percentiles, i.e. about the last 5 minutes
+RECENT_STALLS = 50  # Stalls kept with their stack
+STACK_DEPTH = 12  # Innermost frames kept of a captured stack
+
+# Upper bounds of the lag histogram buckets, in seconds
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, float("inf"))
+
+BOT_ROOT = str(Path(__file__).parents[1])
+
+
+@dataclass
+class Stall:
+    """A period during which the event loop was blocked."""
+
+    time: float
+    culprit: str
+    stack: t.List[str]
+    duration: float = 0.0
+
+
+@dataclass
+class Offender:
+    """Stall totals of a single culprit."""
+
+    stalls: int = 0
+    total: float = 0.0
+    worst: float = 0.0
+
+
+def find_culprit(frame: t.Optional[FrameType]) -> str:
+    """
+    Name the command or listener running in the stack of `frame`.
+
+    Falls back to the innermost function in the bot's own code, as timed tasks and the like are
+    neither commands nor listeners.
+    """
+    innermost = None
+    while frame is not None:
+        code = frame.f_code
+
+        # The wrapper of command callbacks in discord.ext.commands.core.hooked_wrapped_callback
+        if code.co_name == "wrapped" and isinstance(ctx := frame.f_locals.get("ctx"), commands.Context):
+            return f"command {ctx.command.qualified_name}"
+
+        # discord.Client._run_event, which runs every event listener
+        if code.co_name == "_run_event" and "event_name" in frame.f_locals:
+            return f"listener {frame.f_locals['event_name']}"
+
+        if innermost is None and code.co_filename.startswith(BOT_ROOT):
+            innermost = f"{Path(code.co_filename).relative_to(BOT_ROOT).with_suffix('')}:{code.co_name}"
+
+        frame = frame.f_back
+
+    return innermost or "unknown"
+
+
+class LoopWatchdog:
+    """
+    Measure event loop scheduling lag, and catch the code which blocks the loop.
+
+    A task on the loop sleeps for `TICK_INTERVAL` over and over; how late it wakes up is the lag,
+    which is kept in a cumulative histogram and as recent samples for percentiles.
+
+    A watcher thread checks that the task keeps ticking. Once the loop has been stuck for longer
+    than `threshold`, the thread captures the stack the loop thread is executing, while it is still
+    blocked, and names the command or listener it belongs to. When the loop recovers, the stall is
+    logged, added to Sentry's breadcrumbs, and counted against its culprit.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, *, threshold: float = STALL_THRESHOLD):
+        self.loop = loop
+        self.threshold = threshold
+
+        self.buckets = [0] * len(LAG_BUCKETS)
+        self.lag_sum = 0.0
+        self.samples: t.Deque[float] = deque(maxlen=RECENT_SAMPLES)
+        self.stalls: t.Deque[Stall] = deque(maxlen=RECENT_STALLS)
+        self.offenders: t.Dict[str, Offender] = {}
+
+        self._heartbeat = time.perf_counter()
+        self._captured: t.Optional[Stall] = None
+        self._loop_thread: t.Optional[int] = None
+        self._stopped = threading.Event()
+        self._task: t.Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start measuring, from the next iteration of the loop."""
+        self._task = self.loop.create_task(self._tick())
+        threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+
+    def stop(self) -> None:
+        """Stop measuring."""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _tick(self) -> None:
+        """Measure how late the loop wakes this task up, over and over."""
+        self._loop_thread = threading.get_ident()
+
+        while True:
+            self._heartbeat = time.perf_counter()
+            await asyncio.sleep(TICK_INTERVAL)
+            lag = max(time.perf_counter() - self._heartbeat - TICK_INTERVAL, 0.0)
+
+            self.lag_sum += lag
+            self.buckets[bisect.bisect_left(LAG_BUCKETS, lag)] += 1
+            self.samples.append(lag)
+
+            if self._captured is not None:
+                stall, self._captured = self._captured, None
+                stall.duration = lag
+                self._record(stall)
+
+    def _watch(self) -> None:
+        """In the watcher thread, capture the stack of the loop thread whenever the loop is stuck."""
+        while not self._stopped.wait(TICK_INTERVAL / 2):
+            heartbeat = self._heartbeat
+            if self._loop_thread is None or self._captured is not None:
+                continue
+            if time.perf_counter() - heartbeat - TICK_INTERVAL < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            stack = traceback.format_stack(frame)[-STACK_DEPTH:] if frame is not None else []
+
+            # The loop may have caught up while the stack was being captured
+            if heartbeat == self._heartbeat:
+                self._captured = Stall(time.time(), find_culprit(frame), stack)
+
+    def _record(self, stall: Stall) -> None:
+        """Account for a stall the loop recovered from, and report it."""
+        self.stalls.append(stall)
+
+        offender = self.offenders.setdefault(stall.culprit, Offender())
+        offender.stalls += 1
+        offender.total += stall.duration
+        offender.worst = max(offender.worst, stall.duration)
+
+        # Below WARNING, so that Sentry records the stall as a breadcrumb rather than an event of its own
+        log.info(f"Event loop blocked for {stall.duration:.2f}s by {stall.culprit}:\n{''.join(stall.stack)}")
+        sentry_sdk.add_breadcrumb(
+            category="watchdog",
+            message=f"Event loop blocked for {stall.duration:.2f}s by {stall.culprit}",
+            level="warning",
+            data={"culprit": stall.culprit, "duration": stall.duration},
+        )
+
+    def worst_offenders(self, count: int = 5) -> t.List[t.Tuple[str, Offender]]:
+        """Return the `count` culprits which blocked the loop for the longest in total."""
+        return sorted(self.offenders.items(), key=lambda item: item[1].total, reverse=True)[:count]
+
+    def stats(self) -> t.Dict[str, float]:
+        """Return percentiles of the recent lag samples, and the stall count."""
+        samples = sorted(self.samples)
+        return {
+            "p50": percentile(samples, 0.5),
+            "p99": percentile(samples, 0.99),
+            "max": samples[-1] if samples else 0.0,
+            "stalls": sum(offender.stalls for offender in self.offenders.values()),
+        }